@@ -277,8 +277,8 @@ def main():
     if active_treatments:
         print(f"\n💊 Active Treatments:")
         for treatment in active_treatments:
-            print(f"• {treatment['drug_name']} {treatment['dose']} via {treatment['route']}")
-            if treatment['interactions']:
+            print(f"• {treatment.drug_name} {treatment.dose} via {treatment.route}")
+            if treatment.interactions:
                 print(f"  ⚠️ Drug interactions detected")
     
     # show drug levels
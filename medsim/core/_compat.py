@@ -0,0 +1,42 @@
+"""
+interpreter-version and optional-dependency shims shared by core modules
+"""
+
+import sys
+from datetime import datetime
+
+# dataclass(slots=True) is only available from python 3.10
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# datetime.fromisoformat only accepts a trailing "Z" for utc from python 3.11
+if sys.version_info >= (3, 11):
+    fromisoformat = datetime.fromisoformat
+else:
+    def fromisoformat(text: str) -> datetime:
+        """datetime.fromisoformat that also reads a trailing "Z" as utc"""
+        if text.endswith("Z"):
+            text = text[:-1] + "+00:00"
+        return datetime.fromisoformat(text)
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:  # numba is an optional speedup
+    HAS_NUMBA = False
+    prange = range  # type: ignore[misc]
+    
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        """no-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is an optional speedup for bundled data files
+    from json import loads as json_loads  # type: ignore[assignment]
+
+try:
+    import re2 as linear_re
+except ImportError:  # google-re2 is an optional linear-time engine for long untrusted text
+    linear_re = None
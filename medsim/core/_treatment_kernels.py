@@ -0,0 +1,65 @@
+"""
+numba/numpy kernels for the treatment engine, kept out of treatments.py so it can be compiled with mypyc
+"""
+
+from typing import Tuple
+import math
+
+import numpy as np
+
+from ._compat import HAS_NUMBA, njit, prange
+
+
+_LN2 = math.log(2)
+
+
+def _decay_levels_np(levels: np.ndarray, half_lives: np.ndarray, elapsed_hours: np.ndarray,
+                     lows: np.ndarray, highs: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """first-order decay of drug levels plus therapeutic/toxic flags for the new levels"""
+    new_levels = levels.copy()
+    decaying = half_lives > 0
+    new_levels[decaying] = levels[decaying] * np.exp(-elapsed_hours[decaying] * _LN2 / half_lives[decaying])
+    return new_levels, (lows <= new_levels) & (new_levels <= highs), new_levels > highs
+
+
+# nogil so callers on worker threads can decay levels concurrently
+@njit(parallel=True, fastmath=True, cache=True, nogil=True)
+def _decay_levels_kernel(levels, half_lives, elapsed_hours, lows, highs):
+    count = levels.shape[0]
+    new_levels = np.empty(count, dtype=np.float64)
+    therapeutic = np.empty(count, dtype=np.bool_)
+    toxic = np.empty(count, dtype=np.bool_)
+    for i in prange(count):
+        level = levels[i]
+        if half_lives[i] > 0:
+            level = level * math.exp(-elapsed_hours[i] * _LN2 / half_lives[i])
+        new_levels[i] = level
+        therapeutic[i] = lows[i] <= level and level <= highs[i]
+        toxic[i] = level > highs[i]
+    return new_levels, therapeutic, toxic
+
+
+_decay_levels = _decay_levels_kernel if HAS_NUMBA else _decay_levels_np
+
+
+def _filter_indices_np(category_ids: np.ndarray, route_masks: np.ndarray,
+                       category_id: int, route_bit: int) -> np.ndarray:
+    """indices of drugs in category_id (-1 for any) given by route_bit (0 for any)"""
+    matches = np.ones(category_ids.shape[0], dtype=np.bool_)
+    if category_id >= 0:
+        matches &= category_ids == category_id
+    if route_bit:
+        matches &= (route_masks & route_bit) != 0
+    return np.flatnonzero(matches)
+
+
+@njit(parallel=True, cache=True)
+def _filter_indices_kernel(category_ids, route_masks, category_id, route_bit):
+    matches = np.zeros(category_ids.shape[0], dtype=np.bool_)
+    for i in prange(category_ids.shape[0]):
+        matches[i] = ((category_id < 0 or category_ids[i] == category_id) and
+                      (route_bit == 0 or (route_masks[i] & route_bit) != 0))
+    return np.flatnonzero(matches)
+
+
+_filter_indices = _filter_indices_kernel if HAS_NUMBA else _filter_indices_np
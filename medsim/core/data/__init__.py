@@ -0,0 +1,3 @@
+"""
+static catalogs bundled with the core simulation engine
+"""
@@ -64,8 +64,8 @@ class InterventionInterface:
                     "duration_minutes": definition.duration_minutes,
                     "success_rate": definition.success_rate,
                     "adverse_event_risk": definition.adverse_event_risk,
-                    "contraindications": definition.contraindications,
-                    "parameters": definition.parameters,
+                    "contraindications": list(definition.contraindications),
+                    "parameters": dict(definition.parameters),
                     "description": definition.description
                 }
         
@@ -211,7 +211,7 @@ class InterventionInterface:
             "name": order.name,
             "type": order.type.value,
             "target_organs": [organ.value for organ in order.target_organs],
-            "parameters": order.parameters,
+            "parameters": dict(order.parameters),
             "ordered_time": order.ordered_time.isoformat(),
             "scheduled_time": order.scheduled_time.isoformat() if order.scheduled_time else None,
             "executed_time": order.executed_time.isoformat() if order.executed_time else None,
@@ -3,12 +3,14 @@ comprehensive intervention manager for patient simulation
 handles ordering, scheduling, execution, and tracking of interventions
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
+from types import MappingProxyType
 import random
 import json
+import numpy as np
 
 class InterventionType(Enum):
     """types of medical interventions"""
@@ -57,6 +59,20 @@ class AdverseEventType(Enum):
     MEDICATION_ERROR = "medication_error"
     PROCEDURE_COMPLICATION = "procedure_complication"
 
+# integer status codes mirrored in the manager's columnar due-time index
+_STATUS_CODES = {
+    "pending": 0, "scheduled": 1, "executing": 2,
+    "completed": 3, "cancelled": 4, "failed": 5
+}
+_NEVER_DUE = np.iinfo(np.int64).max
+
+
+def _to_microseconds(timestamp: Optional[datetime]) -> int:
+    """convert a datetime to integer microseconds for the due-time index"""
+    if timestamp is None:
+        return _NEVER_DUE
+    return int(timestamp.timestamp()) * 1_000_000 + timestamp.microsecond
+
 @dataclass
 class InterventionDefinition:
     """definition of an intervention with its properties"""
@@ -66,9 +82,14 @@ class InterventionDefinition:
     duration_minutes: int
     success_rate: float
     adverse_event_risk: float
-    contraindications: List[str] = field(default_factory=list)
-    parameters: Dict[str, Any] = field(default_factory=dict)
+    contraindications: Tuple[str, ...] = ()
+    parameters: Mapping[str, Any] = field(default_factory=dict)
     description: str = ""
+    
+    def __post_init__(self):
+        # definitions are written with literals but never mutated
+        self.contraindications = tuple(self.contraindications)
+        self.parameters = MappingProxyType(dict(self.parameters))
 
 @dataclass
 class InterventionOrder:
@@ -77,7 +98,7 @@ class InterventionOrder:
     type: InterventionType
     name: str
     target_organs: List[OrganSystem]
-    parameters: Dict[str, Any] = field(default_factory=dict)
+    parameters: Mapping[str, Any] = field(default_factory=dict)
     ordered_time: datetime = field(default_factory=datetime.now)
     scheduled_time: Optional[datetime] = None
     executed_time: Optional[datetime] = None
@@ -92,12 +113,28 @@ class InterventionOrder:
 class InterventionManager:
     """comprehensive intervention manager with extensive intervention library"""
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         self.orders: List[InterventionOrder] = []
         self.next_order_id = 1
         self.intervention_definitions = self._initialize_intervention_definitions()
+        # definitions never change, so name listings are computed once
+        self._available_names: Tuple[str, ...] = tuple(self.intervention_definitions)
+        self._names_by_organ: Dict[OrganSystem, Tuple[str, ...]] = {
+            organ: tuple(name for name, defn in self.intervention_definitions.items()
+                         if organ in defn.target_organs)
+            for organ in OrganSystem
+        }
+        # dedicated generator so execution outcomes can be replayed under a seed
+        self._rng = random.Random(seed)
+        # scheduled time and status of each order, parallel to self.orders
+        self._scheduled_us = np.empty(16, dtype=np.int64)
+        self._status_codes = np.empty(16, dtype=np.int8)
+    
+    def seed(self, seed: Optional[int]) -> None:
+        """reseed the generator used to simulate execution outcomes"""
+        self._rng.seed(seed)
         
-    def _initialize_intervention_definitions(self) -> Dict[str, InterventionDefinition]:
+    def _initialize_intervention_definitions(self) -> Mapping[str, InterventionDefinition]:
         """initialize comprehensive intervention definitions"""
         definitions = {}
         
@@ -541,14 +578,13 @@ class InterventionManager:
             )
         })
         
-        return definitions
+        return MappingProxyType(definitions)
     
     def get_available_interventions(self, organ_system: Optional[OrganSystem] = None) -> List[str]:
         """get list of available interventions, optionally filtered by organ system"""
         if organ_system is None:
-            return list(self.intervention_definitions.keys())
-        return [name for name, defn in self.intervention_definitions.items() 
-                if organ_system in defn.target_organs]
+            return list(self._available_names)
+        return list(self._names_by_organ.get(organ_system, ()))
     
     def get_intervention_info(self, intervention_name: str) -> Optional[InterventionDefinition]:
         """get detailed information about an intervention"""
@@ -562,10 +598,10 @@ class InterventionManager:
         
         definition = self.intervention_definitions[intervention_name]
         
-        # merge default parameters with provided ones
-        final_parameters = definition.parameters.copy()
+        # share the read-only defaults unless the order overrides them
+        final_parameters = definition.parameters
         if parameters:
-            final_parameters.update(parameters)
+            final_parameters = {**definition.parameters, **parameters}
         
         order = InterventionOrder(
             order_id=f"ORD{self.next_order_id:04d}",
@@ -581,31 +617,55 @@ class InterventionManager:
         )
         
         self.orders.append(order)
+        self._index_order(order)
         self.next_order_id += 1
         return order
     
+    def _index_order(self, order: InterventionOrder) -> None:
+        """append the most recently added order to the due-time index"""
+        position = len(self.orders) - 1
+        if position >= len(self._scheduled_us):
+            # double capacity to amortize appends
+            capacity = 2 * len(self._scheduled_us)
+            self._scheduled_us = np.resize(self._scheduled_us, capacity)
+            self._status_codes = np.resize(self._status_codes, capacity)
+        self._scheduled_us[position] = _to_microseconds(order.scheduled_time)
+        self._status_codes[position] = _STATUS_CODES[order.status]
+    
+    def _due_positions(self, current_time: datetime) -> np.ndarray:
+        """positions in self.orders of pending/scheduled orders due by current_time"""
+        count = len(self.orders)
+        waiting = self._status_codes[:count] <= _STATUS_CODES["scheduled"]
+        due = self._scheduled_us[:count] <= _to_microseconds(current_time)
+        return np.flatnonzero(waiting & due)
+    
+    def due_orders(self, current_time: datetime) -> List[InterventionOrder]:
+        """get pending or scheduled orders that are due by current_time"""
+        return [self.orders[position] for position in self._due_positions(current_time)]
+    
     def execute_due_interventions(self, current_time: datetime) -> List[InterventionOrder]:
         """execute all due interventions and return results"""
         executed = []
-        for order in self.orders:
-            if order.status in ["pending", "scheduled"] and order.scheduled_time and current_time >= order.scheduled_time:
-                order.status = "executing"
-                order.executed_time = current_time
-                
-                # simulate execution
-                success = self._simulate_execution_success(order)
-                if success:
-                    order.status = "completed"
-                    order.completed_time = current_time + timedelta(minutes=self.intervention_definitions[order.name].duration_minutes)
-                    order.result = self._simulate_result(order)
-                else:
-                    order.status = "failed"
-                    order.result = {"error": "execution_failed"}
-                
-                # simulate adverse events
-                order.adverse_events = self._simulate_adverse_events(order)
-                
-                executed.append(order)
+        for position in self._due_positions(current_time):
+            order = self.orders[position]
+            order.status = "executing"
+            order.executed_time = current_time
+            
+            # simulate execution
+            success = self._simulate_execution_success(order)
+            if success:
+                order.status = "completed"
+                order.completed_time = current_time + timedelta(minutes=self.intervention_definitions[order.name].duration_minutes)
+                order.result = self._simulate_result(order)
+            else:
+                order.status = "failed"
+                order.result = {"error": "execution_failed"}
+            self._status_codes[position] = _STATUS_CODES[order.status]
+            
+            # simulate adverse events
+            order.adverse_events = self._simulate_adverse_events(order)
+            
+            executed.append(order)
         
         return executed
     
@@ -620,7 +680,7 @@ class InterventionManager:
         elif order.priority <= 1:  # low
             base_success_rate -= 0.05
         
-        return random.random() < base_success_rate
+        return self._rng.random() < base_success_rate
     
     def _simulate_result(self, order: InterventionOrder) -> Dict[str, Any]:
         """simulate detailed intervention results"""
@@ -641,39 +701,39 @@ class InterventionManager:
         """simulate laboratory test results"""
         lab_results = {
             "cbc": {
-                "wbc": random.uniform(4.0, 12.0),
-                "hgb": random.uniform(12.0, 16.0),
-                "plt": random.uniform(150, 450),
+                "wbc": self._rng.uniform(4.0, 12.0),
+                "hgb": self._rng.uniform(12.0, 16.0),
+                "plt": self._rng.uniform(150, 450),
                 "units": {"wbc": "k/ul", "hgb": "g/dl", "plt": "k/ul"}
             },
             "chemistry": {
-                "na": random.uniform(135, 145),
-                "k": random.uniform(3.5, 5.0),
-                "cl": random.uniform(95, 105),
-                "co2": random.uniform(22, 28),
-                "bun": random.uniform(7, 20),
-                "creatinine": random.uniform(0.6, 1.2),
+                "na": self._rng.uniform(135, 145),
+                "k": self._rng.uniform(3.5, 5.0),
+                "cl": self._rng.uniform(95, 105),
+                "co2": self._rng.uniform(22, 28),
+                "bun": self._rng.uniform(7, 20),
+                "creatinine": self._rng.uniform(0.6, 1.2),
                 "units": {"na": "meq/l", "k": "meq/l", "cl": "meq/l", "co2": "meq/l", "bun": "mg/dl", "creatinine": "mg/dl"}
             },
             "troponin": {
-                "troponin_i": random.uniform(0.0, 0.04),
+                "troponin_i": self._rng.uniform(0.0, 0.04),
                 "units": {"troponin_i": "ng/ml"}
             },
             "blood_culture": {
-                "result": "no_growth" if random.random() > 0.3 else "positive",
-                "organism": None if random.random() > 0.3 else random.choice(["staph_aureus", "e_coli", "pseudomonas"])
+                "result": "no_growth" if self._rng.random() > 0.3 else "positive",
+                "organism": None if self._rng.random() > 0.3 else self._rng.choice(["staph_aureus", "e_coli", "pseudomonas"])
             },
             "arterial_blood_gas": {
-                "ph": random.uniform(7.35, 7.45),
-                "pco2": random.uniform(35, 45),
-                "po2": random.uniform(80, 100),
-                "hco3": random.uniform(22, 28),
+                "ph": self._rng.uniform(7.35, 7.45),
+                "pco2": self._rng.uniform(35, 45),
+                "po2": self._rng.uniform(80, 100),
+                "hco3": self._rng.uniform(22, 28),
                 "units": {"ph": "", "pco2": "mmhg", "po2": "mmhg", "hco3": "meq/l"}
             },
             "coagulation_studies": {
-                "pt": random.uniform(11, 13),
-                "ptt": random.uniform(25, 35),
-                "inr": random.uniform(0.9, 1.1),
+                "pt": self._rng.uniform(11, 13),
+                "ptt": self._rng.uniform(25, 35),
+                "inr": self._rng.uniform(0.9, 1.1),
                 "units": {"pt": "seconds", "ptt": "seconds", "inr": ""}
             }
         }
@@ -684,28 +744,28 @@ class InterventionManager:
         """simulate imaging study results"""
         imaging_results = {
             "chest_xray": {
-                "findings": random.choice(["normal", "pneumonia", "pulmonary_edema", "pneumothorax", "effusion"]),
+                "findings": self._rng.choice(["normal", "pneumonia", "pulmonary_edema", "pneumothorax", "effusion"]),
                 "impression": "clinical correlation recommended"
             },
             "ct_chest": {
-                "findings": random.choice(["normal", "pneumonia", "pulmonary_embolism", "mass", "effusion"]),
+                "findings": self._rng.choice(["normal", "pneumonia", "pulmonary_embolism", "mass", "effusion"]),
                 "impression": "clinical correlation recommended"
             },
             "ct_head": {
-                "findings": random.choice(["normal", "hemorrhage", "infarct", "mass", "edema"]),
+                "findings": self._rng.choice(["normal", "hemorrhage", "infarct", "mass", "edema"]),
                 "impression": "clinical correlation recommended"
             },
             "echocardiogram": {
-                "ef": random.uniform(50, 70),
-                "findings": random.choice(["normal", "systolic_dysfunction", "valvular_disease", "pericardial_effusion"]),
+                "ef": self._rng.uniform(50, 70),
+                "findings": self._rng.choice(["normal", "systolic_dysfunction", "valvular_disease", "pericardial_effusion"]),
                 "units": {"ef": "%"}
             },
             "mri_brain": {
-                "findings": random.choice(["normal", "stroke", "tumor", "demyelination", "hemorrhage"]),
+                "findings": self._rng.choice(["normal", "stroke", "tumor", "demyelination", "hemorrhage"]),
                 "impression": "clinical correlation recommended"
             },
             "ultrasound_abdomen": {
-                "findings": random.choice(["normal", "ascites", "gallstones", "mass", "free_fluid"]),
+                "findings": self._rng.choice(["normal", "ascites", "gallstones", "mass", "free_fluid"]),
                 "impression": "clinical correlation recommended"
             }
         }
@@ -739,66 +799,66 @@ class InterventionManager:
         # organ-specific adverse events
         for organ in order.target_organs:
             if organ == OrganSystem.CARDIOVASCULAR:
-                if random.random() < base_risk * 0.3:
+                if self._rng.random() < base_risk * 0.3:
                     events.append(AdverseEventType.ARRHYTHMIA)
-                if random.random() < base_risk * 0.2:
+                if self._rng.random() < base_risk * 0.2:
                     events.append(AdverseEventType.HYPOTENSION)
-                if random.random() < base_risk * 0.1:
+                if self._rng.random() < base_risk * 0.1:
                     events.append(AdverseEventType.CARDIAC_ARREST)
             
             elif organ == OrganSystem.RESPIRATORY:
-                if random.random() < base_risk * 0.4:
+                if self._rng.random() < base_risk * 0.4:
                     events.append(AdverseEventType.RESPIRATORY_DEPRESSION)
-                if random.random() < base_risk * 0.2:
+                if self._rng.random() < base_risk * 0.2:
                     events.append(AdverseEventType.INFECTION)
             
             elif organ == OrganSystem.RENAL:
-                if random.random() < base_risk * 0.5:
+                if self._rng.random() < base_risk * 0.5:
                     events.append(AdverseEventType.RENAL_INJURY)
             
             elif organ == OrganSystem.HEPATIC:
-                if random.random() < base_risk * 0.4:
+                if self._rng.random() < base_risk * 0.4:
                     events.append(AdverseEventType.HEPATIC_INJURY)
             
             elif organ == OrganSystem.HEMATOLOGICAL:
-                if random.random() < base_risk * 0.3:
+                if self._rng.random() < base_risk * 0.3:
                     events.append(AdverseEventType.BLEEDING)
-                if random.random() < base_risk * 0.2:
+                if self._rng.random() < base_risk * 0.2:
                     events.append(AdverseEventType.THROMBOSIS)
             
             elif organ == OrganSystem.IMMUNE:
-                if random.random() < base_risk * 0.3:
+                if self._rng.random() < base_risk * 0.3:
                     events.append(AdverseEventType.ALLERGIC_REACTION)
-                if random.random() < base_risk * 0.2:
+                if self._rng.random() < base_risk * 0.2:
                     events.append(AdverseEventType.INFECTION)
         
         # intervention-specific adverse events
         if order.name == "antibiotic":
-            if random.random() < base_risk * 0.4:
+            if self._rng.random() < base_risk * 0.4:
                 events.append(AdverseEventType.ALLERGIC_REACTION)
         
         elif order.name == "vasopressor":
-            if random.random() < base_risk * 0.5:
+            if self._rng.random() < base_risk * 0.5:
                 events.append(AdverseEventType.ARRHYTHMIA)
-            if random.random() < base_risk * 0.3:
+            if self._rng.random() < base_risk * 0.3:
                 events.append(AdverseEventType.HYPERTENSION)
         
         elif order.name == "anticoagulant":
-            if random.random() < base_risk * 0.6:
+            if self._rng.random() < base_risk * 0.6:
                 events.append(AdverseEventType.BLEEDING)
         
         elif order.name == "sedative":
-            if random.random() < base_risk * 0.5:
+            if self._rng.random() < base_risk * 0.5:
                 events.append(AdverseEventType.RESPIRATORY_DEPRESSION)
         
         elif "intubation" in order.name:
-            if random.random() < base_risk * 0.3:
+            if self._rng.random() < base_risk * 0.3:
                 events.append(AdverseEventType.INFECTION)
         
         elif "catheterization" in order.name or "line" in order.name:
-            if random.random() < base_risk * 0.4:
+            if self._rng.random() < base_risk * 0.4:
                 events.append(AdverseEventType.INFECTION)
-            if random.random() < base_risk * 0.2:
+            if self._rng.random() < base_risk * 0.2:
                 events.append(AdverseEventType.BLEEDING)
         
         return list(set(events))  # remove duplicates
@@ -821,9 +881,10 @@ class InterventionManager:
     
     def cancel_order(self, order_id: str) -> bool:
         """cancel an order if it's still pending or scheduled"""
-        for order in self.orders:
+        for position, order in enumerate(self.orders):
             if order.order_id == order_id and order.status in ["pending", "scheduled"]:
                 order.status = "cancelled"
+                self._status_codes[position] = _STATUS_CODES["cancelled"]
                 return True
         return False
     
@@ -2,10 +2,31 @@
 PK/PD Engine and Drug Data Model
 """
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Tuple
+from functools import lru_cache
 import math
 import random
 
+import numpy as np
+
+# body weight and creatinine clearance the catalog's standard doses are written for
+REFERENCE_WEIGHT_KG = 70.0
+NORMAL_CRCL_ML_MIN = 100.0
+
+# organ systems searched, in order, for the parameter an effect target names
+_EFFECT_SYSTEMS = ("cardiovascular", "respiratory", "renal", "endocrine", "neurological",
+                   "gastrointestinal", "hematological", "immune", "hepatic", "musculoskeletal")
+_UNRESOLVED = object()
+
+# below this many (target, effect) pairs a dict sum beats numpy's call overhead
+_VECTORIZE_MIN_EFFECTS = 16
+
+
+def _weight_adjusted_dose(base_dose: float, weight_kg: float,
+                          renal_fraction: float, hepatic_factor: float) -> float:
+    """scale a reference adult dose by body weight and organ function"""
+    return base_dose * (weight_kg / REFERENCE_WEIGHT_KG) * renal_fraction * hepatic_factor
+
 @dataclass
 class DrugPKPD:
     name: str
@@ -68,6 +89,10 @@ class DrugAdministration:
 class PKPDEngine:
     def __init__(self, drug_db: Dict[str, DrugPKPD]):
         self.drug_db = drug_db
+        # per-engine memo of dose calculations keyed on quantized patient inputs
+        self._cached_dose = lru_cache(maxsize=4096)(self._compute_dose)
+        # organ system each effect target resolves to, per physiological engine type
+        self._effect_systems: Dict[Tuple[type, str], Optional[str]] = {}
         self.active_drugs: List[DrugAdministration] = []
         self.current_time: float = 0.0
         self.adverse_events: List[str] = []
@@ -87,44 +112,77 @@ class PKPDEngine:
         self.active_drugs.append(admin)
         return admin
 
+    def reload_drug_db(self, drug_db: Dict[str, DrugPKPD]):
+        """replace the drug database and drop cached dose calculations"""
+        self.drug_db = drug_db
+        self._cached_dose.cache_clear()
+
+    def recommended_dose(self, name: str, patient_weight: float,
+                         creatinine_clearance: float = NORMAL_CRCL_ML_MIN,
+                         hepatic_factor: float = 1.0) -> float:
+        """standard dose adjusted for patient weight and renal/hepatic function"""
+        # weight to the nearest kg and crcl to the nearest 5 mL/min share cache entries
+        return self._cached_dose(name.lower(), round(patient_weight),
+                                 5 * round(creatinine_clearance / 5), float(hepatic_factor))
+
+    def _compute_dose(self, name: str, weight_kg: int, crcl: int, hepatic_factor: float) -> float:
+        drug = self.drug_db.get(name)
+        if not drug:
+            raise ValueError(f"Drug '{name}' not found in database.")
+        renal_fraction = min(1.0, crcl / NORMAL_CRCL_ML_MIN)
+        return _weight_adjusted_dose(float(drug.dose), float(weight_kg),
+                                     renal_fraction, hepatic_factor)
+
     def update(self, dt: float, physiological_engine):
         self.current_time += dt
+        targets: List[str] = []
+        effects: List[float] = []
         for admin in self.active_drugs:
             if not admin.is_active(self.current_time):
                 admin.completed = True
                 continue
             conc = admin.update_concentration(self.current_time)
-            # apply PD effect to physiological engine
+            effect = admin.drug.effect_curve(conc)
             for target in admin.drug.effect_targets:
-                effect = admin.drug.effect_curve(conc)
-                self._apply_effect(target, effect, physiological_engine)
+                targets.append(target)
+                effects.append(effect)
             # check for side effects
             self._check_adverse_events(admin, physiological_engine)
+        # apply the combined PD effect of all drugs once per target
+        for target, effect in self._sum_effects(targets, effects).items():
+            self._apply_effect(target, effect, physiological_engine)
+
+    @staticmethod
+    def _sum_effects(targets: List[str], effects: List[float]) -> Dict[str, float]:
+        """total effect per physiological target"""
+        if len(targets) < _VECTORIZE_MIN_EFFECTS:
+            totals: Dict[str, float] = {}
+            for target, effect in zip(targets, effects):
+                totals[target] = totals.get(target, 0.0) + effect
+            return totals
+        keys, inverse = np.unique(np.asarray(targets), return_inverse=True)
+        sums = np.bincount(inverse, weights=np.asarray(effects, dtype=np.float64))
+        return dict(zip(keys.tolist(), sums.tolist()))
 
     def _apply_effect(self, target: str, effect: float, phys):
         # map effect targets to physiological parameters
         # e.g., 'heart_rate', 'blood_pressure_systolic', etc.
-        if hasattr(phys.cardiovascular, target):
-            setattr(phys.cardiovascular, target, getattr(phys.cardiovascular, target) + effect)
-        elif hasattr(phys.respiratory, target):
-            setattr(phys.respiratory, target, getattr(phys.respiratory, target) + effect)
-        elif hasattr(phys.renal, target):
-            setattr(phys.renal, target, getattr(phys.renal, target) + effect)
-        elif hasattr(phys.endocrine, target):
-            setattr(phys.endocrine, target, getattr(phys.endocrine, target) + effect)
-        elif hasattr(phys.neurological, target):
-            setattr(phys.neurological, target, getattr(phys.neurological, target) + effect)
-        elif hasattr(phys.gastrointestinal, target):
-            setattr(phys.gastrointestinal, target, getattr(phys.gastrointestinal, target) + effect)
-        elif hasattr(phys.hematological, target):
-            setattr(phys.hematological, target, getattr(phys.hematological, target) + effect)
-        elif hasattr(phys.immune, target):
-            setattr(phys.immune, target, getattr(phys.immune, target) + effect)
-        elif hasattr(phys.hepatic, target):
-            setattr(phys.hepatic, target, getattr(phys.hepatic, target) + effect)
-        elif hasattr(phys.musculoskeletal, target):
-            setattr(phys.musculoskeletal, target, getattr(phys.musculoskeletal, target) + effect)
-        # add more as needed
+        key = (type(phys), target)
+        system_name = self._effect_systems.get(key, _UNRESOLVED)
+        if system_name is _UNRESOLVED:
+            system_name = self._effect_systems[key] = self._resolve_effect_system(target, phys)
+        if system_name is None:
+            return
+        system = getattr(phys, system_name)
+        setattr(system, target, getattr(system, target) + effect)
+
+    @staticmethod
+    def _resolve_effect_system(target: str, phys) -> Optional[str]:
+        """first organ system on the physiological engine that has the target"""
+        for system_name in _EFFECT_SYSTEMS:
+            if hasattr(getattr(phys, system_name), target):
+                return system_name
+        return None
 
     def _check_adverse_events(self, admin: DrugAdministration, phys):
         # simple example: if concentration > threshold, trigger side effect
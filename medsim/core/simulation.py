@@ -10,7 +10,7 @@ import logging
 import json
 from .patient import EnhancedPatientProfile, PatientProfileGenerator, EmotionalState
 from .physiology import EnhancedPhysiologicalEngine
-from .pharmacology import PKPDEngine
+from .pharmacology import NORMAL_CRCL_ML_MIN, PKPDEngine
 from .drug_db import drug_db
 from .monitoring import MonitoringSystem, DrugLevelMonitor, DrugLevel
 
@@ -355,8 +355,10 @@ class MedicalSimulation:
         self.is_running = False
         logger.info("simulation reset")
 
-    def administer_drug(self, name: str, dose: float, route: str):
-        """administer a drug to the patient"""
+    def administer_drug(self, name: str, dose: Optional[float], route: str):
+        """administer a drug to the patient; without a dose, the one prepared for this patient is given"""
+        if dose is None:
+            dose = self.prepare_dose(name)
         admin = self.pkpd_engine.administer_drug(name, dose, route, self.patient_weight)
         
         # add to monitoring system
@@ -373,6 +375,21 @@ class MedicalSimulation:
         
         return admin
 
+    def prepare_dose(self, name: str) -> float:
+        """standard dose of a drug adjusted for the patient's weight and current renal function"""
+        return self.pkpd_engine.recommended_dose(name, self.patient_weight,
+                                                 creatinine_clearance=self._creatinine_clearance())
+
+    def _creatinine_clearance(self) -> float:
+        """cockcroft-gault estimate from the patient's age, weight, sex and serum creatinine"""
+        if self.patient_state is None:
+            return NORMAL_CRCL_ML_MIN
+        creatinine = max(0.1, self.physiological_engine.renal.creatinine)
+        clearance = (140 - self.patient_state.age) * self.patient_weight / (72 * creatinine)
+        if self.patient_state.gender.lower().startswith('f'):
+            clearance *= 0.85
+        return max(0.0, clearance)
+
     def get_active_drugs(self):
         return self.pkpd_engine.get_active_drugs()
 
@@ -2,13 +2,22 @@
 enhanced treatment system with sophisticated drug interactions and clinical protocols
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Mapping, FrozenSet, NamedTuple, Set, Union
 from dataclasses import dataclass, field
-from enum import Enum
-from datetime import datetime, timedelta
-import random
+from enum import Enum, IntEnum
+from types import MappingProxyType
+from collections import defaultdict
+from functools import lru_cache
+from importlib import resources
+from datetime import datetime
 import math
-import json
+import sys
+import time
+
+import numpy as np
+
+from ._compat import DATACLASS_SLOTS, HAS_NUMBA, json_loads
+from ._treatment_kernels import _decay_levels, _filter_indices
 
 
 class DrugCategory(Enum):
@@ -39,16 +48,59 @@ class Route(Enum):
     SUBLINGUAL = "sublingual"
 
 
-class InteractionSeverity(Enum):
-    """drug interaction severity levels"""
-    NONE = "none"
-    MILD = "mild"
-    MODERATE = "moderate"
-    SEVERE = "severe"
-    CONTRAINDICATED = "contraindicated"
+_SECONDS_PER_HOUR = 3600.0
+
+
+# route values to members, skipping Enum's call machinery on the administration path
+_ROUTE_LOOKUP: Dict[str, Route] = {route.value: route for route in Route}
+
+# dense ids for the columnar drug filter; routes are packed into a bitmask
+_CATEGORY_IDS = {category: i for i, category in enumerate(DrugCategory)}
+_ROUTE_BITS = {route: 1 << i for i, route in enumerate(Route)}
+
+# below this many drugs a python scan beats building and filtering the columns
+_COLUMNAR_FILTER_MIN_DRUGS = 5000
+
+# gathering the arrays and writing changes back costs about as much as a python
+# loop, so the decay kernel only pays off on batches of a few thousand levels
+_VECTORIZE_MIN_LEVELS = 4096
 
+_LN2 = math.log(2)
 
-@dataclass
+
+class InteractionSeverity(IntEnum):
+    """drug interaction severity levels, ordered so checks are integer compares"""
+    NONE = 0
+    MILD = 1
+    MODERATE = 2
+    SEVERE = 3
+    CONTRAINDICATED = 4
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class DoseRegimen:
+    """dosing regimen for a single administration route"""
+    dose: str
+    frequency: str = ""
+    maximum: str = ""
+    titration: str = ""
+    maintenance: str = ""
+    
+    def to_dict(self) -> Dict[str, str]:
+        """legacy nested-dict shape of the regimen"""
+        legacy = {"dose": self.dose}
+        if self.frequency:
+            legacy["frequency"] = self.frequency
+        if self.maximum:
+            legacy["max"] = self.maximum
+        if self.titration:
+            legacy["titration"] = self.titration
+        if self.maintenance:
+            legacy["maintenance"] = self.maintenance
+        return legacy
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class DrugInteraction:
     """drug interaction definition"""
     drug1: str
@@ -58,57 +110,146 @@ class DrugInteraction:
     effect: str
     recommendation: str
     evidence_level: str = "moderate"  # low, moderate, high
+    
+    def __post_init__(self):
+        # interned so pair lookups hash and compare by identity; frozen, so bypass __setattr__
+        object.__setattr__(self, "drug1", sys.intern(self.drug1))
+        object.__setattr__(self, "drug2", sys.intern(self.drug2))
 
 
-@dataclass
+@lru_cache(maxsize=256)
+def _parse_dose(dose: str) -> Tuple[float, str]:
+    """split a dose string like "5 mg" into its value and unit"""
+    value, _, unit = dose.strip().partition(" ")
+    return float(value), unit.strip()
+
+
+class TreatmentRecord(NamedTuple):
+    """a single drug administration"""
+    drug_name: str
+    dose: float
+    route: str
+    administered_at_ts: float  # epoch seconds
+    category: str
+    interactions: Tuple[DrugInteraction, ...]
+    dose_unit: str = ""
+    
+    @property
+    def administered_at(self) -> str:
+        """iso timestamp of the administration"""
+        return datetime.fromtimestamp(self.administered_at_ts).isoformat()
+
+
+@dataclass(**DATACLASS_SLOTS)
+class TreatmentColumns:
+    """a patient's administrations stored column-wise, one list per field"""
+    drug_name: List[str] = field(default_factory=list)
+    dose: List[float] = field(default_factory=list)
+    route: List[str] = field(default_factory=list)
+    administered_at_ts: List[float] = field(default_factory=list)
+    category: List[str] = field(default_factory=list)
+    interactions: List[Tuple[DrugInteraction, ...]] = field(default_factory=list)
+    dose_unit: List[str] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.drug_name)
+    
+    def append(self, drug_name: str, dose: float, route: str, administered_at_ts: float,
+               category: str, interactions: Tuple[DrugInteraction, ...], dose_unit: str = "") -> None:
+        """add one administration to every column"""
+        self.drug_name.append(drug_name)
+        self.dose.append(dose)
+        self.route.append(route)
+        self.administered_at_ts.append(administered_at_ts)
+        self.category.append(category)
+        self.interactions.append(interactions)
+        self.dose_unit.append(dose_unit)
+    
+    def row(self, index: int) -> TreatmentRecord:
+        """a single administration as a record"""
+        return TreatmentRecord(self.drug_name[index], self.dose[index], self.route[index],
+                               self.administered_at_ts[index], self.category[index],
+                               self.interactions[index], self.dose_unit[index])
+    
+    def rows(self) -> List[TreatmentRecord]:
+        """every administration as records, in order"""
+        return list(map(TreatmentRecord, self.drug_name, self.dose, self.route, self.administered_at_ts,
+                        self.category, self.interactions, self.dose_unit))
+
+
+@dataclass(**DATACLASS_SLOTS)
 class DrugLevel:
     """enhanced drug level monitoring"""
     drug_name: str
     current_level: float
     therapeutic_range: Tuple[float, float]
     unit: str
-    timestamp: datetime
+    timestamp_hours: float  # epoch hours, so decay needs no timedelta arithmetic
     is_therapeutic: bool = True
     is_toxic: bool = False
     requires_dose_adjustment: bool = False
     half_life: float = 0.0  # hours
     clearance_rate: float = 0.0  # L/hour
+    
+    @property
+    def timestamp(self) -> datetime:
+        """time of the last level update"""
+        return datetime.fromtimestamp(self.timestamp_hours * _SECONDS_PER_HOUR)
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Drug:
     """enhanced drug definition"""
     name: str
     category: DrugCategory
-    routes: List[Route]
-    dosing_info: Dict[str, Any]
+    routes: Tuple[Route, ...]
+    dosing_info: Mapping[str, DoseRegimen]
     therapeutic_range: Optional[Tuple[float, float]] = None
     unit: str = ""
     half_life: float = 0.0  # hours
     protein_binding: float = 0.0  # percentage
     metabolism: str = ""
     excretion: str = ""
-    contraindications: List[str] = field(default_factory=list)
-    side_effects: List[str] = field(default_factory=list)
+    contraindications: Tuple[str, ...] = ()
+    side_effects: Tuple[str, ...] = ()
     monitoring_required: bool = False
     cost_per_unit: float = 0.0
+    # routes as a set for membership checks; routes keeps display order
+    route_set: FrozenSet[Route] = field(init=False, repr=False, compare=False)
+    # lowercase contraindications for case-insensitive membership checks
+    contraindication_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # catalog rows arrive as json lists; frozen, so bypass __setattr__
+        set_field = object.__setattr__
+        set_field(self, "routes", tuple(self.routes))
+        set_field(self, "route_set", frozenset(self.routes))
+        set_field(self, "dosing_info", MappingProxyType(dict(self.dosing_info)))
+        set_field(self, "contraindications", tuple(self.contraindications))
+        set_field(self, "contraindication_set",
+                  frozenset(condition.lower() for condition in self.contraindications))
+        set_field(self, "side_effects", tuple(self.side_effects))
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class TreatmentProtocol:
     """enhanced treatment protocol"""
     name: str
     condition: str
     description: str
-    steps: List[Dict[str, Any]]
+    steps: Tuple[Dict[str, Any], ...]
     evidence_level: str = "moderate"
     success_rate: float = 0.8
     duration: int = 0  # hours
     cost: float = 0.0
-    complications: List[str] = field(default_factory=list)
+    complications: Tuple[str, ...] = ()
+    
+    def __post_init__(self):
+        object.__setattr__(self, "steps", tuple(self.steps))
+        object.__setattr__(self, "complications", tuple(self.complications))
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TreatmentSession:
     """enhanced treatment session"""
     patient_id: str
@@ -121,400 +262,344 @@ class TreatmentSession:
     success: bool = True
 
 
+def _read_catalog(filename: str) -> Any:
+    """parse one of the json catalogs shipped with the package"""
+    return json_loads(resources.files("medsim.core.data").joinpath(filename).read_bytes())
+
+
+@lru_cache(maxsize=1)
+def _load_drugs() -> Mapping[str, Drug]:
+    """load the drug database on first use"""
+    drugs = {}
+    for key, row in _read_catalog("drugs.json").items():
+        row["category"] = DrugCategory(row["category"])
+        # tuples up front: mypyc-compiled dataclasses check field types on init
+        row["routes"] = tuple(_ROUTE_LOOKUP[route] for route in row["routes"])
+        row["contraindications"] = tuple(row["contraindications"])
+        row["side_effects"] = tuple(row["side_effects"])
+        row["dosing_info"] = {sys.intern(route): DoseRegimen(**regimen)
+                              for route, regimen in row["dosing_info"].items()}
+        if row["therapeutic_range"] is not None:
+            row["therapeutic_range"] = tuple(row["therapeutic_range"])
+        drugs[sys.intern(key)] = Drug(**row)
+    
+    return MappingProxyType(drugs)
+
+
+@lru_cache(maxsize=1)
+def _load_interactions() -> Tuple[DrugInteraction, ...]:
+    """load the drug interaction database on first use"""
+    interactions = []
+    for row in _read_catalog("drug_interactions.json"):
+        row["severity"] = InteractionSeverity[row["severity"].upper()]
+        interactions.append(DrugInteraction(**row))
+    return tuple(interactions)
+
+
+@lru_cache(maxsize=1)
+def _load_protocols() -> Mapping[str, TreatmentProtocol]:
+    """load the treatment protocols on first use"""
+    protocols = {}
+    for key, row in _read_catalog("treatment_protocols.json").items():
+        row["steps"] = tuple(row["steps"])
+        row["complications"] = tuple(row["complications"])
+        protocols[sys.intern(key)] = TreatmentProtocol(**row)
+    
+    return MappingProxyType(protocols)
+
+
 class EnhancedTreatmentEngine:
     """enhanced treatment engine with sophisticated drug management"""
     
-    def __init__(self):
-        self.drugs = self._initialize_drugs()
-        self.interactions = self._initialize_interactions()
-        self.protocols = self._initialize_protocols()
-        self.active_treatments: Dict[str, List[Dict[str, Any]]] = {}
-        self.drug_levels: Dict[str, List[DrugLevel]] = {}
+    def __init__(self, seed: Optional[int] = None):
+        # drug keys are interned lowercase names, use get_drug for raw user input
+        self.drugs = _load_drugs()
+        self.interactions = _load_interactions()
+        # interactions keyed by unordered drug pair and by each drug involved
+        self._interactions_by_pair: Dict[FrozenSet[str], List[DrugInteraction]] = defaultdict(list)
+        self._interactions_by_drug: Dict[str, List[DrugInteraction]] = defaultdict(list)
+        for interaction in self.interactions:
+            self._interactions_by_pair[frozenset((interaction.drug1, interaction.drug2))].append(interaction)
+            self._interactions_by_drug[interaction.drug1].append(interaction)
+            if interaction.drug2 != interaction.drug1:
+                self._interactions_by_drug[interaction.drug2].append(interaction)
+        self.protocols = _load_protocols()
+        # drug names grouped by lowercase category value for search_drugs
+        self._drugs_by_category: Dict[str, List[str]] = defaultdict(list)
+        for name, drug in self.drugs.items():
+            self._drugs_by_category[drug.category.value.lower()].append(name)
+        # columnar view of the catalog for filter_drugs on large formularies
+        self._drug_names: Tuple[str, ...] = tuple(self.drugs)
+        self._category_ids = np.array([_CATEGORY_IDS[drug.category] for drug in self.drugs.values()],
+                                      dtype=np.int32)
+        self._route_masks = np.array([sum(_ROUTE_BITS[route] for route in drug.routes)
+                                      for drug in self.drugs.values()], dtype=np.uint32)
+        # one bit per known (lowercase) contraindication so checks are integer ANDs
+        self._condition_bits: Dict[str, int] = {}
+        self._contraindication_masks: Dict[str, int] = {}
+        for name, drug in self.drugs.items():
+            mask = 0
+            for condition in sorted(drug.contraindication_set):
+                bit = self._condition_bits.setdefault(condition, 1 << len(self._condition_bits))
+                mask |= bit
+            self._contraindication_masks[name] = mask
+        # read with .get() so lookups do not insert empty patient entries
+        self.active_treatments: Dict[str, TreatmentColumns] = defaultdict(TreatmentColumns)
+        # only the current level of each drug matters, so a repeat dose replaces
+        # the old row and per-tick work is bounded by the drugs being monitored
+        self.drug_levels: Dict[str, Dict[str, DrugLevel]] = defaultdict(dict)
+        # distinct drugs given to each patient, in first-administration order
+        # (a dict rather than a set so interaction results stay deterministic)
+        self._active_drug_names: Dict[str, Dict[str, None]] = defaultdict(dict)
+        # critical alerts per patient, recomputed only for patients whose levels changed
+        self._alerts_by_patient: Dict[str, List[Dict[str, Any]]] = {}
+        self._dirty_alert_patients: Set[str] = set()
         self.treatment_sessions: List[TreatmentSession] = []
+        # simulation clock in epoch hours; None follows the wall clock until tick() is called
+        self._now_hours: Optional[float] = None
+        # dedicated pcg64 generator so simulated levels can be replayed under a seed
+        self._rng = np.random.default_rng(seed)
     
-    def _initialize_drugs(self) -> Dict[str, Drug]:
-        """initialize comprehensive drug database"""
-        drugs = {}
-        
-        # cardiovascular drugs
-        drugs["nitroglycerin"] = Drug(
-            name="Nitroglycerin",
-            category=DrugCategory.CARDIOVASCULAR,
-            routes=[Route.SUBLINGUAL, Route.INTRAVENOUS, Route.TOPICAL],
-            dosing_info={
-                "sublingual": {"dose": "0.4 mg", "frequency": "every 5 minutes", "max": "3 doses"},
-                "iv": {"dose": "5-200 mcg/min", "titration": "every 3-5 minutes"},
-                "topical": {"dose": "0.5-2 inches", "frequency": "every 8 hours"}
-            },
-            therapeutic_range=(0.1, 10.0),
-            unit="mcg/mL",
-            half_life=1.5,
-            contraindications=["hypotension", "right ventricular infarction"],
-            side_effects=["headache", "hypotension", "reflex tachycardia"],
-            monitoring_required=True,
-            cost_per_unit=2.0
-        )
-        
-        drugs["aspirin"] = Drug(
-            name="Aspirin",
-            category=DrugCategory.CARDIOVASCULAR,
-            routes=[Route.ORAL, Route.RECTAL],
-            dosing_info={
-                "oral": {"dose": "81-325 mg", "frequency": "daily"},
-                "rectal": {"dose": "300-600 mg", "frequency": "every 4-6 hours"}
-            },
-            contraindications=["bleeding disorder", "peptic ulcer disease", "allergy"],
-            side_effects=["gastrointestinal bleeding", "allergic reaction", "tinnitus"],
-            cost_per_unit=0.1
-        )
-        
-        drugs["metoprolol"] = Drug(
-            name="Metoprolol",
-            category=DrugCategory.CARDIOVASCULAR,
-            routes=[Route.ORAL, Route.INTRAVENOUS],
-            dosing_info={
-                "oral": {"dose": "25-100 mg", "frequency": "twice daily"},
-                "iv": {"dose": "5 mg", "frequency": "every 5 minutes", "max": "15 mg"}
-            },
-            therapeutic_range=(50, 200),
-            unit="ng/mL",
-            half_life=3.5,
-            contraindications=["bradycardia", "heart block", "cardiogenic shock"],
-            side_effects=["bradycardia", "hypotension", "fatigue"],
-            monitoring_required=True,
-            cost_per_unit=0.5
-        )
-        
-        # respiratory drugs
-        drugs["albuterol"] = Drug(
-            name="Albuterol",
-            category=DrugCategory.BRONCHODILATOR,
-            routes=[Route.INHALED, Route.INTRAVENOUS],
-            dosing_info={
-                "inhaled": {"dose": "2 puffs", "frequency": "every 4-6 hours"},
-                "iv": {"dose": "0.5-10 mcg/min", "titration": "every 10-15 minutes"}
-            },
-            contraindications=["hypersensitivity"],
-            side_effects=["tremor", "tachycardia", "hypokalemia"],
-            cost_per_unit=1.0
-        )
-        
-        # analgesic drugs
-        drugs["morphine"] = Drug(
-            name="Morphine",
-            category=DrugCategory.ANALGESIC,
-            routes=[Route.INTRAVENOUS, Route.INTRAMUSCULAR, Route.ORAL],
-            dosing_info={
-                "iv": {"dose": "2-10 mg", "frequency": "every 2-4 hours"},
-                "im": {"dose": "5-15 mg", "frequency": "every 4 hours"},
-                "oral": {"dose": "15-30 mg", "frequency": "every 4 hours"}
-            },
-            therapeutic_range=(10, 80),
-            unit="ng/mL",
-            half_life=2.0,
-            contraindications=["respiratory depression", "paralytic ileus"],
-            side_effects=["respiratory depression", "sedation", "constipation"],
-            monitoring_required=True,
-            cost_per_unit=5.0
-        )
-        
-        drugs["acetaminophen"] = Drug(
-            name="Acetaminophen",
-            category=DrugCategory.ANALGESIC,
-            routes=[Route.ORAL, Route.RECTAL],
-            dosing_info={
-                "oral": {"dose": "500-1000 mg", "frequency": "every 4-6 hours", "max": "4000 mg/day"},
-                "rectal": {"dose": "325-650 mg", "frequency": "every 4-6 hours"}
-            },
-            therapeutic_range=(10, 30),
-            unit="mcg/mL",
-            half_life=2.0,
-            contraindications=["liver disease", "alcoholism"],
-            side_effects=["hepatotoxicity", "allergic reaction"],
-            cost_per_unit=0.2
-        )
-        
-        # antibiotic drugs
-        drugs["ceftriaxone"] = Drug(
-            name="Ceftriaxone",
-            category=DrugCategory.ANTIBIOTIC,
-            routes=[Route.INTRAVENOUS, Route.INTRAMUSCULAR],
-            dosing_info={
-                "iv": {"dose": "1-2 g", "frequency": "every 12-24 hours"},
-                "im": {"dose": "1-2 g", "frequency": "every 12-24 hours"}
-            },
-            contraindications=["penicillin allergy"],
-            side_effects=["diarrhea", "allergic reaction", "phlebitis"],
-            cost_per_unit=15.0
-        )
-        
-        # anticoagulant drugs
-        drugs["heparin"] = Drug(
-            name="Heparin",
-            category=DrugCategory.ANTICOAGULANT,
-            routes=[Route.INTRAVENOUS, Route.SUBCUTANEOUS],
-            dosing_info={
-                "iv": {"dose": "80 units/kg bolus", "maintenance": "18 units/kg/hour"},
-                "sc": {"dose": "5000-10000 units", "frequency": "every 8-12 hours"}
-            },
-            therapeutic_range=(0.3, 0.7),
-            unit="units/mL",
-            half_life=1.5,
-            contraindications=["active bleeding", "heparin-induced thrombocytopenia"],
-            side_effects=["bleeding", "thrombocytopenia", "osteoporosis"],
-            monitoring_required=True,
-            cost_per_unit=8.0
-        )
-        
-        # insulin
-        drugs["insulin_regular"] = Drug(
-            name="Insulin Regular",
-            category=DrugCategory.INSULIN,
-            routes=[Route.SUBCUTANEOUS, Route.INTRAVENOUS],
-            dosing_info={
-                "sc": {"dose": "0.1-1.0 units/kg", "frequency": "before meals"},
-                "iv": {"dose": "0.1 units/kg/hour", "titration": "based on glucose"}
-            },
-            therapeutic_range=(70, 140),
-            unit="mg/dL (glucose)",
-            half_life=1.0,
-            contraindications=["hypoglycemia"],
-            side_effects=["hypoglycemia", "weight gain"],
-            monitoring_required=True,
-            cost_per_unit=2.0
-        )
-        
-        return drugs
+    def warm_caches(self) -> None:
+        """compile the jit kernels ahead of a large batch so its first sweep is not cold"""
+        if not HAS_NUMBA:
+            return
+        empty = np.empty(0, dtype=np.float64)
+        _decay_levels(empty, empty, empty, empty, empty)
+        # the columnar filter only runs on catalogs large enough to use it
+        if len(self._drug_names) >= _COLUMNAR_FILTER_MIN_DRUGS:
+            _filter_indices(self._category_ids[:0], self._route_masks[:0], -1, 0)
     
-    def _initialize_interactions(self) -> List[DrugInteraction]:
-        """initialize drug interaction database"""
-        interactions = []
-        
-        # aspirin interactions
-        interactions.append(DrugInteraction(
-            drug1="aspirin",
-            drug2="heparin",
-            severity=InteractionSeverity.MODERATE,
-            mechanism="Increased bleeding risk",
-            effect="Enhanced anticoagulation",
-            recommendation="Monitor bleeding parameters closely"
-        ))
-        
-        interactions.append(DrugInteraction(
-            drug1="aspirin",
-            drug2="metoprolol",
-            severity=InteractionSeverity.MILD,
-            mechanism="No direct interaction",
-            effect="May be used together safely",
-            recommendation="Monitor for additive cardiovascular effects"
-        ))
-        
-        # nitroglycerin interactions
-        interactions.append(DrugInteraction(
-            drug1="nitroglycerin",
-            drug2="sildenafil",
-            severity=InteractionSeverity.CONTRAINDICATED,
-            mechanism="Enhanced vasodilation",
-            effect="Severe hypotension",
-            recommendation="Contraindicated - avoid combination"
-        ))
-        
-        # morphine interactions
-        interactions.append(DrugInteraction(
-            drug1="morphine",
-            drug2="alcohol",
-            severity=InteractionSeverity.SEVERE,
-            mechanism="Enhanced CNS depression",
-            effect="Increased sedation and respiratory depression",
-            recommendation="Avoid alcohol while taking morphine"
-        ))
-        
-        interactions.append(DrugInteraction(
-            drug1="morphine",
-            drug2="metoprolol",
-            severity=InteractionSeverity.MILD,
-            mechanism="No significant interaction",
-            effect="May be used together",
-            recommendation="Monitor for additive effects"
-        ))
-        
-        return interactions
+    def seed(self, seed: Optional[int]) -> None:
+        """reseed the generator used to simulate initial drug levels"""
+        self._rng = np.random.default_rng(seed)
     
-    def _initialize_protocols(self) -> Dict[str, TreatmentProtocol]:
-        """initialize treatment protocols"""
-        protocols = {}
-        
-        # chest pain protocol
-        protocols["chest_pain"] = TreatmentProtocol(
-            name="Chest Pain Protocol",
-            condition="Acute chest pain",
-            description="Standard protocol for evaluation and treatment of chest pain",
-            steps=[
-                {"action": "ECG", "time": 0, "description": "Immediate 12-lead ECG"},
-                {"action": "Aspirin", "time": 5, "description": "325 mg aspirin PO"},
-                {"action": "Nitroglycerin", "time": 10, "description": "0.4 mg SL, repeat x2 if needed"},
-                {"action": "Morphine", "time": 15, "description": "2-4 mg IV if pain persists"},
-                {"action": "Heparin", "time": 20, "description": "80 units/kg bolus + 18 units/kg/hour"}
-            ],
-            evidence_level="high",
-            success_rate=0.85,
-            duration=2,
-            cost=500.0,
-            complications=["bleeding", "allergic reaction", "hypotension"]
-        )
-        
-        # asthma exacerbation protocol
-        protocols["asthma_exacerbation"] = TreatmentProtocol(
-            name="Asthma Exacerbation Protocol",
-            condition="Acute asthma exacerbation",
-            description="Standard protocol for treatment of asthma exacerbation",
-            steps=[
-                {"action": "Albuterol", "time": 0, "description": "2 puffs inhaled"},
-                {"action": "Oxygen", "time": 5, "description": "2-4 L/min via nasal cannula"},
-                {"action": "Prednisone", "time": 10, "description": "40-60 mg PO"},
-                {"action": "Ipratropium", "time": 15, "description": "2 puffs inhaled"}
-            ],
-            evidence_level="high",
-            success_rate=0.90,
-            duration=4,
-            cost=200.0,
-            complications=["tremor", "tachycardia", "hyperglycemia"]
-        )
-        
-        # sepsis protocol
-        protocols["sepsis"] = TreatmentProtocol(
-            name="Sepsis Protocol",
-            condition="Severe sepsis/septic shock",
-            description="Surviving Sepsis Campaign guidelines",
-            steps=[
-                {"action": "Ceftriaxone", "time": 0, "description": "2 g IV"},
-                {"action": "Fluids", "time": 5, "description": "30 mL/kg crystalloid"},
-                {"action": "Vasopressor", "time": 30, "description": "Norepinephrine if needed"},
-                {"action": "Corticosteroids", "time": 60, "description": "Hydrocortisone if indicated"}
-            ],
-            evidence_level="high",
-            success_rate=0.75,
-            duration=6,
-            cost=1000.0,
-            complications=["allergic reaction", "adrenal insufficiency", "arrhythmia"]
-        )
-        
-        return protocols
+    def now_hours(self) -> float:
+        """current engine time in epoch hours"""
+        if self._now_hours is None:
+            return time.time() / _SECONDS_PER_HOUR
+        return self._now_hours
+    
+    def tick(self, dt_hours: float) -> float:
+        """advance the simulation clock, detaching it from the wall clock"""
+        self._now_hours = self.now_hours() + dt_hours
+        return self._now_hours
     
-    def administer_drug(self, patient_id: str, drug_name: str, dose: float, 
-                       route: str, timestamp: datetime = None) -> str:
+    def _hours(self, when: Optional[datetime]) -> float:
+        # datetimes are only accepted at the api boundary; internally time is epoch hours
+        return when.timestamp() / _SECONDS_PER_HOUR if when is not None else self.now_hours()
+    
+    def _seconds(self, when: Optional[datetime]) -> float:
+        # treatment records keep epoch seconds and format only when displayed
+        return when.timestamp() if when is not None else self.now_hours() * _SECONDS_PER_HOUR
+    
+    def get_drug(self, name: str) -> Optional[Drug]:
+        """get a drug by name, ignoring case"""
+        return self.drugs.get(name.lower())
+    
+    def administer_drug(self, patient_id: str, drug_name: str, dose: Union[float, str], 
+                       route: str, timestamp: Optional[datetime] = None) -> str:
         """administer a drug to a patient"""
-        if drug_name not in self.drugs:
+        return self._administer(patient_id, drug_name, dose, route, self._seconds(timestamp))
+    
+    def administer_drugs_batch(self, patient_id: str, orders: List[Tuple[str, Union[float, str], str]],
+                               timestamp: Optional[datetime] = None) -> List[str]:
+        """administer several (drug_name, dose, route) orders at one shared time"""
+        administered_at_ts = self._seconds(timestamp)
+        # one draw for the whole batch instead of two generator calls per order
+        draws = self._rng.random((len(orders), 2)).tolist()
+        administer = self._administer
+        return [administer(patient_id, drug_name, dose, route, administered_at_ts, draw)
+                for (drug_name, dose, route), draw in zip(orders, draws)]
+    
+    def _administer(self, patient_id: str, drug_name: str, dose: Union[float, str], route: str,
+                    administered_at_ts: float, draws: Optional[List[float]] = None) -> str:
+        drug_name = drug_name.lower()
+        drug = self.drugs.get(drug_name)
+        if drug is None:
             return f"Error: Drug '{drug_name}' not found"
         
-        drug = self.drugs[drug_name]
-        route_enum = Route(route.lower())
+        # interned so every record shares the catalog key's storage
+        drug_name = sys.intern(drug_name)
+        route_enum = _ROUTE_LOOKUP.get(route) or _ROUTE_LOOKUP.get(route.lower())
+        if route_enum is None:
+            return f"Error: Unknown route '{route}'"
+        # only known routes are interned, so bad input cannot grow the intern table
+        route = sys.intern(route)
         
-        if route_enum not in drug.routes:
+        if route_enum not in drug.route_set:
             return f"Error: Route '{route}' not available for {drug_name}"
         
+        # parse string doses once so records hold a number for later arithmetic
+        if isinstance(dose, str):
+            try:
+                dose_value, dose_unit = _parse_dose(dose)
+            except ValueError:
+                return f"Error: Invalid dose '{dose}'"
+        else:
+            dose_value, dose_unit = dose, ""
+        
         # check for drug interactions
         interactions = self._check_drug_interactions(patient_id, drug_name)
-        if interactions:
-            interaction_warnings = []
-            for interaction in interactions:
-                if interaction.severity in [InteractionSeverity.SEVERE, InteractionSeverity.CONTRAINDICATED]:
-                    interaction_warnings.append(f"CRITICAL: {interaction.effect}")
-                else:
-                    interaction_warnings.append(f"Warning: {interaction.effect}")
-        
-        # record administration
-        administration = {
-            'drug_name': drug_name,
-            'dose': dose,
-            'route': route,
-            'timestamp': timestamp or datetime.now(),
-            'category': drug.category.value,
-            'interactions': interactions if interactions else []
-        }
         
-        if patient_id not in self.active_treatments:
-            self.active_treatments[patient_id] = []
-        
-        self.active_treatments[patient_id].append(administration)
+        self.active_treatments[patient_id].append(drug_name, dose_value, route, administered_at_ts,
+                                                  drug.category.value, tuple(interactions), dose_unit)
+        self._active_drug_names[patient_id][drug_name] = None
         
         # initialize drug level monitoring if required
         if drug.monitoring_required:
-            if patient_id not in self.drug_levels:
-                self.drug_levels[patient_id] = []
-            
-            # simulate initial drug level
-            initial_level = random.uniform(drug.therapeutic_range[0], drug.therapeutic_range[1]) if drug.therapeutic_range else 0.0
+            therapeutic_range = drug.therapeutic_range
+            # simulate initial drug level and clearance from two unit draws
+            level_draw, clearance_draw = draws if draws is not None else self._rng.random(2).tolist()
+            if therapeutic_range:
+                low, high = therapeutic_range
+                initial_level = low + level_draw * (high - low)
+            else:
+                initial_level = 0.0
             
-            drug_level = DrugLevel(
+            self.drug_levels[patient_id][drug_name] = DrugLevel(
                 drug_name=drug_name,
                 current_level=initial_level,
-                therapeutic_range=drug.therapeutic_range or (0.0, 0.0),
+                therapeutic_range=therapeutic_range or (0.0, 0.0),
                 unit=drug.unit,
-                timestamp=timestamp or datetime.now(),
+                timestamp_hours=administered_at_ts / _SECONDS_PER_HOUR,
                 half_life=drug.half_life,
-                clearance_rate=random.uniform(0.5, 2.0)
+                clearance_rate=0.5 + clearance_draw * 1.5
             )
-            
-            self.drug_levels[patient_id].append(drug_level)
+            self._dirty_alert_patients.add(patient_id)
         
         result = f"✓ Administered {dose} {drug_name} via {route}"
-        if interactions:
-            result += f"\n⚠️ Drug interactions detected: {', '.join(interaction_warnings)}"
-        
-        return result
+        if not interactions:
+            return result
+        
+        # build the warning line in one join rather than growing the message
+        warnings = ", ".join(
+            f"CRITICAL: {interaction.effect}" if interaction.severity >= InteractionSeverity.SEVERE
+            else f"Warning: {interaction.effect}"
+            for interaction in interactions)
+        return f"{result}\n⚠️ Drug interactions detected: {warnings}"
+    
+    def check_contraindications(self, drug_name: str, patient_conditions: List[str]) -> List[str]:
+        """get the patient conditions that contraindicate a drug"""
+        mask = self._contraindication_masks.get(drug_name.lower(), 0)
+        if not mask:
+            return []
+        bits = self._condition_bits
+        return [condition for condition in patient_conditions if bits.get(condition.lower(), 0) & mask]
+    
+    def condition_mask(self, patient_conditions: List[str]) -> int:
+        """bitmask of the patient conditions that contraindicate any catalog drug"""
+        bits = self._condition_bits
+        mask = 0
+        for condition in patient_conditions:
+            mask |= bits.get(condition.lower(), 0)
+        return mask
+    
+    def contraindicated_drugs(self, patient_conditions: List[str]) -> List[str]:
+        """get every catalog drug contraindicated for the patient's conditions"""
+        patient_mask = self.condition_mask(patient_conditions)
+        if not patient_mask:
+            return []
+        return [name for name, mask in self._contraindication_masks.items() if mask & patient_mask]
     
     def _check_drug_interactions(self, patient_id: str, new_drug: str) -> List[DrugInteraction]:
         """check for drug interactions with currently active drugs"""
-        interactions = []
-        
-        if patient_id in self.active_treatments:
-            active_drugs = [treatment['drug_name'] for treatment in self.active_treatments[patient_id]]
-            
-            for interaction in self.interactions:
-                if ((interaction.drug1 == new_drug and interaction.drug2 in active_drugs) or
-                    (interaction.drug2 == new_drug and interaction.drug1 in active_drugs)):
-                    interactions.append(interaction)
-        
+        # most administrations are a patient's first drug or a drug with no known interactions
+        active_drugs = self._active_drug_names.get(patient_id)
+        if not active_drugs or new_drug not in self._interactions_by_drug:
+            return []
+        
+        interactions: List[DrugInteraction] = []
+        by_pair = self._interactions_by_pair
+        for active_drug in active_drugs:
+            interactions.extend(by_pair.get(frozenset((new_drug, active_drug)), ()))
         return interactions
     
-    def get_active_treatments(self, patient_id: str) -> List[Dict[str, Any]]:
+    def get_active_treatments(self, patient_id: str) -> List[TreatmentRecord]:
         """get active treatments for a patient"""
-        return self.active_treatments.get(patient_id, [])
+        columns = self.active_treatments.get(patient_id)
+        return columns.rows() if columns is not None else []
     
     def get_drug_levels(self, patient_id: str) -> List[DrugLevel]:
         """get drug levels for a patient"""
-        return self.drug_levels.get(patient_id, [])
+        patient_levels = self.drug_levels.get(patient_id)
+        return list(patient_levels.values()) if patient_levels is not None else []
     
-    def update_drug_levels(self, patient_id: str, current_time: datetime = None) -> List[str]:
+    def update_drug_levels(self, patient_id: str, current_time: Optional[datetime] = None) -> List[str]:
         """update drug levels based on pharmacokinetics"""
-        if current_time is None:
-            current_time = datetime.now()
-        
+        patient_levels = self.drug_levels.get(patient_id)
+        if not patient_levels:
+            return []
+        updates = [update for _, update in self._decay_drug_levels(list(patient_levels.values()),
+                                                                  self._hours(current_time))]
+        if updates:
+            self._dirty_alert_patients.add(patient_id)
+        return updates
+    
+    def update_all_drug_levels(self, current_time: Optional[datetime] = None) -> Dict[str, List[str]]:
+        """update drug levels for every patient in one batch"""
+        owners: List[str] = []
+        drug_levels: List[DrugLevel] = []
+        for patient_id, patient_levels in self.drug_levels.items():
+            owners.extend([patient_id] * len(patient_levels))
+            drug_levels.extend(patient_levels.values())
+        
+        updates: Dict[str, List[str]] = {}
+        for i, update in self._decay_drug_levels(drug_levels, self._hours(current_time)):
+            updates.setdefault(owners[i], []).append(update)
+        self._dirty_alert_patients.update(updates)
+        return updates
+    
+    @staticmethod
+    def _decay_drug_levels(drug_levels: List[DrugLevel], current_hours: float) -> List[Tuple[int, str]]:
+        """decay levels in place; returns (index, message) for each level that changed"""
+        count = len(drug_levels)
+        if count < _VECTORIZE_MIN_LEVELS:
+            return EnhancedTreatmentEngine._decay_drug_levels_py(drug_levels, current_hours)
+        
+        # gather the pk state into arrays and decay every level in one pass
+        levels = np.fromiter((d.current_level for d in drug_levels), dtype=np.float64, count=count)
+        half_lives = np.fromiter((d.half_life for d in drug_levels), dtype=np.float64, count=count)
+        elapsed = current_hours - np.fromiter((d.timestamp_hours for d in drug_levels),
+                                              dtype=np.float64, count=count)
+        lows = np.fromiter((d.therapeutic_range[0] for d in drug_levels), dtype=np.float64, count=count)
+        highs = np.fromiter((d.therapeutic_range[1] for d in drug_levels), dtype=np.float64, count=count)
+        new_levels, therapeutic, toxic = _decay_levels(levels, half_lives, elapsed, lows, highs)
+        
+        # only the changed levels are written back
+        changed = np.flatnonzero((half_lives > 0) & (new_levels != levels)).tolist()
+        if not changed:
+            return []
+        new_list, therapeutic_list, toxic_list = new_levels.tolist(), therapeutic.tolist(), toxic.tolist()
         updates = []
-        
-        if patient_id in self.drug_levels:
-            for drug_level in self.drug_levels[patient_id]:
-                # calculate time elapsed
-                time_elapsed = (current_time - drug_level.timestamp).total_seconds() / 3600  # hours
-                
-                # calculate new level based on half-life
-                if drug_level.half_life > 0:
-                    decay_factor = math.exp(-time_elapsed * math.log(2) / drug_level.half_life)
-                    new_level = drug_level.current_level * decay_factor
-                    
-                    if new_level != drug_level.current_level:
-                        old_level = drug_level.current_level
-                        drug_level.current_level = new_level
-                        drug_level.timestamp = current_time
-                        
-                        # update therapeutic status
-                        if drug_level.therapeutic_range:
-                            drug_level.is_therapeutic = (drug_level.therapeutic_range[0] <= new_level <= drug_level.therapeutic_range[1])
-                            drug_level.is_toxic = new_level > drug_level.therapeutic_range[1]
-                        
-                        updates.append(f"Drug level {drug_level.drug_name}: {old_level:.2f} → {new_level:.2f}")
-        
+        for i in changed:
+            drug_level = drug_levels[i]
+            old_level, new_level = drug_level.current_level, new_list[i]
+            drug_level.current_level = new_level
+            drug_level.timestamp_hours = current_hours
+            drug_level.is_therapeutic = therapeutic_list[i]
+            drug_level.is_toxic = toxic_list[i]
+            updates.append((i, f"Drug level {drug_level.drug_name}: {old_level:.2f} → {new_level:.2f}"))
+        return updates
+    
+    @staticmethod
+    def _decay_drug_levels_py(drug_levels: List[DrugLevel], current_hours: float) -> List[Tuple[int, str]]:
+        """per-level decay for the few drugs a single patient is usually on"""
+        updates = []
+        for i, drug_level in enumerate(drug_levels):
+            if drug_level.half_life <= 0:
+                continue
+            old_level = drug_level.current_level
+            elapsed = current_hours - drug_level.timestamp_hours
+            new_level = old_level * math.exp(-elapsed * _LN2 / drug_level.half_life)
+            if new_level == old_level:
+                continue
+            low, high = drug_level.therapeutic_range
+            drug_level.current_level = new_level
+            drug_level.timestamp_hours = current_hours
+            drug_level.is_therapeutic = low <= new_level <= high
+            drug_level.is_toxic = new_level > high
+            updates.append((i, f"Drug level {drug_level.drug_name}: {old_level:.2f} → {new_level:.2f}"))
         return updates
     
     def start_treatment_protocol(self, patient_id: str, protocol_name: str) -> str:
@@ -534,47 +619,69 @@ class EnhancedTreatmentEngine:
         
         return f"✓ Started {protocol_name} protocol for patient {patient_id}"
     
-    def get_available_drugs(self) -> Dict[str, Drug]:
-        """get all available drugs"""
-        return self.drugs.copy()
+    def get_available_drugs(self) -> Mapping[str, Drug]:
+        """get all available drugs as a read-only view of the catalog"""
+        return self.drugs
+    
+    def get_drugs_copy(self) -> Dict[str, Drug]:
+        """get a mutable copy of the drug catalog"""
+        return dict(self.drugs)
     
-    def get_available_protocols(self) -> Dict[str, TreatmentProtocol]:
-        """get all available protocols"""
-        return self.protocols.copy()
+    def get_available_protocols(self) -> Mapping[str, TreatmentProtocol]:
+        """get all available protocols as a read-only view"""
+        return self.protocols
     
     def search_drugs(self, query: str) -> Dict[str, Drug]:
         """search drugs by name or category"""
         query = query.lower()
-        results = {}
-        for name, drug in self.drugs.items():
-            if (query in name.lower() or 
-                query in drug.category.value.lower()):
-                results[name] = drug
-        return results
+        # names are lowercase keys already; only a handful of categories need testing
+        category_matches = set()
+        for category, names in self._drugs_by_category.items():
+            if query in category:
+                category_matches.update(names)
+        return {name: drug for name, drug in self.drugs.items()
+                if query in name or name in category_matches}
+    
+    def filter_drugs(self, category: Optional[DrugCategory] = None,
+                     route: Optional[Route] = None) -> Dict[str, Drug]:
+        """get drugs in a category and/or available by a route"""
+        if len(self._drug_names) < _COLUMNAR_FILTER_MIN_DRUGS:
+            return {name: drug for name, drug in self.drugs.items()
+                    if (category is None or drug.category == category) and
+                    (route is None or route in drug.route_set)}
+        
+        category_id = _CATEGORY_IDS[category] if category is not None else -1
+        route_bit = _ROUTE_BITS[route] if route is not None else 0
+        indices = _filter_indices(self._category_ids, self._route_masks, category_id, route_bit)
+        return {self._drug_names[i]: self.drugs[self._drug_names[i]] for i in indices}
     
     def get_drug_interactions(self, drug_name: str) -> List[DrugInteraction]:
-        """get all interactions for a specific drug"""
-        interactions = []
-        for interaction in self.interactions:
-            if interaction.drug1 == drug_name or interaction.drug2 == drug_name:
-                interactions.append(interaction)
-        return interactions
+        """get all interactions for a specific drug, ignoring case"""
+        return list(self._interactions_by_drug.get(drug_name.lower(), ()))
     
     def get_critical_alerts(self) -> List[Dict[str, Any]]:
         """get critical drug alerts"""
+        # only patients whose levels changed since the last call are rescanned
+        for patient_id in self._dirty_alert_patients:
+            self._alerts_by_patient[patient_id] = self._patient_alerts(patient_id)
+        self._dirty_alert_patients.clear()
+        
+        alerts: List[Dict[str, Any]] = []
+        for patient_id in self.drug_levels:
+            alerts.extend(self._alerts_by_patient.get(patient_id, ()))
+        return alerts
+    
+    def _patient_alerts(self, patient_id: str) -> List[Dict[str, Any]]:
         alerts = []
-        
-        for patient_id, drug_levels in self.drug_levels.items():
-            for drug_level in drug_levels:
-                if drug_level.is_toxic or not drug_level.is_therapeutic:
-                    alerts.append({
-                        'patient_id': patient_id,
-                        'drug_name': drug_level.drug_name,
-                        'level': drug_level.current_level,
-                        'unit': drug_level.unit,
-                        'therapeutic_range': drug_level.therapeutic_range,
-                        'status': 'toxic' if drug_level.is_toxic else 'subtherapeutic',
-                        'timestamp': drug_level.timestamp
-                    })
-        
-        return alerts 
\ No newline at end of file
+        for drug_level in self.get_drug_levels(patient_id):
+            if drug_level.is_toxic or not drug_level.is_therapeutic:
+                alerts.append({
+                    'patient_id': patient_id,
+                    'drug_name': drug_level.drug_name,
+                    'level': drug_level.current_level,
+                    'unit': drug_level.unit,
+                    'therapeutic_range': drug_level.therapeutic_range,
+                    'status': 'toxic' if drug_level.is_toxic else 'subtherapeutic',
+                    'timestamp': drug_level.timestamp
+                })
+        return alerts
@@ -0,0 +1,63 @@
+"""
+numba/numpy kernels for bulk scenario generation
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+from ..core._compat import HAS_NUMBA, njit, prange
+
+
+# columns of the uniform draws each bulk scenario consumes; phase times take one column
+# each from _U_TIMES on, as many as the base times passed in
+_U_AGE, _U_GENDER, _U_DIAGNOSIS, _U_STAY, _U_MORTALITY, _U_READMISSION, _U_TIMES = range(7)
+
+_READMISSION_RATE = 0.1
+
+
+def _sample_scenarios_np(uniforms: np.ndarray, age_lo: int, age_hi: int, gender_cum: np.ndarray,
+                         diagnosis_cum: np.ndarray, diagnosis_stay: np.ndarray, diagnosis_mortality: np.ndarray,
+                         base_times: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """map uniform draws to ages, gender and diagnosis indices, stays, outcomes and phase times"""
+    ages = np.minimum(age_lo + (uniforms[:, _U_AGE] * (age_hi - age_lo + 1)).astype(np.int64), age_hi)
+    # same bisection random.choices does over cumulative weights
+    genders = np.minimum(np.searchsorted(gender_cum, uniforms[:, _U_GENDER] * gender_cum[-1], side='right'),
+                         gender_cum.shape[0] - 1)
+    diagnoses = np.minimum(
+        np.searchsorted(diagnosis_cum, uniforms[:, _U_DIAGNOSIS] * diagnosis_cum[-1], side='right'),
+        diagnosis_cum.shape[0] - 1)
+    stays = diagnosis_stay[diagnoses] * (0.8 + 0.4 * uniforms[:, _U_STAY])
+    mortality = uniforms[:, _U_MORTALITY] < diagnosis_mortality[diagnoses]
+    readmission = uniforms[:, _U_READMISSION] < _READMISSION_RATE
+    times = base_times * (0.7 + 0.6 * uniforms[:, _U_TIMES:])
+    return ages, genders, diagnoses, stays, mortality, readmission, times
+
+
+@njit(parallel=True, cache=True)
+def _sample_scenarios_kernel(uniforms, age_lo, age_hi, gender_cum, diagnosis_cum, diagnosis_stay,
+                             diagnosis_mortality, base_times):
+    count = uniforms.shape[0]
+    ages = np.empty(count, dtype=np.int64)
+    genders = np.empty(count, dtype=np.int64)
+    diagnoses = np.empty(count, dtype=np.int64)
+    stays = np.empty(count, dtype=np.float64)
+    mortality = np.empty(count, dtype=np.bool_)
+    readmission = np.empty(count, dtype=np.bool_)
+    times = np.empty((count, base_times.shape[0]), dtype=np.float64)
+    for i in prange(count):
+        ages[i] = min(age_lo + int(uniforms[i, _U_AGE] * (age_hi - age_lo + 1)), age_hi)
+        genders[i] = min(np.searchsorted(gender_cum, uniforms[i, _U_GENDER] * gender_cum[-1], side='right'),
+                         gender_cum.shape[0] - 1)
+        diagnosis = min(np.searchsorted(diagnosis_cum, uniforms[i, _U_DIAGNOSIS] * diagnosis_cum[-1],
+                                        side='right'), diagnosis_cum.shape[0] - 1)
+        diagnoses[i] = diagnosis
+        stays[i] = diagnosis_stay[diagnosis] * (0.8 + 0.4 * uniforms[i, _U_STAY])
+        mortality[i] = uniforms[i, _U_MORTALITY] < diagnosis_mortality[diagnosis]
+        readmission[i] = uniforms[i, _U_READMISSION] < _READMISSION_RATE
+        for j in range(base_times.shape[0]):
+            times[i, j] = base_times[j] * (0.7 + 0.6 * uniforms[i, _U_TIMES + j])
+    return ages, genders, diagnoses, stays, mortality, readmission, times
+
+
+_sample_scenarios = _sample_scenarios_kernel if HAS_NUMBA else _sample_scenarios_np
@@ -5,15 +5,116 @@ data anonymizer for ensuring clinical data privacy
 import re
 import hashlib
 import uuid
-import random
-from typing import Dict, Any, List, Optional, Union
+import multiprocessing
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
+from enum import Enum
+from functools import lru_cache
 import logging
 from datetime import datetime
-import json
+
+import numpy as np
+import pandas as pd
+
+from ..core._compat import fromisoformat, linear_re
 
 logger = logging.getLogger(__name__)
 
+# every pii pattern needs a digit, or an @ for emails, so text without either is skipped
+_PII_PROBE = re.compile(r'[\d@]')
+
+# from this length text is scanned with re2 when installed; below it python's re is
+# several times faster, and its worst-case backtracking is still only milliseconds
+_LINEAR_SCAN_MIN_CHARS = 4096
+
+# short strings such as symptoms and drug names recur across records, so their cleaned
+# form is memoized; longer free text is rarely repeated and would only fill the cache
+_CLEAN_TEXT_MEMO_SIZE = 65536
+_CLEAN_TEXT_MEMO_MAX_CHARS = 1024
+
+# key medical terms that must survive anonymization
+_MEDICAL_CHECK_TERMS = ('pain', 'fever', 'shortness', 'chest', 'heart', 'blood')
+
+# words of three or more letters in any script, the candidates for names; words opening
+# with an ascii lowercase letter can never be title case and are skipped by the scan,
+# while whether any other word is title case, and so a name, is decided per match
+_NAME_PATTERN = re.compile(r'\b[^\W\d_a-z][^\W\d_]{2,}\b')
+
+# below this many records starting worker processes costs more than it saves;
+# workers are spawned, never forked, since the host may already be running threads
+_PARALLEL_MIN_RECORDS = 500
+# record lists are anonymized in chunks of this many, each with age noise seeded from the
+# anonymizer seed and the chunk index, so output never depends on which process ran a chunk
+_RECORD_CHUNK = 256
+
+# age noise is drawn this many values at a time and handed out one per record
+_AGE_NOISE_BATCH = _RECORD_CHUNK
+
+# identifier tokens hash from a copy of this empty state, skipping blake2b setup per call
+_TOKEN_HASH = hashlib.blake2b(digest_size=4)
+
+
+# a module-level cache rather than a per-instance one, which would not pickle into workers
+@lru_cache(maxsize=4096)
+def _identifier_token(hash_input: str) -> str:
+    """deterministic 8 hex digit token for an identifier"""
+    token_hash = _TOKEN_HASH.copy()
+    token_hash.update(hash_input.encode())
+    return f"anon_{token_hash.hexdigest()}"
+
+
+@lru_cache(maxsize=4096)
+def _iso_date(timestamp: str) -> str:
+    """date part of an iso timestamp, or the text unchanged if it does not parse"""
+    try:
+        return fromisoformat(timestamp).strftime('%Y-%m-%d')
+    except ValueError:
+        return timestamp
+
+
+def _has_medical_term(text: str) -> bool:
+    """whether text mentions any key medical term, ignoring case"""
+    # lowercase once; substring search beats a case-insensitive regex when nothing matches
+    lowered = text.lower()
+    return any(term in lowered for term in _MEDICAL_CHECK_TERMS)
+
+
+def _iter_strings(value: Any) -> Iterator[str]:
+    """every leaf of a nested record as text, without serializing keys or escaping"""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _iter_strings(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _iter_strings(item)
+    else:
+        yield str(value)
+
+
+def _has_strings(value: Any) -> bool:
+    """whether any leaf of a nested record is text"""
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            return True
+        if isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+    return False
+
+
+class DemographicAction(Enum):
+    """what happens to a demographic field during anonymization"""
+    KEEP = "keep"
+    DROP = "drop"
+    HASH = "hash"
+    AGE_NOISE = "age_noise"  # kept as is when age noise is disabled
+    GENERALIZE_ADDRESS = "generalize_address"  # dropped unless regions are preserved
+
 
 @dataclass
 class AnonymizationConfig:
@@ -27,6 +128,10 @@ class AnonymizationConfig:
     preserve_geographic_region: bool = False
     preserve_zip_code_prefix: bool = False
     max_zip_digits: int = 3
+    # worker processes for large record lists; 0 or 1 anonymizes in-process
+    parallel_workers: int = 0
+    # seed for age noise, for reproducible output; None seeds each anonymizer afresh
+    seed: Optional[int] = None
 
 
 @dataclass
@@ -47,8 +152,8 @@ class DataAnonymizer:
     def __init__(self, config: Optional[AnonymizationConfig] = None):
         self.config = config or AnonymizationConfig()
         
-        # patterns for PII detection
-        self.pii_patterns = {
+        # patterns for PII detection, compiled once per anonymizer
+        self.pii_patterns = {name: re.compile(pattern) for name, pattern in {
             'phone': r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
             'ssn': r'\b\d{3}-\d{2}-\d{4}\b',
             'email': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
@@ -57,18 +162,117 @@ class DataAnonymizer:
             'patient_id': r'\bPAT[:\s]*\d+\b',
             'address': r'\b\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr)\b',
             'zip_code': r'\b\d{5}(?:-\d{4})?\b'
+        }.items()}
+        
+        # placeholder written in place of each kind of PII
+        self.pii_placeholders = {
+            'phone': '[PHONE]',
+            'ssn': '[SSN]',
+            'email': '[EMAIL]',
+            'credit_card': '[CARD]',
+            'medical_record': '[MRN]',
+            'patient_id': '[PATIENT_ID]',
+            'address': '[ADDRESS]',
+            'zip_code': '[ZIP]'
         }
         
+        # all patterns as one alternation of named groups so text is scanned once
+        self._combined_pattern = self._combine_patterns(self.pii_patterns)
+        # re2 copy for long text, where backtracking can go quadratic on hostile input
+        self._linear_pattern = (linear_re.compile(self._combined_pattern.pattern)
+                                if linear_re is not None else None)
+        
         # medical terms that should be preserved
-        self.medical_terms = {
+        self.medical_terms = frozenset({
             'diagnoses', 'symptoms', 'medications', 'procedures', 'allergies',
             'vital_signs', 'lab_results', 'imaging_findings', 'treatment_plans'
-        }
+        })
+        # only title-case words are treated as names, so those spellings are
+        # precomputed and candidates are checked without lowercasing each one
+        self._title_medical_terms = frozenset(term.title() for term in self.medical_terms)
         
         # demographic fields that can be preserved with modification
         self.demographic_fields = {
             'age', 'gender', 'race', 'ethnicity', 'insurance_type'
         }
+        
+        # action for each demographic field; unlisted fields are kept
+        self.demographic_actions = {
+            'patient_id': DemographicAction.HASH,
+            'name': DemographicAction.DROP,
+            'age': DemographicAction.AGE_NOISE,
+            'gender': DemographicAction.KEEP,
+            'race': DemographicAction.KEEP,
+            'ethnicity': DemographicAction.KEEP,
+            'address': DemographicAction.GENERALIZE_ADDRESS,
+            'phone': DemographicAction.DROP,
+            'email': DemographicAction.DROP,
+            'ssn': DemographicAction.DROP,
+            'insurance': DemographicAction.KEEP
+        }
+        
+        self._cached_clean_text = lru_cache(maxsize=_CLEAN_TEXT_MEMO_SIZE)(self._clean_text_for)
+        
+        # an unseeded anonymizer still fixes its entropy here, so worker copies share its seed
+        self._noise_seed = self.config.seed if self.config.seed is not None else np.random.SeedSequence().entropy
+        self._reseed_age_noise()
+        
+        # anonymizer for each known record section; anything else is treated generically
+        self._section_handlers = {
+            'demographics': self._anonymize_demographics,
+            'presentation': self._anonymize_presentation,
+            'diagnosis': self._anonymize_diagnosis,
+            'treatment': self._anonymize_treatment,
+            'outcome': self._anonymize_outcome,
+            'temporal_data': self._anonymize_temporal_data
+        }
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # the memo does not pickle, and each spawned worker builds its own anyway
+        state = self.__dict__.copy()
+        del state['_cached_clean_text']
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._cached_clean_text = lru_cache(maxsize=_CLEAN_TEXT_MEMO_SIZE)(self._clean_text_for)
+    
+    def _reseed_age_noise(self, *chunk: int) -> None:
+        """restart age noise from the anonymizer seed, or from the seed and a record chunk index"""
+        self._age_noise_rng = np.random.default_rng([self._noise_seed, *chunk])
+        self._age_noise_buffers: Dict[int, List[int]] = {}
+    
+    @staticmethod
+    def _combine_patterns(patterns: Dict[str, re.Pattern]) -> re.Pattern:
+        """join patterns into one regex whose group names identify the match"""
+        branches = {name: pattern.pattern for name, pattern in patterns.items()}
+        # the patterns all open with a word boundary; testing it once ahead of the
+        # alternation rather than in every branch makes the scan about four times faster
+        boundary = r'\b' if all(branch.startswith(r'\b') for branch in branches.values()) else ''
+        if boundary:
+            branches = {name: branch[len(boundary):] for name, branch in branches.items()}
+        return re.compile(boundary + '(?:' + '|'.join(f'(?P<{name}>{branch})' for name, branch in branches.items()) + ')')
+    
+    def _pii_pattern(self, text: str) -> re.Pattern:
+        """combined pattern suited to scanning text of this length"""
+        if self._linear_pattern is not None and len(text) >= _LINEAR_SCAN_MIN_CHARS:
+            return self._linear_pattern
+        return self._combined_pattern
+    
+    def _replace_pii(self, match: re.Match) -> str:
+        """placeholder for whichever pattern produced the match"""
+        name = match.lastgroup
+        if name == 'zip_code' and self.config.preserve_zip_code_prefix:
+            # keep the three-digit prefix, masking the rest and any +4 extension
+            return match.group()[:3] + 'XX'
+        return self.pii_placeholders[name]
+    
+    def _replace_name(self, match: re.Match) -> str:
+        """name placeholder for a title-case word that is neither an acronym nor a medical term"""
+        word = match.group(0)
+        if word.istitle() and not word.isupper() and word not in self._title_medical_terms:
+            return '[NAME]'
+        return word
     
     def anonymize_dataset(self, data: Union[List[Dict], Dict], 
                          dataset_name: str = "dataset") -> Union[List[Dict], Dict]:
@@ -80,9 +284,52 @@ class DataAnonymizer:
         else:
             raise ValueError("Data must be list of records or single record dict")
     
+    def anonymize_frame(self, frame: pd.DataFrame, dataset_name: str = "dataset",
+                        text_columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """anonymize a flat table of demographic and free-text columns a column at a time"""
+        # text columns default to the string and object columns with no demographic action
+        actions = self.demographic_actions
+        if text_columns is None:
+            text_columns = [column for column in frame.columns if column not in actions and
+                            (frame[column].dtype == object or pd.api.types.is_string_dtype(frame[column]))]
+        text_column_set = set(text_columns)
+        
+        anonymized = {}
+        for column in frame.columns:
+            values = frame[column]
+            action = actions.get(column)
+            if action is DemographicAction.DROP:
+                continue
+            elif action is DemographicAction.HASH:
+                # rows hash against the same record ids the list api uses
+                anonymized[column] = [self._hash_identifier(value, f"{dataset_name}_record_{i}")
+                                      for i, value in enumerate(values)]
+            elif action is DemographicAction.AGE_NOISE and self.config.add_noise_to_ages:
+                anonymized[column] = self._add_age_noise_column(values)
+            elif action is DemographicAction.GENERALIZE_ADDRESS:
+                if self.config.preserve_geographic_region:
+                    anonymized[column] = values.map(self._generalize_address)
+            elif column in text_column_set:
+                # repeated values are common in table columns, so each distinct one is cleaned once
+                cleaned = {value: self._clean_text_pii(value) for value in pd.unique(values)}
+                anonymized[column] = values.map(cleaned)
+            else:
+                anonymized[column] = values
+        
+        return pd.DataFrame(anonymized, index=frame.index)
+    
+    def _add_age_noise_column(self, ages: pd.Series) -> pd.Series:
+        """add age noise to a whole column with one draw"""
+        if not pd.api.types.is_numeric_dtype(ages):
+            return ages.map(self._add_age_noise)
+        noise_range = self.config.age_noise_range
+        noise = self._age_noise_rng.integers(-noise_range, noise_range + 1, size=len(ages))
+        return (ages + noise).clip(0, 120)
+    
     def _anonymize_records(self, records: List[Dict], dataset_name: str) -> List[Dict]:
         """anonymize list of clinical records"""
-        anonymized_records = []
+        # one slot per input record, filled by index so worker results keep their order
+        anonymized_records: List[Optional[Dict]] = [None] * len(records)
         result = AnonymizationResult(
             original_count=len(records),
             anonymized_count=0,
@@ -91,84 +338,80 @@ class DataAnonymizer:
             added_noise_count=0
         )
         
-        for i, record in enumerate(records):
-            try:
-                anonymized_record = self._anonymize_single_record(record, f"{dataset_name}_record_{i}")
-                anonymized_records.append(anonymized_record)
-                result.anonymized_count += 1
-                
-                # count PII removals
-                result.removed_pii_count += self._count_pii_removals(record, anonymized_record)
-                
-            except Exception as e:
-                result.errors.append(f"Error anonymizing record {i}: {e}")
-                logger.error(f"Error anonymizing record {i}: {e}")
+        # records are independent, so large datasets can be spread across processes
+        chunks = ((chunk, start, records[start:start + _RECORD_CHUNK], dataset_name)
+                  for chunk, start in enumerate(range(0, len(records), _RECORD_CHUNK)))
+        workers = self.config.parallel_workers
+        if workers > 1 and len(records) >= _PARALLEL_MIN_RECORDS:
+            with multiprocessing.get_context("spawn").Pool(workers) as pool:
+                chunk_outcomes = list(pool.imap(self._anonymize_chunk, chunks))
+        else:
+            chunk_outcomes = map(self._anonymize_chunk, chunks)
+        outcomes = (outcome for chunk_outcome in chunk_outcomes for outcome in chunk_outcome)
+        
+        for i, anonymized_record, removed_pii_count, error in outcomes:
+            if error is not None:
+                result.errors.append(f"Error anonymizing record {i}: {error}")
+                logger.error(f"Error anonymizing record {i}: {error}")
+                continue
+            
+            anonymized_records[i] = anonymized_record
+            result.anonymized_count += 1
+            result.removed_pii_count += removed_pii_count
         
         logger.info(f"Anonymized {result.anonymized_count}/{result.original_count} records")
+        if result.errors:
+            # records that failed leave their slot empty
+            return [record for record in anonymized_records if record is not None]
         return anonymized_records
     
+    def _anonymize_chunk(self, item: Tuple[int, int, List[Dict], str]
+                         ) -> List[Tuple[int, Optional[Dict], int, Optional[str]]]:
+        """anonymize one (chunk index, first record index, records, dataset name) item; runs in worker processes"""
+        chunk, start, records, dataset_name = item
+        self._reseed_age_noise(chunk)
+        return [self._anonymize_indexed((start + offset, record, dataset_name))
+                for offset, record in enumerate(records)]
+    
+    def _anonymize_indexed(self, item: Tuple[int, Dict, str]) -> Tuple[int, Optional[Dict], int, Optional[str]]:
+        """anonymize one (index, record, dataset name) item"""
+        i, record, dataset_name = item
+        try:
+            anonymized_record = self._anonymize_single_record(record, f"{dataset_name}_record_{i}")
+            
+            # count PII removals
+            return i, anonymized_record, self._count_pii_removals(record, anonymized_record), None
+        except Exception as e:
+            return i, None, 0, str(e)
+    
     def _anonymize_single_record(self, record: Dict, record_id: str) -> Dict:
         """anonymize a single clinical record"""
         anonymized = {}
         
-        # anonymize each section
+        # anonymize each section, preserving other medical sections generically
+        handlers = self._section_handlers
+        generic = self._anonymize_generic_section
         for section, section_data in record.items():
-            if section == 'demographics':
-                anonymized[section] = self._anonymize_demographics(section_data, record_id)
-            elif section == 'presentation':
-                anonymized[section] = self._anonymize_presentation(section_data, record_id)
-            elif section == 'diagnosis':
-                anonymized[section] = self._anonymize_diagnosis(section_data, record_id)
-            elif section == 'treatment':
-                anonymized[section] = self._anonymize_treatment(section_data, record_id)
-            elif section == 'outcome':
-                anonymized[section] = self._anonymize_outcome(section_data, record_id)
-            elif section == 'temporal_data':
-                anonymized[section] = self._anonymize_temporal_data(section_data, record_id)
-            else:
-                # preserve other medical sections
-                anonymized[section] = self._anonymize_generic_section(section_data, record_id)
+            anonymized[section] = handlers.get(section, generic)(section_data, record_id)
         
         return anonymized
     
     def _anonymize_demographics(self, demographics: Dict, record_id: str) -> Dict:
         """anonymize demographic information"""
         anonymized = {}
+        actions = self.demographic_actions
         
         for field, value in demographics.items():
-            if field == 'patient_id':
-                anonymized[field] = self._hash_identifier(value, record_id)
-            elif field == 'name':
-                # remove names completely
-                continue
-            elif field == 'age' and self.config.add_noise_to_ages:
-                anonymized[field] = self._add_age_noise(value)
-            elif field == 'gender':
-                anonymized[field] = value  # preserve gender
-            elif field == 'race':
-                anonymized[field] = value  # preserve race
-            elif field == 'ethnicity':
-                anonymized[field] = value  # preserve ethnicity
-            elif field == 'address':
-                # remove or generalize address
-                if self.config.preserve_geographic_region:
-                    anonymized[field] = self._generalize_address(value)
-                else:
-                    continue
-            elif field == 'phone':
-                # remove phone numbers
-                continue
-            elif field == 'email':
-                # remove email addresses
-                continue
-            elif field == 'ssn':
-                # remove SSN
-                continue
-            elif field == 'insurance':
-                anonymized[field] = value  # preserve insurance type
-            else:
-                # preserve other demographic fields
+            action = actions.get(field, DemographicAction.KEEP)
+            if action is DemographicAction.KEEP:
                 anonymized[field] = value
+            elif action is DemographicAction.HASH:
+                anonymized[field] = self._hash_identifier(value, record_id)
+            elif action is DemographicAction.AGE_NOISE:
+                anonymized[field] = self._add_age_noise(value) if self.config.add_noise_to_ages else value
+            elif action is DemographicAction.GENERALIZE_ADDRESS and self.config.preserve_geographic_region:
+                anonymized[field] = self._generalize_address(value)
+            # dropped fields, and addresses when regions are not kept, are left out
         
         return anonymized
     
@@ -276,17 +519,28 @@ class DataAnonymizer:
     
     def _anonymize_generic_section(self, section_data: Dict, record_id: str) -> Dict:
         """anonymize generic section data"""
-        anonymized = {}
-        
-        for field, value in section_data.items():
-            if isinstance(value, dict):
-                anonymized[field] = self._anonymize_generic_section(value, record_id)
-            elif isinstance(value, list):
-                anonymized[field] = [self._clean_text_pii(item) if isinstance(item, str) else item for item in value]
-            elif isinstance(value, str):
-                anonymized[field] = self._clean_text_pii(value)
-            else:
-                anonymized[field] = value
+        # with no text to scrub the walk would only rebuild an equal copy, so share it,
+        # as vital signs already are
+        if not _has_strings(section_data):
+            return section_data
+        
+        anonymized: Dict = {}
+        clean = self._clean_text_pii
+        
+        # nested dicts are walked with an explicit stack rather than a call per level
+        stack = [(section_data, anonymized)]
+        while stack:
+            source, target = stack.pop()
+            for field, value in source.items():
+                if isinstance(value, dict):
+                    target[field] = {}
+                    stack.append((value, target[field]))
+                elif isinstance(value, list):
+                    target[field] = [clean(item) if isinstance(item, str) else item for item in value]
+                elif isinstance(value, str):
+                    target[field] = clean(value)
+                else:
+                    target[field] = value
         
         return anonymized
     
@@ -296,20 +550,27 @@ class DataAnonymizer:
             return f"anon_{record_id}"
         
         # create deterministic hash
-        hash_input = f"{identifier}_{record_id}"
-        return f"anon_{hashlib.md5(hash_input.encode()).hexdigest()[:8]}"
+        return _identifier_token(f"{identifier}_{record_id}")
     
     def _add_age_noise(self, age: Union[int, float]) -> int:
         """add noise to age while preserving age group"""
         if not isinstance(age, (int, float)):
             return age
         
-        noise = random.randint(-self.config.age_noise_range, self.config.age_noise_range)
+        noise = self._next_age_noise(self.config.age_noise_range)
         noisy_age = age + noise
         
         # ensure age stays within reasonable bounds
         return max(0, min(120, noisy_age))
     
+    def _next_age_noise(self, noise_range: int) -> int:
+        """next pre-drawn integer in [-noise_range, noise_range]"""
+        buffer = self._age_noise_buffers.get(noise_range)
+        if not buffer:
+            buffer = self._age_noise_buffers[noise_range] = self._age_noise_rng.integers(
+                -noise_range, noise_range + 1, size=_AGE_NOISE_BATCH).tolist()
+        return buffer.pop()
+    
     def _generalize_address(self, address: str) -> str:
         """generalize address to preserve region only"""
         if not address:
@@ -327,60 +588,31 @@ class DataAnonymizer:
         """remove PII from text while preserving medical information"""
         if not isinstance(text, str):
             return text
-        
-        cleaned_text = text
-        
-        # remove phone numbers
-        cleaned_text = re.sub(self.pii_patterns['phone'], '[PHONE]', cleaned_text)
-        
-        # remove SSN
-        cleaned_text = re.sub(self.pii_patterns['ssn'], '[SSN]', cleaned_text)
-        
-        # remove email addresses
-        cleaned_text = re.sub(self.pii_patterns['email'], '[EMAIL]', cleaned_text)
-        
-        # remove credit card numbers
-        cleaned_text = re.sub(self.pii_patterns['credit_card'], '[CARD]', cleaned_text)
-        
-        # remove medical record numbers
-        cleaned_text = re.sub(self.pii_patterns['medical_record'], '[MRN]', cleaned_text)
-        
-        # remove patient IDs
-        cleaned_text = re.sub(self.pii_patterns['patient_id'], '[PATIENT_ID]', cleaned_text)
-        
-        # remove addresses
-        cleaned_text = re.sub(self.pii_patterns['address'], '[ADDRESS]', cleaned_text)
-        
-        # remove or generalize zip codes
-        if self.config.preserve_zip_code_prefix:
-            cleaned_text = re.sub(r'\b(\d{3})\d{2}(?:-\d{4})?\b', r'\1XX', cleaned_text)
+        if len(text) > _CLEAN_TEXT_MEMO_MAX_CHARS:
+            return self._clean_text(text)
+        return self._cached_clean_text(text, self.config.preserve_zip_code_prefix)
+    
+    def _clean_text_for(self, text: str, preserve_zip_code_prefix: bool) -> str:
+        """_clean_text memoized under the config setting it reads, so changes are never served stale"""
+        return self._clean_text(text)
+    
+    def _clean_text(self, text: str) -> str:
+        # remove phone numbers, SSNs, emails, card numbers, MRNs, patient IDs,
+        # addresses and zip codes in a single scan
+        if _PII_PROBE.search(text):
+            cleaned_text = self._pii_pattern(text).sub(self._replace_pii, text)
         else:
-            cleaned_text = re.sub(self.pii_patterns['zip_code'], '[ZIP]', cleaned_text)
+            cleaned_text = text
         
         # remove potential names (capitalized words that might be names)
         # but preserve medical terms
-        words = cleaned_text.split()
-        cleaned_words = []
-        
-        for word in words:
-            if (word.istitle() and len(word) > 2 and 
-                word.lower() not in self.medical_terms and
-                not word.isupper()):  # don't replace acronyms
-                cleaned_words.append('[NAME]')
-            else:
-                cleaned_words.append(word)
-        
-        cleaned_text = ' '.join(cleaned_words)
-        
-        return cleaned_text
+        return _NAME_PATTERN.sub(self._replace_name, cleaned_text)
     
     def _anonymize_timestamp(self, timestamp: Union[str, datetime]) -> str:
         """anonymize timestamp while preserving temporal relationships"""
         if isinstance(timestamp, str):
-            try:
-                timestamp = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-            except:
-                return timestamp
+            # arrival times repeat across records, so parsed dates are cached
+            return _iso_date(timestamp)
         
         if isinstance(timestamp, datetime):
             # preserve date but remove specific time
@@ -402,14 +634,15 @@ class DataAnonymizer:
         # count PII patterns in text fields
         for section in ['presentation', 'diagnosis', 'treatment']:
             if section in original and section in anonymized:
-                original_text = str(original[section])
-                anonymized_text = str(anonymized[section])
+                original_text = '\n'.join(_iter_strings(original[section]))
+                if not _PII_PROBE.search(original_text):
+                    continue
+                count += len(self._pii_pattern(original_text).findall(original_text))
                 
-                # count pattern removals
-                for pattern_name, pattern in self.pii_patterns.items():
-                    original_matches = len(re.findall(pattern, original_text))
-                    anonymized_matches = len(re.findall(pattern, anonymized_text))
-                    count += original_matches - anonymized_matches
+                # placeholders never match, but fields kept verbatim still can
+                anonymized_text = '\n'.join(_iter_strings(anonymized[section]))
+                if _PII_PROBE.search(anonymized_text):
+                    count -= len(self._pii_pattern(anonymized_text).findall(anonymized_text))
         
         return count
     
@@ -449,15 +682,17 @@ class DataAnonymizer:
     
     def _check_remaining_pii(self, data: Dict) -> List[str]:
         """check for remaining PII in anonymized data"""
-        pii_found = []
-        data_str = json.dumps(data, default=str)
-        
-        for pattern_name, pattern in self.pii_patterns.items():
-            matches = re.findall(pattern, data_str)
-            if matches:
-                pii_found.append(f"{pattern_name}: {matches}")
-        
-        return pii_found
+        # one scan over the record's text leaves for every pattern, reported in pattern order
+        found = self._scan_pii('\n'.join(_iter_strings(data)))
+        return [f"{pattern_name}: {found[pattern_name]}" for pattern_name in self.pii_patterns
+                if pattern_name in found]
+    
+    def _scan_pii(self, text: str) -> Dict[str, List[str]]:
+        """PII matches in text grouped by the pattern that produced them"""
+        found: Dict[str, List[str]] = {}
+        for match in self._pii_pattern(text).finditer(text):
+            found.setdefault(match.lastgroup, []).append(match.group())
+        return found
     
     def _check_medical_preservation(self, original: Dict, anonymized: Dict) -> bool:
         """check if medical information was preserved"""
@@ -473,9 +708,8 @@ class DataAnonymizer:
                 anon_content = str(anonymized[field])
                 
                 # should contain medical terms
-                medical_terms = ['pain', 'fever', 'shortness', 'chest', 'heart', 'blood']
-                if any(term in orig_content.lower() for term in medical_terms):
-                    if not any(term in anon_content.lower() for term in medical_terms):
+                if _has_medical_term(orig_content):
+                    if not _has_medical_term(anon_content):
                         return False
         
         return True
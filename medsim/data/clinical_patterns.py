@@ -3,16 +3,28 @@ clinical patterns and templates for scenario generation
 """
 
 import json
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, FrozenSet, Iterator, List, Mapping, Optional, Sequence, Tuple
 from dataclasses import dataclass, field
+from collections import defaultdict
+from itertools import accumulate
+from bisect import bisect
+from functools import lru_cache
 from datetime import datetime, timedelta
 import random
 import logging
+import multiprocessing
+import sys
+from types import MappingProxyType
+
+import numpy as np
+
+from ..core._compat import DATACLASS_SLOTS
+from ._clinical_kernels import _U_TIMES, _sample_scenarios
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ClinicalTemplate:
     """template for generating clinical scenarios"""
     template_id: str
@@ -32,387 +44,710 @@ class ClinicalTemplate:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-class ClinicalPatterns:
-    """manages clinical patterns and templates for scenario generation"""
-    
-    def __init__(self):
-        self.templates: Dict[str, ClinicalTemplate] = {}
-        self.pattern_library: Dict[str, Dict[str, Any]] = {}
-        self._initialize_patterns()
-    
-    def _initialize_patterns(self):
-        """initialize clinical pattern library"""
-        self.pattern_library = {
-            'emergency_medicine': {
-                'chest_pain': {
-                    'frequency': 0.15,
-                    'demographics': {
-                        'age_range': (40, 80),
-                        'gender_distribution': {'male': 0.6, 'female': 0.4},
-                        'risk_factors': ['hypertension', 'diabetes', 'smoking', 'hyperlipidemia']
-                    },
-                    'symptom_clusters': [
-                        {
-                            'symptoms': ['chest pain', 'shortness of breath', 'sweating'],
-                            'frequency': 0.4,
-                            'severity': 'high'
-                        },
-                        {
-                            'symptoms': ['chest pain', 'nausea', 'vomiting'],
-                            'frequency': 0.3,
-                            'severity': 'medium'
-                        }
-                    ],
-                    'diagnoses': [
-                        {'diagnosis': 'STEMI', 'frequency': 0.3, 'difficulty': 'hard'},
-                        {'diagnosis': 'NSTEMI', 'frequency': 0.4, 'difficulty': 'medium'},
-                        {'diagnosis': 'stable angina', 'frequency': 0.2, 'difficulty': 'easy'},
-                        {'diagnosis': 'aortic dissection', 'frequency': 0.1, 'difficulty': 'hard'}
-                    ],
-                    'treatments': [
-                        {'treatment': 'aspirin', 'frequency': 0.9, 'timing': 'immediate'},
-                        {'treatment': 'nitroglycerin', 'frequency': 0.7, 'timing': 'immediate'},
-                        {'treatment': 'cardiac catheterization', 'frequency': 0.5, 'timing': 'urgent'},
-                        {'treatment': 'thrombolytics', 'frequency': 0.3, 'timing': 'urgent'}
-                    ]
+def _emergency_medicine() -> Dict[str, Any]:
+    """emergency medicine patterns"""
+    return {
+        'chest_pain': {
+            'frequency': 0.15,
+            'demographics': {
+                'age_range': (40, 80),
+                'gender_distribution': {'male': 0.6, 'female': 0.4},
+                'risk_factors': ['hypertension', 'diabetes', 'smoking', 'hyperlipidemia']
+            },
+            'symptom_clusters': [
+                {
+                    'symptoms': ['chest pain', 'shortness of breath', 'sweating'],
+                    'frequency': 0.4,
+                    'severity': 'high'
+                },
+                {
+                    'symptoms': ['chest pain', 'nausea', 'vomiting'],
+                    'frequency': 0.3,
+                    'severity': 'medium'
+                }
+            ],
+            'diagnoses': [
+                {'diagnosis': 'STEMI', 'frequency': 0.3, 'difficulty': 'hard'},
+                {'diagnosis': 'NSTEMI', 'frequency': 0.4, 'difficulty': 'medium'},
+                {'diagnosis': 'stable angina', 'frequency': 0.2, 'difficulty': 'easy'},
+                {'diagnosis': 'aortic dissection', 'frequency': 0.1, 'difficulty': 'hard'}
+            ],
+            'treatments': [
+                {'treatment': 'aspirin', 'frequency': 0.9, 'timing': 'immediate'},
+                {'treatment': 'nitroglycerin', 'frequency': 0.7, 'timing': 'immediate'},
+                {'treatment': 'cardiac catheterization', 'frequency': 0.5, 'timing': 'urgent'},
+                {'treatment': 'thrombolytics', 'frequency': 0.3, 'timing': 'urgent'}
+            ]
+        },
+        'shortness_of_breath': {
+            'frequency': 0.12,
+            'demographics': {
+                'age_range': (50, 85),
+                'gender_distribution': {'male': 0.45, 'female': 0.55},
+                'risk_factors': ['copd', 'asthma', 'heart_failure', 'smoking']
+            },
+            'symptom_clusters': [
+                {
+                    'symptoms': ['shortness of breath', 'cough', 'wheezing'],
+                    'frequency': 0.5,
+                    'severity': 'medium'
                 },
-                'shortness_of_breath': {
-                    'frequency': 0.12,
-                    'demographics': {
-                        'age_range': (50, 85),
-                        'gender_distribution': {'male': 0.45, 'female': 0.55},
-                        'risk_factors': ['copd', 'asthma', 'heart_failure', 'smoking']
-                    },
-                    'symptom_clusters': [
-                        {
-                            'symptoms': ['shortness of breath', 'cough', 'wheezing'],
-                            'frequency': 0.5,
-                            'severity': 'medium'
-                        },
-                        {
-                            'symptoms': ['shortness of breath', 'chest pain', 'anxiety'],
-                            'frequency': 0.3,
-                            'severity': 'high'
-                        }
-                    ],
-                    'diagnoses': [
-                        {'diagnosis': 'copd exacerbation', 'frequency': 0.4, 'difficulty': 'medium'},
-                        {'diagnosis': 'pneumonia', 'frequency': 0.3, 'difficulty': 'medium'},
-                        {'diagnosis': 'pulmonary embolism', 'frequency': 0.2, 'difficulty': 'hard'},
-                        {'diagnosis': 'heart failure', 'frequency': 0.1, 'difficulty': 'medium'}
-                    ],
-                    'treatments': [
-                        {'treatment': 'oxygen therapy', 'frequency': 0.8, 'timing': 'immediate'},
-                        {'treatment': 'albuterol nebulizer', 'frequency': 0.7, 'timing': 'immediate'},
-                        {'treatment': 'steroids', 'frequency': 0.6, 'timing': 'urgent'},
-                        {'treatment': 'antibiotics', 'frequency': 0.4, 'timing': 'urgent'}
-                    ]
+                {
+                    'symptoms': ['shortness of breath', 'chest pain', 'anxiety'],
+                    'frequency': 0.3,
+                    'severity': 'high'
+                }
+            ],
+            'diagnoses': [
+                {'diagnosis': 'copd exacerbation', 'frequency': 0.4, 'difficulty': 'medium'},
+                {'diagnosis': 'pneumonia', 'frequency': 0.3, 'difficulty': 'medium'},
+                {'diagnosis': 'pulmonary embolism', 'frequency': 0.2, 'difficulty': 'hard'},
+                {'diagnosis': 'heart failure', 'frequency': 0.1, 'difficulty': 'medium'}
+            ],
+            'treatments': [
+                {'treatment': 'oxygen therapy', 'frequency': 0.8, 'timing': 'immediate'},
+                {'treatment': 'albuterol nebulizer', 'frequency': 0.7, 'timing': 'immediate'},
+                {'treatment': 'steroids', 'frequency': 0.6, 'timing': 'urgent'},
+                {'treatment': 'antibiotics', 'frequency': 0.4, 'timing': 'urgent'}
+            ]
+        },
+        'abdominal_pain': {
+            'frequency': 0.10,
+            'demographics': {
+                'age_range': (20, 70),
+                'gender_distribution': {'male': 0.5, 'female': 0.5},
+                'risk_factors': ['previous_surgery', 'inflammatory_bowel_disease']
+            },
+            'symptom_clusters': [
+                {
+                    'symptoms': ['abdominal pain', 'nausea', 'vomiting'],
+                    'frequency': 0.6,
+                    'severity': 'medium'
                 },
-                'abdominal_pain': {
-                    'frequency': 0.10,
-                    'demographics': {
-                        'age_range': (20, 70),
-                        'gender_distribution': {'male': 0.5, 'female': 0.5},
-                        'risk_factors': ['previous_surgery', 'inflammatory_bowel_disease']
-                    },
-                    'symptom_clusters': [
-                        {
-                            'symptoms': ['abdominal pain', 'nausea', 'vomiting'],
-                            'frequency': 0.6,
-                            'severity': 'medium'
-                        },
-                        {
-                            'symptoms': ['abdominal pain', 'fever', 'chills'],
-                            'frequency': 0.3,
-                            'severity': 'high'
-                        }
-                    ],
-                    'diagnoses': [
-                        {'diagnosis': 'appendicitis', 'frequency': 0.3, 'difficulty': 'easy'},
-                        {'diagnosis': 'cholecystitis', 'frequency': 0.25, 'difficulty': 'medium'},
-                        {'diagnosis': 'diverticulitis', 'frequency': 0.2, 'difficulty': 'medium'},
-                        {'diagnosis': 'bowel obstruction', 'frequency': 0.15, 'difficulty': 'hard'},
-                        {'diagnosis': 'peritonitis', 'frequency': 0.1, 'difficulty': 'hard'}
-                    ],
-                    'treatments': [
-                        {'treatment': 'pain medication', 'frequency': 0.8, 'timing': 'immediate'},
-                        {'treatment': 'antibiotics', 'frequency': 0.6, 'timing': 'urgent'},
-                        {'treatment': 'surgical consultation', 'frequency': 0.5, 'timing': 'urgent'},
-                        {'treatment': 'imaging studies', 'frequency': 0.9, 'timing': 'urgent'}
-                    ]
+                {
+                    'symptoms': ['abdominal pain', 'fever', 'chills'],
+                    'frequency': 0.3,
+                    'severity': 'high'
                 }
+            ],
+            'diagnoses': [
+                {'diagnosis': 'appendicitis', 'frequency': 0.3, 'difficulty': 'easy'},
+                {'diagnosis': 'cholecystitis', 'frequency': 0.25, 'difficulty': 'medium'},
+                {'diagnosis': 'diverticulitis', 'frequency': 0.2, 'difficulty': 'medium'},
+                {'diagnosis': 'bowel obstruction', 'frequency': 0.15, 'difficulty': 'hard'},
+                {'diagnosis': 'peritonitis', 'frequency': 0.1, 'difficulty': 'hard'}
+            ],
+            'treatments': [
+                {'treatment': 'pain medication', 'frequency': 0.8, 'timing': 'immediate'},
+                {'treatment': 'antibiotics', 'frequency': 0.6, 'timing': 'urgent'},
+                {'treatment': 'surgical consultation', 'frequency': 0.5, 'timing': 'urgent'},
+                {'treatment': 'imaging studies', 'frequency': 0.9, 'timing': 'urgent'}
+            ]
+        }
+    }
+
+
+def _cardiology() -> Dict[str, Any]:
+    """cardiology patterns"""
+    return {
+        'acute_coronary_syndrome': {
+            'frequency': 0.08,
+            'demographics': {
+                'age_range': (45, 85),
+                'gender_distribution': {'male': 0.65, 'female': 0.35},
+                'risk_factors': ['hypertension', 'diabetes', 'smoking', 'hyperlipidemia', 'family_history']
             },
-            'cardiology': {
-                'acute_coronary_syndrome': {
-                    'frequency': 0.08,
-                    'demographics': {
-                        'age_range': (45, 85),
-                        'gender_distribution': {'male': 0.65, 'female': 0.35},
-                        'risk_factors': ['hypertension', 'diabetes', 'smoking', 'hyperlipidemia', 'family_history']
-                    },
-                    'symptom_clusters': [
-                        {
-                            'symptoms': ['chest pain', 'shortness of breath', 'sweating', 'nausea'],
-                            'frequency': 0.6,
-                            'severity': 'high'
-                        },
-                        {
-                            'symptoms': ['chest pain', 'arm pain', 'jaw pain'],
-                            'frequency': 0.3,
-                            'severity': 'high'
-                        }
-                    ],
-                    'diagnoses': [
-                        {'diagnosis': 'STEMI', 'frequency': 0.4, 'difficulty': 'hard'},
-                        {'diagnosis': 'NSTEMI', 'frequency': 0.4, 'difficulty': 'medium'},
-                        {'diagnosis': 'unstable angina', 'frequency': 0.2, 'difficulty': 'medium'}
-                    ],
-                    'treatments': [
-                        {'treatment': 'aspirin', 'frequency': 0.95, 'timing': 'immediate'},
-                        {'treatment': 'nitroglycerin', 'frequency': 0.8, 'timing': 'immediate'},
-                        {'treatment': 'cardiac catheterization', 'frequency': 0.7, 'timing': 'urgent'},
-                        {'treatment': 'thrombolytics', 'frequency': 0.3, 'timing': 'urgent'},
-                        {'treatment': 'beta blockers', 'frequency': 0.6, 'timing': 'urgent'}
-                    ]
+            'symptom_clusters': [
+                {
+                    'symptoms': ['chest pain', 'shortness of breath', 'sweating', 'nausea'],
+                    'frequency': 0.6,
+                    'severity': 'high'
                 },
-                'heart_failure': {
-                    'frequency': 0.06,
-                    'demographics': {
-                        'age_range': (60, 90),
-                        'gender_distribution': {'male': 0.55, 'female': 0.45},
-                        'risk_factors': ['hypertension', 'diabetes', 'previous_mi', 'valvular_disease']
-                    },
-                    'symptom_clusters': [
-                        {
-                            'symptoms': ['shortness of breath', 'fatigue', 'edema'],
-                            'frequency': 0.7,
-                            'severity': 'medium'
-                        },
-                        {
-                            'symptoms': ['shortness of breath', 'orthopnea', 'paroxysmal_nocturnal_dyspnea'],
-                            'frequency': 0.3,
-                            'severity': 'high'
-                        }
-                    ],
-                    'diagnoses': [
-                        {'diagnosis': 'acute decompensated heart failure', 'frequency': 0.6, 'difficulty': 'medium'},
-                        {'diagnosis': 'chronic heart failure', 'frequency': 0.4, 'difficulty': 'medium'}
-                    ],
-                    'treatments': [
-                        {'treatment': 'diuretics', 'frequency': 0.9, 'timing': 'immediate'},
-                        {'treatment': 'ace inhibitors', 'frequency': 0.7, 'timing': 'urgent'},
-                        {'treatment': 'beta blockers', 'frequency': 0.6, 'timing': 'urgent'},
-                        {'treatment': 'oxygen therapy', 'frequency': 0.8, 'timing': 'immediate'}
-                    ]
+                {
+                    'symptoms': ['chest pain', 'arm pain', 'jaw pain'],
+                    'frequency': 0.3,
+                    'severity': 'high'
                 }
+            ],
+            'diagnoses': [
+                {'diagnosis': 'STEMI', 'frequency': 0.4, 'difficulty': 'hard'},
+                {'diagnosis': 'NSTEMI', 'frequency': 0.4, 'difficulty': 'medium'},
+                {'diagnosis': 'unstable angina', 'frequency': 0.2, 'difficulty': 'medium'}
+            ],
+            'treatments': [
+                {'treatment': 'aspirin', 'frequency': 0.95, 'timing': 'immediate'},
+                {'treatment': 'nitroglycerin', 'frequency': 0.8, 'timing': 'immediate'},
+                {'treatment': 'cardiac catheterization', 'frequency': 0.7, 'timing': 'urgent'},
+                {'treatment': 'thrombolytics', 'frequency': 0.3, 'timing': 'urgent'},
+                {'treatment': 'beta blockers', 'frequency': 0.6, 'timing': 'urgent'}
+            ]
+        },
+        'heart_failure': {
+            'frequency': 0.06,
+            'demographics': {
+                'age_range': (60, 90),
+                'gender_distribution': {'male': 0.55, 'female': 0.45},
+                'risk_factors': ['hypertension', 'diabetes', 'previous_mi', 'valvular_disease']
             },
-            'neurology': {
-                'acute_stroke': {
-                    'frequency': 0.05,
-                    'demographics': {
-                        'age_range': (50, 85),
-                        'gender_distribution': {'male': 0.52, 'female': 0.48},
-                        'risk_factors': ['hypertension', 'diabetes', 'atrial_fibrillation', 'smoking']
-                    },
-                    'symptom_clusters': [
-                        {
-                            'symptoms': ['facial droop', 'arm weakness', 'speech difficulty'],
-                            'frequency': 0.5,
-                            'severity': 'high'
-                        },
-                        {
-                            'symptoms': ['sudden headache', 'confusion', 'vision changes'],
-                            'frequency': 0.3,
-                            'severity': 'high'
-                        }
-                    ],
-                    'diagnoses': [
-                        {'diagnosis': 'ischemic stroke', 'frequency': 0.7, 'difficulty': 'hard'},
-                        {'diagnosis': 'hemorrhagic stroke', 'frequency': 0.2, 'difficulty': 'hard'},
-                        {'diagnosis': 'tia', 'frequency': 0.1, 'difficulty': 'medium'}
-                    ],
-                    'treatments': [
-                        {'treatment': 'tpa', 'frequency': 0.3, 'timing': 'urgent'},
-                        {'treatment': 'mechanical thrombectomy', 'frequency': 0.2, 'timing': 'urgent'},
-                        {'treatment': 'antiplatelet therapy', 'frequency': 0.8, 'timing': 'urgent'},
-                        {'treatment': 'blood pressure management', 'frequency': 0.9, 'timing': 'immediate'}
-                    ]
+            'symptom_clusters': [
+                {
+                    'symptoms': ['shortness of breath', 'fatigue', 'edema'],
+                    'frequency': 0.7,
+                    'severity': 'medium'
                 },
-                'seizure': {
-                    'frequency': 0.04,
-                    'demographics': {
-                        'age_range': (20, 80),
-                        'gender_distribution': {'male': 0.48, 'female': 0.52},
-                        'risk_factors': ['epilepsy', 'head_trauma', 'brain_tumor', 'metabolic_disorder']
-                    },
-                    'symptom_clusters': [
-                        {
-                            'symptoms': ['unconsciousness', 'convulsions', 'incontinence'],
-                            'frequency': 0.6,
-                            'severity': 'high'
-                        },
-                        {
-                            'symptoms': ['confusion', 'memory loss', 'headache'],
-                            'frequency': 0.4,
-                            'severity': 'medium'
-                        }
-                    ],
-                    'diagnoses': [
-                        {'diagnosis': 'generalized tonic-clonic seizure', 'frequency': 0.5, 'difficulty': 'medium'},
-                        {'diagnosis': 'complex partial seizure', 'frequency': 0.3, 'difficulty': 'medium'},
-                        {'diagnosis': 'status epilepticus', 'frequency': 0.2, 'difficulty': 'hard'}
-                    ],
-                    'treatments': [
-                        {'treatment': 'benzodiazepines', 'frequency': 0.8, 'timing': 'immediate'},
-                        {'treatment': 'antiepileptic drugs', 'frequency': 0.6, 'timing': 'urgent'},
-                        {'treatment': 'airway management', 'frequency': 0.9, 'timing': 'immediate'},
-                        {'treatment': 'imaging studies', 'frequency': 0.7, 'timing': 'urgent'}
-                    ]
+                {
+                    'symptoms': ['shortness of breath', 'orthopnea', 'paroxysmal_nocturnal_dyspnea'],
+                    'frequency': 0.3,
+                    'severity': 'high'
                 }
+            ],
+            'diagnoses': [
+                {'diagnosis': 'acute decompensated heart failure', 'frequency': 0.6, 'difficulty': 'medium'},
+                {'diagnosis': 'chronic heart failure', 'frequency': 0.4, 'difficulty': 'medium'}
+            ],
+            'treatments': [
+                {'treatment': 'diuretics', 'frequency': 0.9, 'timing': 'immediate'},
+                {'treatment': 'ace inhibitors', 'frequency': 0.7, 'timing': 'urgent'},
+                {'treatment': 'beta blockers', 'frequency': 0.6, 'timing': 'urgent'},
+                {'treatment': 'oxygen therapy', 'frequency': 0.8, 'timing': 'immediate'}
+            ]
+        }
+    }
+
+
+def _neurology() -> Dict[str, Any]:
+    """neurology patterns"""
+    return {
+        'acute_stroke': {
+            'frequency': 0.05,
+            'demographics': {
+                'age_range': (50, 85),
+                'gender_distribution': {'male': 0.52, 'female': 0.48},
+                'risk_factors': ['hypertension', 'diabetes', 'atrial_fibrillation', 'smoking']
             },
-            'respiratory': {
-                'copd_exacerbation': {
-                    'frequency': 0.07,
-                    'demographics': {
-                        'age_range': (55, 85),
-                        'gender_distribution': {'male': 0.6, 'female': 0.4},
-                        'risk_factors': ['smoking', 'environmental_exposure', 'previous_copd']
-                    },
-                    'symptom_clusters': [
-                        {
-                            'symptoms': ['shortness of breath', 'cough', 'increased sputum'],
-                            'frequency': 0.7,
-                            'severity': 'medium'
-                        },
-                        {
-                            'symptoms': ['shortness of breath', 'wheezing', 'chest tightness'],
-                            'frequency': 0.3,
-                            'severity': 'medium'
-                        }
-                    ],
-                    'diagnoses': [
-                        {'diagnosis': 'copd exacerbation', 'frequency': 0.8, 'difficulty': 'medium'},
-                        {'diagnosis': 'pneumonia', 'frequency': 0.2, 'difficulty': 'medium'}
-                    ],
-                    'treatments': [
-                        {'treatment': 'bronchodilators', 'frequency': 0.9, 'timing': 'immediate'},
-                        {'treatment': 'steroids', 'frequency': 0.8, 'timing': 'urgent'},
-                        {'treatment': 'oxygen therapy', 'frequency': 0.7, 'timing': 'immediate'},
-                        {'treatment': 'antibiotics', 'frequency': 0.5, 'timing': 'urgent'}
-                    ]
+            'symptom_clusters': [
+                {
+                    'symptoms': ['facial droop', 'arm weakness', 'speech difficulty'],
+                    'frequency': 0.5,
+                    'severity': 'high'
                 },
-                'pneumonia': {
-                    'frequency': 0.06,
-                    'demographics': {
-                        'age_range': (40, 85),
-                        'gender_distribution': {'male': 0.48, 'female': 0.52},
-                        'risk_factors': ['smoking', 'immunocompromised', 'chronic_lung_disease']
-                    },
-                    'symptom_clusters': [
-                        {
-                            'symptoms': ['fever', 'cough', 'shortness of breath', 'chest pain'],
-                            'frequency': 0.6,
-                            'severity': 'medium'
-                        },
-                        {
-                            'symptoms': ['fever', 'chills', 'fatigue', 'cough'],
-                            'frequency': 0.4,
-                            'severity': 'medium'
-                        }
-                    ],
-                    'diagnoses': [
-                        {'diagnosis': 'community acquired pneumonia', 'frequency': 0.7, 'difficulty': 'medium'},
-                        {'diagnosis': 'hospital acquired pneumonia', 'frequency': 0.2, 'difficulty': 'hard'},
-                        {'diagnosis': 'aspiration pneumonia', 'frequency': 0.1, 'difficulty': 'medium'}
-                    ],
-                    'treatments': [
-                        {'treatment': 'antibiotics', 'frequency': 0.9, 'timing': 'urgent'},
-                        {'treatment': 'oxygen therapy', 'frequency': 0.6, 'timing': 'immediate'},
-                        {'treatment': 'chest physiotherapy', 'frequency': 0.4, 'timing': 'routine'},
-                        {'treatment': 'hydration', 'frequency': 0.8, 'timing': 'immediate'}
-                    ]
+                {
+                    'symptoms': ['sudden headache', 'confusion', 'vision changes'],
+                    'frequency': 0.3,
+                    'severity': 'high'
                 }
+            ],
+            'diagnoses': [
+                {'diagnosis': 'ischemic stroke', 'frequency': 0.7, 'difficulty': 'hard'},
+                {'diagnosis': 'hemorrhagic stroke', 'frequency': 0.2, 'difficulty': 'hard'},
+                {'diagnosis': 'tia', 'frequency': 0.1, 'difficulty': 'medium'}
+            ],
+            'treatments': [
+                {'treatment': 'tpa', 'frequency': 0.3, 'timing': 'urgent'},
+                {'treatment': 'mechanical thrombectomy', 'frequency': 0.2, 'timing': 'urgent'},
+                {'treatment': 'antiplatelet therapy', 'frequency': 0.8, 'timing': 'urgent'},
+                {'treatment': 'blood pressure management', 'frequency': 0.9, 'timing': 'immediate'}
+            ]
+        },
+        'seizure': {
+            'frequency': 0.04,
+            'demographics': {
+                'age_range': (20, 80),
+                'gender_distribution': {'male': 0.48, 'female': 0.52},
+                'risk_factors': ['epilepsy', 'head_trauma', 'brain_tumor', 'metabolic_disorder']
             },
-            "rheumatology": {
-                "diagnoses": [
-                    {"diagnosis": "systemic lupus erythematosus", "prevalence": 0.02},
-                    {"diagnosis": "rheumatoid arthritis", "prevalence": 0.03},
-                    {"diagnosis": "vasculitis", "prevalence": 0.01}
-                ],
-                "symptoms": ["joint pain", "rash", "fatigue", "fever"],
-                "labs": ["ANA", "RF", "ESR", "CRP"],
-                "imaging": ["joint xray", "chest xray"]
+            'symptom_clusters': [
+                {
+                    'symptoms': ['unconsciousness', 'convulsions', 'incontinence'],
+                    'frequency': 0.6,
+                    'severity': 'high'
+                },
+                {
+                    'symptoms': ['confusion', 'memory loss', 'headache'],
+                    'frequency': 0.4,
+                    'severity': 'medium'
+                }
+            ],
+            'diagnoses': [
+                {'diagnosis': 'generalized tonic-clonic seizure', 'frequency': 0.5, 'difficulty': 'medium'},
+                {'diagnosis': 'complex partial seizure', 'frequency': 0.3, 'difficulty': 'medium'},
+                {'diagnosis': 'status epilepticus', 'frequency': 0.2, 'difficulty': 'hard'}
+            ],
+            'treatments': [
+                {'treatment': 'benzodiazepines', 'frequency': 0.8, 'timing': 'immediate'},
+                {'treatment': 'antiepileptic drugs', 'frequency': 0.6, 'timing': 'urgent'},
+                {'treatment': 'airway management', 'frequency': 0.9, 'timing': 'immediate'},
+                {'treatment': 'imaging studies', 'frequency': 0.7, 'timing': 'urgent'}
+            ]
+        }
+    }
+
+
+def _respiratory() -> Dict[str, Any]:
+    """respiratory patterns"""
+    return {
+        'copd_exacerbation': {
+            'frequency': 0.07,
+            'demographics': {
+                'age_range': (55, 85),
+                'gender_distribution': {'male': 0.6, 'female': 0.4},
+                'risk_factors': ['smoking', 'environmental_exposure', 'previous_copd']
             },
-            "hematology": {
-                "diagnoses": [
-                    {"diagnosis": "sickle cell crisis", "prevalence": 0.01},
-                    {"diagnosis": "thrombotic thrombocytopenic purpura", "prevalence": 0.005}
-                ],
-                "symptoms": ["pain", "anemia", "jaundice", "petechiae"],
-                "labs": ["CBC", "LDH", "haptoglobin", "peripheral smear"],
-                "imaging": ["abdominal ultrasound"]
+            'symptom_clusters': [
+                {
+                    'symptoms': ['shortness of breath', 'cough', 'increased sputum'],
+                    'frequency': 0.7,
+                    'severity': 'medium'
+                },
+                {
+                    'symptoms': ['shortness of breath', 'wheezing', 'chest tightness'],
+                    'frequency': 0.3,
+                    'severity': 'medium'
+                }
+            ],
+            'diagnoses': [
+                {'diagnosis': 'copd exacerbation', 'frequency': 0.8, 'difficulty': 'medium'},
+                {'diagnosis': 'pneumonia', 'frequency': 0.2, 'difficulty': 'medium'}
+            ],
+            'treatments': [
+                {'treatment': 'bronchodilators', 'frequency': 0.9, 'timing': 'immediate'},
+                {'treatment': 'steroids', 'frequency': 0.8, 'timing': 'urgent'},
+                {'treatment': 'oxygen therapy', 'frequency': 0.7, 'timing': 'immediate'},
+                {'treatment': 'antibiotics', 'frequency': 0.5, 'timing': 'urgent'}
+            ]
+        },
+        'pneumonia': {
+            'frequency': 0.06,
+            'demographics': {
+                'age_range': (40, 85),
+                'gender_distribution': {'male': 0.48, 'female': 0.52},
+                'risk_factors': ['smoking', 'immunocompromised', 'chronic_lung_disease']
             },
-            "infectious_disease": {
-                "diagnoses": [
-                    {"diagnosis": "tuberculosis", "prevalence": 0.01},
-                    {"diagnosis": "HIV/AIDS", "prevalence": 0.01},
-                    {"diagnosis": "malaria", "prevalence": 0.005}
-                ],
-                "symptoms": ["fever", "night sweats", "weight loss", "cough"],
-                "labs": ["HIV test", "TB quantiferon", "malaria smear"],
-                "imaging": ["chest xray", "CT scan"]
-            }
+            'symptom_clusters': [
+                {
+                    'symptoms': ['fever', 'cough', 'shortness of breath', 'chest pain'],
+                    'frequency': 0.6,
+                    'severity': 'medium'
+                },
+                {
+                    'symptoms': ['fever', 'chills', 'fatigue', 'cough'],
+                    'frequency': 0.4,
+                    'severity': 'medium'
+                }
+            ],
+            'diagnoses': [
+                {'diagnosis': 'community acquired pneumonia', 'frequency': 0.7, 'difficulty': 'medium'},
+                {'diagnosis': 'hospital acquired pneumonia', 'frequency': 0.2, 'difficulty': 'hard'},
+                {'diagnosis': 'aspiration pneumonia', 'frequency': 0.1, 'difficulty': 'medium'}
+            ],
+            'treatments': [
+                {'treatment': 'antibiotics', 'frequency': 0.9, 'timing': 'urgent'},
+                {'treatment': 'oxygen therapy', 'frequency': 0.6, 'timing': 'immediate'},
+                {'treatment': 'chest physiotherapy', 'frequency': 0.4, 'timing': 'routine'},
+                {'treatment': 'hydration', 'frequency': 0.8, 'timing': 'immediate'}
+            ]
         }
-        return self.pattern_library
+    }
+
+
+def _rheumatology() -> Dict[str, Any]:
+    """rheumatology patterns"""
+    return {
+        "diagnoses": [
+            {"diagnosis": "systemic lupus erythematosus", "prevalence": 0.02},
+            {"diagnosis": "rheumatoid arthritis", "prevalence": 0.03},
+            {"diagnosis": "vasculitis", "prevalence": 0.01}
+        ],
+        "symptoms": ["joint pain", "rash", "fatigue", "fever"],
+        "labs": ["ANA", "RF", "ESR", "CRP"],
+        "imaging": ["joint xray", "chest xray"]
+    }
+
+
+def _hematology() -> Dict[str, Any]:
+    """hematology patterns"""
+    return {
+        "diagnoses": [
+            {"diagnosis": "sickle cell crisis", "prevalence": 0.01},
+            {"diagnosis": "thrombotic thrombocytopenic purpura", "prevalence": 0.005}
+        ],
+        "symptoms": ["pain", "anemia", "jaundice", "petechiae"],
+        "labs": ["CBC", "LDH", "haptoglobin", "peripheral smear"],
+        "imaging": ["abdominal ultrasound"]
+    }
+
+
+def _infectious_disease() -> Dict[str, Any]:
+    """infectious disease patterns"""
+    return {
+        "diagnoses": [
+            {"diagnosis": "tuberculosis", "prevalence": 0.01},
+            {"diagnosis": "HIV/AIDS", "prevalence": 0.01},
+            {"diagnosis": "malaria", "prevalence": 0.005}
+        ],
+        "symptoms": ["fever", "night sweats", "weight loss", "cough"],
+        "labs": ["HIV test", "TB quantiferon", "malaria smear"],
+        "imaging": ["chest xray", "CT scan"]
+    }
+
+
+# builders for each specialty's patterns, run the first time that specialty is used
+_SPECIALTY_BUILDERS: Dict[str, Callable[[], Dict[str, Any]]] = {
+    'emergency_medicine': _emergency_medicine,
+    'cardiology': _cardiology,
+    'neurology': _neurology,
+    'respiratory': _respiratory,
+    'rheumatology': _rheumatology,
+    'hematology': _hematology,
+    'infectious_disease': _infectious_disease
+}
+
+
+# typical minutes spent in each phase of a visit, before randomness
+_BASE_TIMES = {
+    'arrival_to_diagnosis': 30,
+    'diagnosis_to_treatment': 15,
+    'treatment_to_discharge': 120
+}
+_BASE_TIME_VALUES = np.fromiter(_BASE_TIMES.values(), dtype=np.float64)
+
+
+# scenarios are drawn in chunks of this many, each from its own seeded generator, so the
+# output depends only on the instance seed and never on how chunks map to processes
+_SCENARIO_CHUNK = 256
+# each spawned worker pays a couple of seconds importing numpy and numba, worth it only
+# for batches this large
+_PARALLEL_MIN_SCENARIOS = 50000
+# symptoms that lead the chief complaint whenever a cluster includes one
+_PRIMARY_SYMPTOMS = frozenset({'chest pain', 'shortness of breath', 'abdominal pain', 'headache'})
+
+
+# base outcomes by diagnosis
+_OUTCOME_TEMPLATES: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    'STEMI': MappingProxyType({'disposition': 'admitted', 'length_of_stay': 3, 'mortality': 0.05}),
+    'NSTEMI': MappingProxyType({'disposition': 'admitted', 'length_of_stay': 2, 'mortality': 0.03}),
+    'copd exacerbation': MappingProxyType({'disposition': 'admitted', 'length_of_stay': 2, 'mortality': 0.02}),
+    'pneumonia': MappingProxyType({'disposition': 'admitted', 'length_of_stay': 3, 'mortality': 0.04}),
+    'appendicitis': MappingProxyType({'disposition': 'admitted', 'length_of_stay': 1, 'mortality': 0.01})
+})
+_DEFAULT_OUTCOME: Mapping[str, Any] = MappingProxyType({
+    'disposition': 'discharged',
+    'length_of_stay': 1,
+    'mortality': 0.01
+})
+
+# (low, high) ranges for each vital sign by diagnosis
+_VITAL_TEMPLATES = MappingProxyType({
+    'STEMI': {
+        'heart_rate': (90, 120),
+        'bp_systolic': (140, 180),
+        'bp_diastolic': (90, 110),
+        'respiratory_rate': (18, 24),
+        'oxygen_saturation': (92, 98),
+        'temperature': (98.0, 99.5)
+    },
+    'copd exacerbation': {
+        'heart_rate': (100, 130),
+        'bp_systolic': (130, 160),
+        'bp_diastolic': (80, 100),
+        'respiratory_rate': (24, 32),
+        'oxygen_saturation': (85, 92),
+        'temperature': (98.5, 100.5)
+    }
+})
+_DEFAULT_VITALS = MappingProxyType({
+    'heart_rate': (70, 100),
+    'bp_systolic': (110, 140),
+    'bp_diastolic': (70, 90),
+    'respiratory_rate': (16, 20),
+    'oxygen_saturation': (95, 99),
+    'temperature': (97.5, 99.0)
+})
+
+# diagnosis catalogs copied into each scenario; stored as tuples so the shared copy stays intact
+_SECONDARY_DIAGNOSES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'STEMI': ('hypertension', 'diabetes', 'hyperlipidemia'),
+    'copd exacerbation': ('hypertension', 'pneumonia'),
+    'pneumonia': ('copd', 'diabetes'),
+    'appendicitis': ('hypertension',)
+})
+_ICD_CODES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'STEMI': ('I21.9',),
+    'NSTEMI': ('I21.4',),
+    'copd exacerbation': ('J44.1',),
+    'pneumonia': ('J18.9',),
+    'appendicitis': ('K35.90',)
+})
+_DEFAULT_ICD_CODES = ('Z51.9',)
+_LEARNING_OBJECTIVES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'STEMI': (
+        'recognize symptoms of acute coronary syndrome',
+        'order appropriate cardiac workup',
+        'initiate timely treatment for stemi',
+        'manage complications of myocardial infarction'
+    ),
+    'copd exacerbation': (
+        'recognize copd exacerbation',
+        'assess respiratory status',
+        'initiate appropriate bronchodilator therapy',
+        'manage hypoxemia and respiratory distress'
+    )
+})
+_DEFAULT_LEARNING_OBJECTIVES = (
+    'assess patient presentation',
+    'formulate differential diagnosis',
+    'initiate appropriate treatment',
+    'monitor patient response'
+)
+
+
+@lru_cache(maxsize=256)
+def _key_action(treatment_name: str, timing: str) -> str:
+    """the action a trainee is expected to take for a treatment given its timing"""
+    if timing == 'immediate':
+        return f"administer {treatment_name} immediately"
+    if timing == 'urgent':
+        return f"order {treatment_name} urgently"
+    return f"consider {treatment_name}"
+
+
+def _base_outcome(diagnosis: Dict[str, Any]) -> Tuple[str, float, float]:
+    """expected disposition, length of stay and mortality risk for a diagnosis"""
+    diagnosis_name = diagnosis['diagnosis']
+    difficulty = diagnosis.get('difficulty', 'medium')
     
-    def get_patterns_by_specialty(self, specialty: str) -> Dict[str, Any]:
-        """get patterns for specific specialty"""
-        return self.pattern_library.get(specialty, {})
+    base_outcome = _OUTCOME_TEMPLATES.get(diagnosis_name, _DEFAULT_OUTCOME)
+    length_of_stay = base_outcome['length_of_stay']
+    mortality = base_outcome['mortality']
+    
+    # adjust based on difficulty
+    if difficulty == 'hard':
+        mortality *= 1.5
+        length_of_stay *= 1.2
+    
+    return base_outcome['disposition'], length_of_stay, mortality
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class CompiledPattern:
+    """a pattern's draw tables as parallel arrays, for vectorized sampling"""
+    age_lo: int
+    age_hi: int
+    gender_names: np.ndarray
+    gender_cum: np.ndarray
+    diagnosis_names: np.ndarray
+    diagnosis_difficulty: np.ndarray
+    diagnosis_cum: np.ndarray
+    diagnosis_disposition: np.ndarray
+    diagnosis_stay: np.ndarray
+    diagnosis_mortality: np.ndarray
+    treatment_names: np.ndarray
+    treatment_freq: np.ndarray
+
+
+def _compile_pattern(pattern_data: Mapping[str, Any]) -> CompiledPattern:
+    """gather a pattern's demographics, diagnoses and expected outcomes into arrays"""
+    demographics = pattern_data['demographics']
+    age_range = demographics.get('age_range', (30, 70))
+    gender_dist = demographics.get('gender_distribution', {'male': 0.5, 'female': 0.5})
+    diagnoses = pattern_data['diagnoses']
+    dispositions, stays, mortalities = zip(*(_base_outcome(diagnosis) for diagnosis in diagnoses))
+    return CompiledPattern(
+        age_lo=age_range[0],
+        age_hi=age_range[1],
+        gender_names=np.array(list(gender_dist), dtype=object),
+        gender_cum=np.cumsum(np.fromiter(gender_dist.values(), dtype=np.float64)),
+        diagnosis_names=np.array([d['diagnosis'] for d in diagnoses], dtype=object),
+        diagnosis_difficulty=np.array([d.get('difficulty', 'medium') for d in diagnoses], dtype=object),
+        diagnosis_cum=np.cumsum(np.fromiter((d['frequency'] for d in diagnoses), dtype=np.float64)),
+        diagnosis_disposition=np.array(dispositions, dtype=object),
+        diagnosis_stay=np.array(stays, dtype=np.float64),
+        diagnosis_mortality=np.array(mortalities, dtype=np.float64),
+        treatment_names=np.array([t['treatment'] for t in pattern_data['treatments']], dtype=object),
+        treatment_freq=np.fromiter((t['frequency'] for t in pattern_data['treatments']), dtype=np.float64))
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class _PatternTables:
+    """tables derived from one catalog pattern, kept beside it so the pattern dict stays as built"""
+    # the catalog dict these were derived from; a pattern dict from anywhere else has none
+    source: Mapping[str, Any] = field(repr=False, compare=False)
+    pattern_id: str
+    # running sums of the static frequencies, so weighted draws skip recomputing them
+    cluster_cum: Tuple[float, ...]
+    diagnosis_cum: Tuple[float, ...]
+    # demographic pools as tuples, so each draw skips rebuilding lists from the dicts
+    genders: Tuple[str, ...]
+    gender_cum: Tuple[float, ...]
+    risk_factors: Tuple[str, ...]
+    # difficulties with at least one diagnosis, which the difficulty filters match against
+    difficulties: FrozenSet[str]
+    compiled: CompiledPattern
+
+
+# derived tables for each built catalog pattern, by (specialty, pattern name)
+_PATTERN_TABLES: Dict[Tuple[str, str], _PatternTables] = {}
+
+
+def _derive_tables(specialty: str, pattern_name: str, pattern_data: Mapping[str, Any]) -> _PatternTables:
+    """everything scenario draws need from a pattern beyond the pattern dict itself"""
+    demographics = pattern_data['demographics']
+    gender_dist = demographics.get('gender_distribution', {'male': 0.5, 'female': 0.5})
+    diagnoses = pattern_data['diagnoses']
+    return _PatternTables(
+        source=pattern_data,
+        # copied into every generated scenario, so share one object per pattern
+        pattern_id=sys.intern(f"{specialty}_{pattern_name}"),
+        cluster_cum=tuple(accumulate(cluster['frequency'] for cluster in pattern_data['symptom_clusters'])),
+        diagnosis_cum=tuple(accumulate(diagnosis['frequency'] for diagnosis in diagnoses)),
+        genders=tuple(gender_dist),
+        gender_cum=tuple(accumulate(gender_dist.values())),
+        risk_factors=tuple(demographics.get('risk_factors', ())),
+        difficulties=frozenset(diagnosis['difficulty'] for diagnosis in diagnoses if diagnosis.get('difficulty')),
+        compiled=_compile_pattern(pattern_data))
+
+
+def _pattern_tables(pattern: Mapping[str, Any]) -> Optional[_PatternTables]:
+    """derived tables for a pattern entry drawn from the catalog, or None for any other pattern"""
+    tables = _PATTERN_TABLES.get((pattern.get('specialty', ''), pattern.get('pattern_name', '')))
+    if tables is not None and tables.source is pattern['pattern_data']:
+        return tables
+    return None
+
+
+def _weighted_choice(rng: random.Random, population: Sequence[Any], cum_weights: Sequence[float]) -> Any:
+    """rng.choices(population, cum_weights=cum_weights)[0] without building a result list"""
+    return population[bisect(cum_weights, rng.random() * cum_weights[-1], 0, len(population) - 1)]
+
+
+@lru_cache(maxsize=None)
+def _specialty(specialty: str) -> Mapping[str, Any]:
+    """build one specialty's patterns, deriving the tables each needs at draw time beside them"""
+    specialty_patterns = _SPECIALTY_BUILDERS[specialty]()
+    for pattern_name, pattern_data in specialty_patterns.items():
+        if not isinstance(pattern_data, dict):
+            continue
+        # names are copied into every generated scenario, so share one object per name;
+        # interned strings compare equal, so the pattern reads exactly as built
+        for diagnosis in pattern_data['diagnoses']:
+            diagnosis['diagnosis'] = sys.intern(diagnosis['diagnosis'])
+        for treatment in pattern_data['treatments']:
+            treatment['treatment'] = sys.intern(treatment['treatment'])
+        _PATTERN_TABLES[specialty, pattern_name] = _derive_tables(specialty, pattern_name, pattern_data)
+    return MappingProxyType(specialty_patterns)
+
+
+def _split_treatments(treatments: List[Dict[str, Any]]) -> Tuple[List[str], List[str], List[str]]:
+    """split selected treatments into medications, procedures and the full sequence in one pass"""
+    medications: List[str] = []
+    procedures: List[str] = []
+    sequence: List[str] = []
+    for treatment in treatments:
+        name = treatment['treatment']
+        lowered = name.lower()
+        sequence.append(name)
+        if 'medication' in lowered:
+            medications.append(name)
+        if 'procedure' in lowered:
+            procedures.append(name)
+    return medications, procedures, sequence
+
+
+class _PatternLibrary(Mapping):
+    """read-only catalog of clinical patterns by specialty, each specialty built on first use"""
+    
+    def __getitem__(self, specialty: str) -> Mapping[str, Any]:
+        if specialty not in _SPECIALTY_BUILDERS:
+            raise KeyError(specialty)
+        return _specialty(specialty)
+    
+    def __contains__(self, specialty: object) -> bool:
+        return specialty in _SPECIALTY_BUILDERS
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(_SPECIALTY_BUILDERS)
+    
+    def __len__(self) -> int:
+        return len(_SPECIALTY_BUILDERS)
+
+
+# one catalog shared read-only by every ClinicalPatterns instance
+_PATTERN_LIBRARY = _PatternLibrary()
+# returned for unknown specialties, so every lookup hands back the same kind of view
+_EMPTY_VIEW: Mapping[str, Any] = MappingProxyType({})
+
+
+def _index_patterns(library: Mapping[str, Mapping[str, Any]]) -> Tuple[Dict, Dict]:
+    """index pattern entries by (specialty, difficulty) and diagnosis entries by difficulty"""
+    # None in either half of the key matches any specialty or difficulty
+    by_filter: Dict[Tuple[Optional[str], Optional[str]], List[Dict[str, Any]]] = defaultdict(list)
+    by_difficulty: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for specialty, specialty_patterns in library.items():
+        for pattern_name, pattern_data in specialty_patterns.items():
+            # summary-only specialties hold plain lists here rather than patterns
+            if not isinstance(pattern_data, dict):
+                continue
+            entry = {'specialty': specialty, 'pattern_name': pattern_name, 'pattern_data': pattern_data}
+            for diagnosis in pattern_data.get('diagnoses', []):
+                by_difficulty[diagnosis.get('difficulty')].append({**entry, 'diagnosis': diagnosis})
+            for spec in (specialty, None):
+                by_filter[spec, None].append(entry)
+                for difficulty in _PATTERN_TABLES[specialty, pattern_name].difficulties:
+                    by_filter[spec, difficulty].append(entry)
+    return dict(by_filter), dict(by_difficulty)
+
+
+@lru_cache(maxsize=None)
+def _pattern_index(specialty: Optional[str]) -> Tuple[Dict, Dict]:
+    """indexes over one specialty, or over the whole library when specialty is None"""
+    if specialty is None:
+        return _index_patterns(_PATTERN_LIBRARY)
+    return _index_patterns({specialty: _PATTERN_LIBRARY[specialty]})
+
+
+class ClinicalPatterns:
+    """manages clinical patterns and templates for scenario generation"""
+    
+    def __init__(self, seed: Optional[int] = None):
+        self.templates: Dict[str, ClinicalTemplate] = {}
+        self.pattern_library = _PATTERN_LIBRARY
+        # dedicated generator so scenarios can be replayed under a seed
+        self._rng = random.Random(seed)
+    
+    def seed(self, seed: Optional[int]) -> None:
+        """reseed the generator used to draw scenarios"""
+        self._rng.seed(seed)
+    
+    def get_patterns_by_specialty(self, specialty: str) -> Mapping[str, Any]:
+        """get patterns for specific specialty as a read-only view of the shared catalog
+        
+        only the view itself is read-only: the pattern dicts in it are the catalog every instance
+        draws from, so hold on to them freely but copy a pattern before changing it
+        """
+        return _PATTERN_LIBRARY.get(specialty, _EMPTY_VIEW)
     
     def get_patterns_by_difficulty(self, difficulty: str) -> List[Dict[str, Any]]:
         """get patterns by difficulty level"""
-        patterns = []
-        for specialty, specialty_patterns in self.pattern_library.items():
-            for pattern_name, pattern_data in specialty_patterns.items():
-                for diagnosis in pattern_data.get('diagnoses', []):
-                    if diagnosis.get('difficulty') == difficulty:
-                        patterns.append({
-                            'specialty': specialty,
-                            'pattern_name': pattern_name,
-                            'pattern_data': pattern_data,
-                            'diagnosis': diagnosis
-                        })
-        return patterns
+        _, by_difficulty = _pattern_index(None)
+        return [dict(entry) for entry in by_difficulty.get(difficulty, ())]
     
     def get_random_pattern(self, specialty: Optional[str] = None, difficulty: Optional[str] = None) -> Dict[str, Any]:
         """get a random pattern matching criteria"""
-        available_patterns = []
-        
-        for spec, specialty_patterns in self.pattern_library.items():
-            if specialty and spec != specialty:
-                continue
-                
-            for pattern_name, pattern_data in specialty_patterns.items():
-                if difficulty:
-                    # check if any diagnosis matches difficulty
-                    diagnoses = pattern_data.get('diagnoses', [])
-                    if not any(d.get('difficulty') == difficulty for d in diagnoses):
-                        continue
-                
-                available_patterns.append({
-                    'specialty': spec,
-                    'pattern_name': pattern_name,
-                    'pattern_data': pattern_data
-                })
+        # a named specialty only needs that specialty built
+        if specialty and specialty not in _PATTERN_LIBRARY:
+            return {}
+        by_filter, _ = _pattern_index(specialty or None)
+        available_patterns = by_filter.get((specialty or None, difficulty or None))
         
         if available_patterns:
-            return random.choice(available_patterns)
+            return dict(self._rng.choice(available_patterns))
         else:
             return {}
     
     def generate_scenario_from_pattern(self, pattern: Dict[str, Any], 
-                                     user_performance: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
-        """generate a scenario from a clinical pattern"""
+                                     user_performance: Optional[Dict[str, float]] = None,
+                                     arrival_time: Optional[datetime] = None) -> Dict[str, Any]:
+        """generate a scenario from a clinical pattern, arriving now unless an arrival time is given"""
         if not pattern:
             return {}
         
@@ -423,14 +758,19 @@ class ClinicalPatterns:
         # adjust difficulty based on user performance
         difficulty_modifier = self._calculate_difficulty_modifier(user_performance)
         
+        # catalog patterns come with precomputed tables; any other pattern is read directly
+        tables = _pattern_tables(pattern)
+        
         # generate demographics
-        demographics = self._generate_demographics(pattern_data['demographics'])
+        demographics = self._generate_demographics(pattern_data['demographics'], tables)
         
         # select symptom cluster
-        symptom_cluster = self._select_symptom_cluster(pattern_data['symptom_clusters'])
+        symptom_cluster = self._select_symptom_cluster(pattern_data['symptom_clusters'],
+                                                       tables.cluster_cum if tables else None)
         
         # select diagnosis
-        diagnosis = self._select_diagnosis(pattern_data['diagnoses'], difficulty_modifier)
+        diagnosis = self._select_diagnosis(pattern_data['diagnoses'], difficulty_modifier,
+                                           tables.diagnosis_cum if tables else None)
         
         # select treatments
         treatments = self._select_treatments(pattern_data['treatments'])
@@ -441,8 +781,10 @@ class ClinicalPatterns:
         # generate outcome
         outcome = self._generate_outcome(diagnosis, treatments)
         
+        medications, procedures, sequence = _split_treatments(treatments)
+        
         scenario = {
-            'pattern_id': f"{specialty}_{pattern_name}",
+            'pattern_id': tables.pattern_id if tables else f"{specialty}_{pattern_name}",
             'specialty': specialty,
             'difficulty': diagnosis.get('difficulty', 'medium'),
             'demographics': demographics,
@@ -450,7 +792,7 @@ class ClinicalPatterns:
                 'chief_complaint': self._generate_chief_complaint(symptom_cluster),
                 'symptoms': symptom_cluster['symptoms'],
                 'vital_signs': self._generate_vital_signs(diagnosis['diagnosis']),
-                'arrival_time': datetime.now()
+                'arrival_time': arrival_time or datetime.now()
             },
             'diagnosis': {
                 'primary': diagnosis['diagnosis'],
@@ -458,9 +800,9 @@ class ClinicalPatterns:
                 'icd_codes': self._get_icd_codes(diagnosis['diagnosis'])
             },
             'treatment': {
-                'medications': [t['treatment'] for t in treatments if 'medication' in t['treatment'].lower()],
-                'procedures': [t['treatment'] for t in treatments if 'procedure' in t['treatment'].lower()],
-                'sequence': [t['treatment'] for t in treatments]
+                'medications': medications,
+                'procedures': procedures,
+                'sequence': sequence
             },
             'outcome': outcome,
             'temporal_data': temporal_data,
@@ -470,6 +812,59 @@ class ClinicalPatterns:
         
         return scenario
     
+    def generate_scenarios(self, n: int, specialty: Optional[str] = None, difficulty: Optional[str] = None,
+                           user_performance: Optional[Dict[str, float]] = None,
+                           workers: int = 0) -> List[Dict[str, Any]]:
+        """generate n scenarios from random matching patterns, optionally across worker processes"""
+        # read the clock once for the whole batch rather than once per scenario
+        arrival_time = datetime.now()
+        items = [(self._rng.getrandbits(64), min(_SCENARIO_CHUNK, n - start), specialty, difficulty,
+                  user_performance, arrival_time) for start in range(0, n, _SCENARIO_CHUNK)]
+        
+        # scenarios are independent, so large batches can be spread across processes
+        if workers > 1 and n >= _PARALLEL_MIN_SCENARIOS:
+            with multiprocessing.get_context("spawn").Pool(workers) as pool:
+                chunks = pool.imap(_generate_chunk, items)
+                return [scenario for chunk in chunks for scenario in chunk]
+        return [scenario for item in items for scenario in _generate_chunk(item)]
+    
+    def generate_scenarios_bulk(self, pattern: Dict[str, Any], n: int,
+                                seed: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """draw demographics, diagnosis, treatments, outcome and timing for n scenarios as column arrays
+        
+        'treatments' is an (n, k) boolean mask over the pattern's k treatments, in pattern order
+        """
+        if not pattern:
+            return {}
+        
+        tables = _pattern_tables(pattern)
+        compiled = tables.compiled if tables is not None else _compile_pattern(pattern['pattern_data'])
+        
+        # every random draw comes from one seeded generator, so results do not depend on
+        # how the kernel splits rows across threads
+        # without an explicit seed the bulk draws still follow the instance generator
+        rng = np.random.default_rng(seed if seed is not None else self._rng.getrandbits(64))
+        uniforms = rng.random((n, _U_TIMES + len(_BASE_TIME_VALUES)))
+        ages, genders, picks, stays, mortality, readmission, times = _sample_scenarios(
+            uniforms, compiled.age_lo, compiled.age_hi, compiled.gender_cum, compiled.diagnosis_cum,
+            compiled.diagnosis_stay, compiled.diagnosis_mortality, _BASE_TIME_VALUES)
+        
+        scenarios = {
+            'age': ages,
+            'gender': compiled.gender_names[genders],
+            'diagnosis': compiled.diagnosis_names[picks],
+            'difficulty': compiled.diagnosis_difficulty[picks],
+            'disposition': compiled.diagnosis_disposition[picks],
+            'length_of_stay': stays,
+            'mortality': mortality,
+            'readmission': readmission
+        }
+        for column, key in enumerate(_BASE_TIMES):
+            scenarios[key] = times[:, column]
+        scenarios['treatments'] = self._select_treatments_bulk(compiled, n, rng)
+        
+        return scenarios
+    
     def _calculate_difficulty_modifier(self, user_performance: Optional[Dict[str, float]]) -> float:
         """calculate difficulty modifier based on user performance"""
         if not user_performance:
@@ -486,102 +881,90 @@ class ClinicalPatterns:
         else:
             return 1.0
     
-    def _generate_demographics(self, demographics_template: Dict[str, Any]) -> Dict[str, Any]:
-        """generate patient demographics from template"""
+    def _generate_demographics(self, demographics_template: Dict[str, Any],
+                               tables: Optional[_PatternTables] = None) -> Dict[str, Any]:
+        """generate patient demographics from template, or from its pattern's tables when given"""
         age_range = demographics_template.get('age_range', (30, 70))
-        age = random.randint(age_range[0], age_range[1])
+        age = self._rng.randint(age_range[0], age_range[1])
         
-        gender_dist = demographics_template.get('gender_distribution', {'male': 0.5, 'female': 0.5})
-        gender = random.choices(list(gender_dist.keys()), weights=list(gender_dist.values()))[0]
-        
-        risk_factors = demographics_template.get('risk_factors', [])
-        selected_risk_factors = random.sample(risk_factors, min(len(risk_factors), random.randint(1, 3)))
+        if tables is None:
+            gender_dist = demographics_template.get('gender_distribution', {'male': 0.5, 'female': 0.5})
+            gender = self._rng.choices(list(gender_dist.keys()), weights=list(gender_dist.values()))[0]
+            risk_factors = demographics_template.get('risk_factors', [])
+        else:
+            gender = _weighted_choice(self._rng, tables.genders, tables.gender_cum)
+            risk_factors = tables.risk_factors
+        # draw the count only when there is something to pick from
+        selected_risk_factors = (self._rng.sample(risk_factors, min(len(risk_factors), self._rng.randint(1, 3)))
+                                 if risk_factors else [])
         
         return {
             'age': age,
             'gender': gender,
             'risk_factors': selected_risk_factors,
-            'race': random.choice(['white', 'black', 'hispanic', 'asian', 'other']),
-            'ethnicity': random.choice(['hispanic', 'non-hispanic']),
-            'insurance': random.choice(['private', 'medicare', 'medicaid', 'uninsured'])
+            'race': self._rng.choice(['white', 'black', 'hispanic', 'asian', 'other']),
+            'ethnicity': self._rng.choice(['hispanic', 'non-hispanic']),
+            'insurance': self._rng.choice(['private', 'medicare', 'medicaid', 'uninsured'])
         }
     
-    def _select_symptom_cluster(self, symptom_clusters: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _select_symptom_cluster(self, symptom_clusters: List[Dict[str, Any]],
+                                cum_weights: Optional[Sequence[float]] = None) -> Dict[str, Any]:
         """select a symptom cluster based on frequency"""
-        weights = [cluster['frequency'] for cluster in symptom_clusters]
-        return random.choices(symptom_clusters, weights=weights)[0]
+        if cum_weights is None:
+            cum_weights = list(accumulate(cluster['frequency'] for cluster in symptom_clusters))
+        return _weighted_choice(self._rng, symptom_clusters, cum_weights)
     
-    def _select_diagnosis(self, diagnoses: List[Dict[str, Any]], difficulty_modifier: float) -> Dict[str, Any]:
+    def _select_diagnosis(self, diagnoses: List[Dict[str, Any]], difficulty_modifier: float,
+                          cum_weights: Optional[Sequence[float]] = None) -> Dict[str, Any]:
         """select diagnosis based on frequency and difficulty"""
-        # adjust frequencies based on difficulty modifier
-        adjusted_diagnoses = []
-        for diagnosis in diagnoses:
-            adjusted_freq = diagnosis['frequency'] * difficulty_modifier
-            adjusted_diagnoses.append({**diagnosis, 'frequency': adjusted_freq})
+        # unmodified frequencies can use the pattern's precomputed running sums
+        if difficulty_modifier == 1.0 and cum_weights is not None:
+            return _weighted_choice(self._rng, diagnoses, cum_weights)
         
-        weights = [d['frequency'] for d in adjusted_diagnoses]
-        return random.choices(adjusted_diagnoses, weights=weights)[0]
+        # adjust frequencies based on difficulty modifier
+        weights = [diagnosis['frequency'] * difficulty_modifier for diagnosis in diagnoses]
+        return self._rng.choices(diagnoses, weights=weights)[0]
     
     def _select_treatments(self, treatments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """select treatments based on frequency"""
         selected_treatments = []
         for treatment in treatments:
-            if random.random() < treatment['frequency']:
+            if self._rng.random() < treatment['frequency']:
                 selected_treatments.append(treatment)
         
         # ensure at least one treatment is selected
         if not selected_treatments:
-            selected_treatments = [random.choice(treatments)]
+            selected_treatments = [self._rng.choice(treatments)]
         
         return selected_treatments
     
-    def _generate_temporal_data(self, pattern_data: Dict[str, Any]) -> Dict[str, float]:
-        """generate temporal data for scenario"""
-        base_times = {
-            'arrival_to_diagnosis': 30,  # minutes
-            'diagnosis_to_treatment': 15,  # minutes
-            'treatment_to_discharge': 120   # minutes
-        }
+    def _select_treatments_bulk(self, compiled: CompiledPattern, n: int, rng: np.random.Generator) -> np.ndarray:
+        """select treatments for n scenarios at once as a boolean mask"""
+        treatment_count = compiled.treatment_freq.shape[0]
+        selected = rng.random((n, treatment_count)) < compiled.treatment_freq
         
-        # add some randomness
-        temporal_data = {}
-        for key, base_time in base_times.items():
-            variation = random.uniform(0.7, 1.3)
-            temporal_data[key] = base_time * variation
+        # ensure at least one treatment is selected
+        missing = np.flatnonzero(~selected.any(axis=1))
+        selected[missing, rng.integers(treatment_count, size=missing.shape[0])] = True
         
-        return temporal_data
+        return selected
+    
+    def _generate_temporal_data(self, pattern_data: Dict[str, Any]) -> Dict[str, float]:
+        """generate temporal data for scenario"""
+        # vary each phase by up to 30%; generate_scenarios_bulk draws the same for many scenarios at once
+        uniform = self._rng.uniform
+        return {key: base_time * uniform(0.7, 1.3) for key, base_time in _BASE_TIMES.items()}
     
     def _generate_outcome(self, diagnosis: Dict[str, Any], treatments: List[Dict[str, Any]]) -> Dict[str, Any]:
         """generate patient outcome based on diagnosis and treatments"""
-        diagnosis_name = diagnosis['diagnosis']
-        difficulty = diagnosis.get('difficulty', 'medium')
-        
-        # base outcomes by diagnosis
-        outcome_templates = {
-            'STEMI': {'disposition': 'admitted', 'length_of_stay': 3, 'mortality': 0.05},
-            'NSTEMI': {'disposition': 'admitted', 'length_of_stay': 2, 'mortality': 0.03},
-            'copd exacerbation': {'disposition': 'admitted', 'length_of_stay': 2, 'mortality': 0.02},
-            'pneumonia': {'disposition': 'admitted', 'length_of_stay': 3, 'mortality': 0.04},
-            'appendicitis': {'disposition': 'admitted', 'length_of_stay': 1, 'mortality': 0.01}
-        }
-        
-        base_outcome = outcome_templates.get(diagnosis_name, {
-            'disposition': 'discharged',
-            'length_of_stay': 1,
-            'mortality': 0.01
-        })
-        
-        # adjust based on difficulty
-        if difficulty == 'hard':
-            base_outcome['mortality'] *= 1.5
-            base_outcome['length_of_stay'] *= 1.2
+        disposition, length_of_stay, mortality = _base_outcome(diagnosis)
         
         # add randomness
         outcome = {
-            'disposition': base_outcome['disposition'],
-            'length_of_stay': base_outcome['length_of_stay'] * random.uniform(0.8, 1.2),
-            'mortality': random.random() < base_outcome['mortality'],
-            'readmission': random.random() < 0.1
+            'disposition': disposition,
+            'length_of_stay': length_of_stay * self._rng.uniform(0.8, 1.2),
+            'mortality': self._rng.random() < mortality,
+            'readmission': self._rng.random() < 0.1
         }
         
         return outcome
@@ -589,110 +972,46 @@ class ClinicalPatterns:
     def _generate_chief_complaint(self, symptom_cluster: Dict[str, Any]) -> str:
         """generate chief complaint from symptom cluster"""
         symptoms = symptom_cluster['symptoms']
-        primary_symptoms = ['chest pain', 'shortness of breath', 'abdominal pain', 'headache']
         
         for symptom in symptoms:
-            if symptom in primary_symptoms:
+            if symptom in _PRIMARY_SYMPTOMS:
                 return f"patient complains of {symptom}"
         
         return f"patient complains of {symptoms[0]}"
     
     def _generate_vital_signs(self, diagnosis: str) -> Dict[str, float]:
         """generate vital signs based on diagnosis"""
-        vital_templates = {
-            'STEMI': {
-                'heart_rate': (90, 120),
-                'bp_systolic': (140, 180),
-                'bp_diastolic': (90, 110),
-                'respiratory_rate': (18, 24),
-                'oxygen_saturation': (92, 98),
-                'temperature': (98.0, 99.5)
-            },
-            'copd exacerbation': {
-                'heart_rate': (100, 130),
-                'bp_systolic': (130, 160),
-                'bp_diastolic': (80, 100),
-                'respiratory_rate': (24, 32),
-                'oxygen_saturation': (85, 92),
-                'temperature': (98.5, 100.5)
-            }
-        }
-        
-        template = vital_templates.get(diagnosis, {
-            'heart_rate': (70, 100),
-            'bp_systolic': (110, 140),
-            'bp_diastolic': (70, 90),
-            'respiratory_rate': (16, 20),
-            'oxygen_saturation': (95, 99),
-            'temperature': (97.5, 99.0)
-        })
+        template = _VITAL_TEMPLATES.get(diagnosis, _DEFAULT_VITALS)
         
         vitals = {}
         for vital, (min_val, max_val) in template.items():
-            vitals[vital] = random.uniform(min_val, max_val)
+            vitals[vital] = self._rng.uniform(min_val, max_val)
         
         return vitals
     
     def _generate_secondary_diagnoses(self, primary_diagnosis: str) -> List[str]:
         """generate secondary diagnoses"""
-        secondary_map = {
-            'STEMI': ['hypertension', 'diabetes', 'hyperlipidemia'],
-            'copd exacerbation': ['hypertension', 'pneumonia'],
-            'pneumonia': ['copd', 'diabetes'],
-            'appendicitis': ['hypertension']
-        }
-        
-        return secondary_map.get(primary_diagnosis, [])
+        return list(_SECONDARY_DIAGNOSES.get(primary_diagnosis, ()))
     
     def _get_icd_codes(self, diagnosis: str) -> List[str]:
         """get icd codes for diagnosis"""
-        icd_map = {
-            'STEMI': ['I21.9'],
-            'NSTEMI': ['I21.4'],
-            'copd exacerbation': ['J44.1'],
-            'pneumonia': ['J18.9'],
-            'appendicitis': ['K35.90']
-        }
-        
-        return icd_map.get(diagnosis, ['Z51.9'])
+        return list(_ICD_CODES.get(diagnosis, _DEFAULT_ICD_CODES))
     
     def _generate_learning_objectives(self, diagnosis: str) -> List[str]:
         """generate learning objectives for diagnosis"""
-        objectives_map = {
-            'STEMI': [
-                'recognize symptoms of acute coronary syndrome',
-                'order appropriate cardiac workup',
-                'initiate timely treatment for stemi',
-                'manage complications of myocardial infarction'
-            ],
-            'copd exacerbation': [
-                'recognize copd exacerbation',
-                'assess respiratory status',
-                'initiate appropriate bronchodilator therapy',
-                'manage hypoxemia and respiratory distress'
-            ]
-        }
-        
-        return objectives_map.get(diagnosis, [
-            'assess patient presentation',
-            'formulate differential diagnosis',
-            'initiate appropriate treatment',
-            'monitor patient response'
-        ])
+        return list(_LEARNING_OBJECTIVES.get(diagnosis, _DEFAULT_LEARNING_OBJECTIVES))
     
     def _generate_key_actions(self, diagnosis: str, treatments: List[Dict[str, Any]]) -> List[str]:
         """generate key actions for scenario"""
-        actions = []
-        
-        for treatment in treatments:
-            treatment_name = treatment['treatment']
-            timing = treatment.get('timing', 'routine')
-            
-            if timing == 'immediate':
-                actions.append(f"administer {treatment_name} immediately")
-            elif timing == 'urgent':
-                actions.append(f"order {treatment_name} urgently")
-            else:
-                actions.append(f"consider {treatment_name}")
-        
-        return actions 
\ No newline at end of file
+        return [_key_action(treatment['treatment'], treatment.get('timing', 'routine'))
+                for treatment in treatments]
+
+
+def _generate_chunk(item: Tuple[int, int, Optional[str], Optional[str],
+                                Optional[Dict[str, float]], datetime]) -> List[Dict[str, Any]]:
+    """generate one seeded chunk of scenarios; runs in worker processes"""
+    seed, count, specialty, difficulty, user_performance, arrival_time = item
+    patterns = ClinicalPatterns(seed)
+    return [patterns.generate_scenario_from_pattern(patterns.get_random_pattern(specialty, difficulty),
+                                                    user_performance, arrival_time)
+            for _ in range(count)]
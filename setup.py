@@ -2,6 +2,8 @@
 setup script for medical simulator
 """
 
+import os
+
 from setuptools import setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
@@ -10,6 +12,18 @@ with open("README.md", "r", encoding="utf-8") as fh:
 with open("requirements.txt", "r", encoding="utf-8") as fh:
     requirements = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
 
+# opt-in ahead-of-time compilation of pure-python hot modules (MEDSIM_MYPYC=1, needs mypy)
+MYPYC_MODULES = [
+    "medsim/core/procedures.py",
+    "medsim/core/treatments.py",
+    "medsim/data/clinical_patterns.py",
+]
+ext_modules = []
+if os.environ.get("MEDSIM_MYPYC") == "1":
+    from mypyc.build import mypycify
+    # only the listed modules must type-check; modules they import are analyzed quietly
+    ext_modules = mypycify(MYPYC_MODULES + ["--follow-imports=silent"])
+
 setup(
     name="medsim",
     version="0.1.0",
@@ -18,6 +32,8 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     packages=find_packages(),
+    package_data={"medsim.core.data": ["*.json"]},
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Education",
@@ -30,6 +46,9 @@ setup(
     ],
     python_requires=">=3.9",
     install_requires=requirements,
+    extras_require={
+        "fast": ["numba>=0.57", "orjson>=3.8", "google-re2>=1.0"],
+    },
     entry_points={
         "console_scripts": [
             "medsim=medsim.cli.interface:main",
@@ -0,0 +1,276 @@
+"""
+unit tests for data anonymizer
+"""
+
+import pandas as pd
+import pytest
+from datetime import datetime
+from medsim.data.anonymizer import DataAnonymizer, AnonymizationConfig, DemographicAction
+
+
+@pytest.fixture
+def anonymizer():
+    # create a new anonymizer with default configuration
+    return DataAnonymizer()
+
+
+class TestCleanTextPii:
+    """test free-text PII scrubbing"""
+    
+    def test_replaces_each_kind_of_pii(self, anonymizer):
+        """test every pattern is replaced by its placeholder"""
+        text = "call 555-123-4567, ssn 123-45-6789, card 1234 5678 9012 3456, mail jo@example.com"
+        
+        assert anonymizer._clean_text_pii(text) == "call [PHONE], ssn [SSN], card [CARD], mail [EMAIL]"
+        assert anonymizer._clean_text_pii("MRN: 12345 and PAT 998877 at 42 Baker Street, zip 90210-1234") == (
+            "[MRN] and [PATIENT_ID] at [ADDRESS], zip [ZIP]")
+    
+    def test_zip_prefix_can_be_preserved(self):
+        """test zip codes keep their first three digits when configured"""
+        anonymizer = DataAnonymizer(AnonymizationConfig(preserve_zip_code_prefix=True))
+        
+        assert anonymizer._clean_text_pii("zip 90210-1234, phone 555.123.4567") == "zip 902XX, phone [PHONE]"
+    
+    def test_names_are_scrubbed_but_medical_terms_kept(self, anonymizer):
+        """test capitalized words become names unless they are medical terms or acronyms"""
+        assert anonymizer._clean_text_pii("John seen for COPD; Symptoms noted") == "[NAME] seen for COPD; Symptoms noted"
+        assert anonymizer._clean_text_pii("no pii here") == "no pii here"
+        assert anonymizer._clean_text_pii("Seen at Main Street") == "[NAME] at [NAME] [NAME]"
+        assert anonymizer._clean_text_pii(42) == 42
+    
+    def test_accented_names_are_scrubbed(self, anonymizer):
+        """test names written with letters outside ascii are scrubbed like any other"""
+        text = "Patient José Müller seen by Dr Ørsted and Zoë Ångström; Élodie notified"
+        
+        assert anonymizer._clean_text_pii(text) == (
+            "[NAME] [NAME] [NAME] seen by Dr [NAME] and [NAME] [NAME]; [NAME] notified")
+        assert anonymizer._clean_text_pii("ÉCG normal, Symptoms stable") == "ÉCG normal, Symptoms stable"
+    
+    def test_repeated_short_text_is_memoized(self, anonymizer):
+        """test identical short strings are cleaned once and long text bypasses the memo"""
+        import pickle
+        from medsim.data.anonymizer import _CLEAN_TEXT_MEMO_MAX_CHARS
+        long_text = "John called 555-123-4567. " * (_CLEAN_TEXT_MEMO_MAX_CHARS // 20)
+        
+        for _ in range(3):
+            assert anonymizer._clean_text_pii("John, 555-123-4567") == "[NAME], [PHONE]"
+        anonymizer._clean_text_pii(long_text)
+        info = anonymizer._cached_clean_text.cache_info()
+        
+        assert (info.hits, info.misses) == (2, 1)
+        assert pickle.loads(pickle.dumps(anonymizer))._clean_text_pii("John") == "[NAME]"
+    
+    def test_memo_follows_config_changes(self, anonymizer):
+        """test changing the zip setting after a call is honoured rather than served from the memo"""
+        assert anonymizer._clean_text_pii("zip 90210") == "zip [ZIP]"
+        
+        anonymizer.config.preserve_zip_code_prefix = True
+        
+        assert anonymizer._clean_text_pii("zip 90210") == "zip 902XX"
+    
+    def test_long_text_scan_matches_short_text_scan(self, anonymizer, monkeypatch):
+        """test the re2 scan used for long text finds exactly what python's re does"""
+        from medsim.data import anonymizer as anonymizer_module
+        pytest.importorskip("re2")
+        text = "call 555-123-4567, MRN: 12345 at 42 Baker Street, mail jo@example.com, zip 90210 " * 3
+        expected = (anonymizer._clean_text_pii(text), anonymizer._scan_pii(text))
+        
+        monkeypatch.setattr(anonymizer_module, "_LINEAR_SCAN_MIN_CHARS", 0)
+        
+        assert anonymizer._pii_pattern(text) is anonymizer._linear_pattern
+        assert (anonymizer._clean_text_pii(text), anonymizer._scan_pii(text)) == expected
+    
+    def test_name_scrubbing_keeps_spacing_and_punctuation(self, anonymizer):
+        """test names are replaced in place without collapsing whitespace"""
+        assert anonymizer._clean_text_pii("Seen by  Smith,\tpt of Dr Jones.") == "[NAME] by  [NAME],\tpt of Dr [NAME]."
+
+
+class TestGenericSections:
+    """test anonymizing sections without a dedicated handler"""
+    
+    def test_nested_sections_are_cleaned_in_place(self, anonymizer):
+        """test nested dicts keep their shape and key order while text is scrubbed"""
+        labs = {"panel": {"troponin": {"value": 1.2, "note": "call 555-123-4567"}, "ordered": ["Smith", 3]},
+                "status": "final"}
+        
+        anonymized = anonymizer._anonymize_generic_section(labs, "r0")
+        
+        assert anonymized == {"panel": {"troponin": {"value": 1.2, "note": "call [PHONE]"},
+                                        "ordered": ["[NAME]", 3]}, "status": "final"}
+        assert list(anonymized["panel"]) == ["troponin", "ordered"]
+    
+    def test_sections_without_text_are_shared(self, anonymizer):
+        """test purely numeric sections are returned as is rather than rebuilt"""
+        vitals = {"heart_rate": [88, 92], "blood_pressure": {"systolic": 120, "diastolic": 80}}
+        
+        assert anonymizer._anonymize_generic_section(vitals, "r0") is vitals
+        assert anonymizer._anonymize_generic_section({"hr": [88, "Smith"]}, "r0") == {"hr": [88, "[NAME]"]}
+
+
+class TestHashIdentifier:
+    """test identifier hashing"""
+    
+    def test_tokens_are_deterministic_per_record(self, anonymizer):
+        """test the same identifier and record always map to one short token"""
+        token = anonymizer._hash_identifier("P001", "dataset_record_0")
+        
+        assert token == anonymizer._hash_identifier("P001", "dataset_record_0")
+        assert token != anonymizer._hash_identifier("P001", "dataset_record_1")
+        assert token.startswith("anon_") and len(token) == len("anon_") + 8
+        assert int(token[5:], 16) >= 0
+    
+    def test_hashing_can_be_disabled(self):
+        """test identifiers fall back to the record id when hashing is off"""
+        anonymizer = DataAnonymizer(AnonymizationConfig(hash_identifiers=False))
+        
+        assert anonymizer._hash_identifier("P001", "dataset_record_0") == "anon_dataset_record_0"
+
+
+class TestTimestamps:
+    """test timestamp generalization"""
+    
+    def test_timestamps_keep_only_the_date(self, anonymizer):
+        """test iso strings and datetimes are cut to their date and bad text is kept"""
+        assert anonymizer._anonymize_timestamp("2024-03-05T14:30:00Z") == "2024-03-05"
+        assert anonymizer._anonymize_timestamp("2024-03-05T14:30:00") == "2024-03-05"
+        assert anonymizer._anonymize_timestamp(datetime(2024, 3, 5, 14, 30)) == "2024-03-05"
+        assert anonymizer._anonymize_timestamp("yesterday evening") == "yesterday evening"
+
+
+class TestDemographics:
+    """test the demographic field policy"""
+    
+    def test_fields_follow_their_actions(self):
+        """test identifiers are hashed, contact details dropped and other fields kept"""
+        anonymizer = DataAnonymizer(AnonymizationConfig(add_noise_to_ages=False))
+        demographics = {"patient_id": "P001", "name": "Jane Doe", "age": 54, "gender": "F",
+                        "phone": "555-123-4567", "address": "1 Main St, Springfield, IL", "weight_kg": 70}
+        
+        anonymized = anonymizer._anonymize_demographics(demographics, "r0")
+        
+        assert anonymized == {"patient_id": anonymizer._hash_identifier("P001", "r0"), "age": 54,
+                              "gender": "F", "weight_kg": 70}
+    
+    def test_age_noise_stays_in_range(self, anonymizer):
+        """test noisy ages move at most age_noise_range years and stay within 0-120"""
+        noisy = [anonymizer._add_age_noise(50) for _ in range(5000)]
+        
+        assert set(noisy) == {48, 49, 50, 51, 52}
+        assert min(anonymizer._add_age_noise(0) for _ in range(100)) == 0
+        assert max(anonymizer._add_age_noise(120) for _ in range(100)) == 120
+        assert anonymizer._add_age_noise("unknown") == "unknown"
+    
+    def test_actions_are_configurable(self):
+        """test the policy table can be changed per anonymizer and regions generalized"""
+        anonymizer = DataAnonymizer(AnonymizationConfig(preserve_geographic_region=True))
+        anonymizer.demographic_actions["gender"] = DemographicAction.DROP
+        
+        anonymized = anonymizer._anonymize_demographics({"gender": "F", "address": "1 Main St, Springfield, IL"}, "r0")
+        
+        assert anonymized == {"address": "Generalized Location: Springfield"}
+
+
+class TestAnonymizeFrame:
+    """test anonymizing flat tables column-wise"""
+    
+    def test_columns_follow_the_record_policy(self):
+        """test each column gets the same treatment as the matching record field"""
+        anonymizer = DataAnonymizer(AnonymizationConfig(age_noise_range=1))
+        frame = pd.DataFrame({"patient_id": ["P1", "P2", "P3"], "name": ["Ann Lee", "Bo Ray", "Cy Fox"],
+                              "age": [0, 50, 120], "gender": ["F", "M", "F"],
+                              "notes": ["call 555-123-4567", "stable", "call 555-123-4567"]})
+        
+        anonymized = anonymizer.anonymize_frame(frame, "ds")
+        
+        assert list(anonymized.columns) == ["patient_id", "age", "gender", "notes"]
+        assert anonymized["patient_id"].tolist() == [anonymizer._hash_identifier(p, f"ds_record_{i}")
+                                                      for i, p in enumerate(["P1", "P2", "P3"])]
+        assert anonymized["age"].between(0, 120).all()
+        assert (anonymized["age"] - frame["age"]).abs().max() <= 1
+        assert anonymized["notes"].tolist() == ["call [PHONE]", "stable", "call [PHONE]"]
+        assert anonymized["gender"].tolist() == ["F", "M", "F"]
+
+
+class TestValidation:
+    """test anonymization validation"""
+    
+    def test_remaining_pii_is_reported(self, anonymizer):
+        """test PII left in anonymized records is found by the compiled patterns"""
+        original = [{"presentation": {"chief_complaint": "chest pain, call 555-123-4567"}}]
+        leaked = [{"presentation": {"chief_complaint": "chest pain, call 555-123-4567"}}]
+        
+        clean = anonymizer.validate_anonymization(original, anonymizer.anonymize_dataset(original))
+        dirty = anonymizer.validate_anonymization(original, leaked)
+        
+        assert clean['pii_remaining'] == []
+        assert dirty['pii_remaining'] == [{'record_index': 0, 'pii_found': ["phone: ['555-123-4567']"]}]
+    
+    def test_each_pii_item_is_reported_once(self, anonymizer):
+        """test one scan groups matches by pattern and never counts a span twice"""
+        leaked = {"notes": "mail jo@example.com or MRN 12345, then jo@example.com"}
+        
+        assert anonymizer._check_remaining_pii(leaked) == [
+            "email: ['jo@example.com', 'jo@example.com']", "medical_record: ['MRN 12345']"]
+    
+    def test_remaining_pii_is_found_in_nested_text(self, anonymizer):
+        """test every text leaf is scanned, including text after an escaped character"""
+        leaked = {"notes": {"lines": ["seen today", "callback:\n555-123-4567"]}, "visits": 3}
+        
+        assert anonymizer._check_remaining_pii(leaked) == ["phone: ['555-123-4567']"]
+    
+    def test_medical_terms_must_survive(self, anonymizer):
+        """test a field that loses its key medical terms fails the preservation check"""
+        original = {"symptoms": ["Chest PAIN", "nausea"], "diagnosis": "flu"}
+        
+        assert anonymizer._check_medical_preservation(original, {"symptoms": ["chest pain"], "diagnosis": "x"})
+        assert not anonymizer._check_medical_preservation(original, {"symptoms": ["[NAME]"], "diagnosis": "flu"})
+        assert not anonymizer._check_medical_preservation(original, {"symptoms": ["chest pain"]})
+    
+    def test_pii_removals_are_counted(self, anonymizer):
+        """test removed fields and scrubbed text matches both count"""
+        original = {"presentation": {"chief_complaint": "call 555-123-4567 or MRN 12345"}}
+        
+        assert anonymizer._count_pii_removals(original, anonymizer._anonymize_single_record(original, "r0")) == 2
+    
+    def test_pii_kept_in_preserved_fields_is_not_counted(self, anonymizer):
+        """test matches in fields copied verbatim are not reported as removed"""
+        original = {"diagnosis": {"primary": "MRN 12345 follow-up", "secondary": ["seen at 555-123-4567"]}}
+        
+        assert anonymizer._count_pii_removals(original, anonymizer._anonymize_single_record(original, "r0")) == 1
+
+
+class TestAnonymizeRecords:
+    """test anonymizing lists of records"""
+    
+    def test_parallel_path_matches_serial(self, monkeypatch):
+        """test records spread across worker processes come back in order and unchanged"""
+        from medsim.data import anonymizer as anonymizer_module
+        records = [{"demographics": {"patient_id": f"P{i}", "age": 40 + i, "name": "Jane"},
+                    "presentation": {"chief_complaint": f"chest pain, call 555-123-{1000 + i}"}}
+                   for i in range(12)]
+        monkeypatch.setattr(anonymizer_module, "_RECORD_CHUNK", 3)
+        serial = DataAnonymizer(AnonymizationConfig(seed=7)).anonymize_dataset(records)
+        anonymizer = DataAnonymizer(AnonymizationConfig(seed=7, parallel_workers=2))
+        
+        monkeypatch.setattr(anonymizer_module, "_PARALLEL_MIN_RECORDS", 4)
+        
+        assert anonymizer.anonymize_dataset(records) == serial
+        assert serial[3]["presentation"]["chief_complaint"] == "chest pain, call [PHONE]"
+    
+    def test_seeded_age_noise_replays(self):
+        """test anonymizers sharing a seed add the same age noise, whether to records or one at a time"""
+        records = [{"demographics": {"age": 50}} for _ in range(200)]
+        first, second = (DataAnonymizer(AnonymizationConfig(seed=3)) for _ in range(2))
+        
+        ages = [record["demographics"]["age"] for record in first.anonymize_dataset(records)]
+        
+        assert ages == [record["demographics"]["age"] for record in second.anonymize_dataset(records)]
+        assert len(set(ages)) > 1
+        assert [first._add_age_noise(50) for _ in range(20)] == [second._add_age_noise(50) for _ in range(20)]
+    
+    def test_failed_records_are_skipped(self, anonymizer):
+        """test a record that cannot be anonymized is dropped rather than aborting the batch"""
+        records = [{"demographics": {"gender": "F"}}, {"demographics": "not a section"},
+                   {"demographics": {"gender": "M"}}]
+        
+        assert anonymizer.anonymize_dataset(records) == [records[0], records[2]]
@@ -0,0 +1,289 @@
+"""
+unit tests for clinical patterns
+"""
+
+import json
+import random
+import sys
+from datetime import datetime
+import pytest
+import numpy as np
+from medsim.data import clinical_patterns
+from medsim.data._clinical_kernels import _U_TIMES, _sample_scenarios_np
+from medsim.data.clinical_patterns import ClinicalPatterns, ClinicalTemplate
+
+
+@pytest.fixture
+def patterns():
+    # create a new clinical patterns instance
+    return ClinicalPatterns()
+
+
+class TestPatternLibrary:
+    """test the shared pattern catalog"""
+    
+    def test_library_is_shared_and_read_only(self, patterns):
+        """test that instances share one catalog that cannot be replaced entry by entry"""
+        other = ClinicalPatterns()
+        
+        assert patterns.pattern_library is other.pattern_library
+        assert 'chest_pain' in patterns.get_patterns_by_specialty('emergency_medicine')
+        with pytest.raises(TypeError):
+            patterns.pattern_library['surgery'] = {}
+        for specialty in ('cardiology', 'surgery'):
+            with pytest.raises(TypeError):
+                patterns.get_patterns_by_specialty(specialty)['new_pattern'] = {}
+    
+    def test_specialties_are_built_on_first_use(self, patterns):
+        """test asking for one specialty builds only that specialty"""
+        clinical_patterns._specialty.cache_clear()
+        clinical_patterns._pattern_index.cache_clear()
+        
+        assert patterns.get_random_pattern(specialty='neurology')['specialty'] == 'neurology'
+        assert clinical_patterns._specialty.cache_info().currsize == 1
+        assert patterns.get_random_pattern(specialty='surgery') == {}
+        assert patterns.get_patterns_by_specialty('surgery') == {}
+        assert list(patterns.pattern_library) == ['emergency_medicine', 'cardiology', 'neurology', 'respiratory',
+                                                  'rheumatology', 'hematology', 'infectious_disease']
+    
+    def test_templates_have_no_instance_dict(self):
+        """test templates keep their fields in slots where the interpreter supports it"""
+        template = ClinicalTemplate('t1', 'chest pain', 'cardiology', 'medium', 'acute chest pain', {},
+                                    [], [], [], [], [], [], [], [])
+        
+        assert template.metadata == {}
+        if sys.version_info >= (3, 10):
+            assert not hasattr(template, '__dict__')
+    
+    def test_pattern_names_are_shared(self, patterns):
+        """test scenarios reuse one interned object per pattern id and diagnosis name"""
+        pattern = patterns.get_random_pattern(specialty='respiratory')
+        
+        first = patterns.generate_scenario_from_pattern(pattern)
+        second = patterns.generate_scenario_from_pattern(pattern)
+        
+        assert first['pattern_id'] == f"respiratory_{pattern['pattern_name']}"
+        assert first['pattern_id'] is second['pattern_id']
+        assert first['diagnosis']['primary'] is sys.intern(first['diagnosis']['primary'])
+    
+    def test_difficulty_lookups_match_a_full_scan(self, patterns):
+        """test indexed lookups find every pattern and diagnosis a full scan would"""
+        scanned = [(specialty, name, data) for specialty, specialty_patterns in patterns.pattern_library.items()
+                   for name, data in specialty_patterns.items() if isinstance(data, dict)]
+        
+        hard = [(entry['pattern_name'], entry['diagnosis']['diagnosis'])
+                for entry in patterns.get_patterns_by_difficulty('hard')]
+        assert hard == [(name, diagnosis['diagnosis']) for _, name, data in scanned
+                        for diagnosis in data['diagnoses'] if diagnosis['difficulty'] == 'hard']
+        assert patterns.get_patterns_by_difficulty('impossible') == []
+        
+        for _ in range(20):
+            pattern = patterns.get_random_pattern(specialty='cardiology', difficulty='hard')
+            assert (pattern['specialty'], pattern['pattern_name']) == ('cardiology', 'acute_coronary_syndrome')
+            assert patterns.get_random_pattern()['pattern_data'] in [data for _, _, data in scanned]
+        assert patterns.get_random_pattern(specialty='rheumatology') == {}
+        assert all(clinical_patterns._PATTERN_TABLES[specialty, name].difficulties
+                   == {d['difficulty'] for d in data['diagnoses']} for specialty, name, data in scanned)
+    
+    def test_catalog_patterns_read_exactly_as_built(self, patterns):
+        """test derived tables never leak into the pattern dicts callers are handed"""
+        for specialty, builder in clinical_patterns._SPECIALTY_BUILDERS.items():
+            specialty_patterns = patterns.get_patterns_by_specialty(specialty)
+            patterns.get_random_pattern(specialty=specialty)
+            
+            assert dict(specialty_patterns) == builder()
+            json.dumps(dict(specialty_patterns))
+
+
+class TestScenarioGeneration:
+    """test drawing scenarios from patterns"""
+    
+    def test_seeded_scenarios_replay(self):
+        """test two instances seeded alike draw the same scenarios, bulk included"""
+        drawn = []
+        for patterns in (ClinicalPatterns(seed=21), ClinicalPatterns(seed=21)):
+            pattern = patterns.get_random_pattern()
+            scenario = patterns.generate_scenario_from_pattern(pattern)
+            del scenario['presentation']['arrival_time']
+            drawn.append((scenario, patterns.generate_scenarios_bulk(pattern, 50)['age'].tolist()))
+        
+        assert drawn[0] == drawn[1]
+    
+    def test_treatments_are_split_by_kind(self):
+        """test selected treatments split into medications and procedures alongside the full sequence"""
+        treatments = [{'treatment': 'Pain Medication', 'timing': 'immediate'},
+                      {'treatment': 'bedside procedure', 'timing': 'urgent'},
+                      {'treatment': 'oxygen therapy', 'timing': 'immediate'}]
+        
+        assert clinical_patterns._split_treatments(treatments) == (
+            ['Pain Medication'], ['bedside procedure'], ['Pain Medication', 'bedside procedure', 'oxygen therapy'])
+    
+    def test_cached_weights_draw_like_fresh_weights(self, patterns):
+        """test precomputed running sums select exactly what per-call weights would"""
+        pattern_data = patterns.get_patterns_by_specialty('emergency_medicine')['abdominal_pain']
+        tables = clinical_patterns._PATTERN_TABLES['emergency_medicine', 'abdominal_pain']
+        clusters, diagnoses = pattern_data['symptom_clusters'], pattern_data['diagnoses']
+        
+        rng = random.Random(3)
+        expected = [(rng.choices(clusters, weights=[c['frequency'] for c in clusters])[0],
+                     rng.choices(diagnoses, weights=[d['frequency'] for d in diagnoses])[0]['diagnosis'])
+                    for _ in range(50)]
+        patterns.seed(3)
+        drawn = [(patterns._select_symptom_cluster(clusters, tables.cluster_cum),
+                  patterns._select_diagnosis(diagnoses, 1.0, tables.diagnosis_cum)['diagnosis'])
+                 for _ in range(50)]
+        
+        assert drawn == expected
+        assert any(patterns._select_diagnosis(diagnoses, 1.2) is diagnosis for diagnosis in diagnoses)
+    
+    def test_cached_demographics_draw_like_the_template(self, patterns):
+        """test demographics from the cached pools match a draw from the raw template"""
+        template = patterns.get_patterns_by_specialty('cardiology')['heart_failure']['demographics']
+        tables = clinical_patterns._PATTERN_TABLES['cardiology', 'heart_failure']
+        
+        patterns.seed(8)
+        expected = [patterns._generate_demographics(template) for _ in range(30)]
+        patterns.seed(8)
+        
+        assert [patterns._generate_demographics(template, tables) for _ in range(30)] == expected
+        assert patterns._generate_demographics({'risk_factors': []})['risk_factors'] == []
+    
+    def test_compiled_tables_mirror_the_pattern(self, patterns):
+        """test each pattern's column arrays line up with its diagnosis and demographic dicts"""
+        pattern_data = patterns.get_patterns_by_specialty('emergency_medicine')['chest_pain']
+        tables = clinical_patterns._PATTERN_TABLES['emergency_medicine', 'chest_pain']
+        compiled = tables.compiled
+        
+        assert tables.source is pattern_data
+        assert list(compiled.diagnosis_names) == [d['diagnosis'] for d in pattern_data['diagnoses']]
+        assert np.allclose(compiled.diagnosis_cum, tables.diagnosis_cum)
+        assert list(compiled.gender_names) == ['male', 'female']
+        assert (compiled.age_lo, compiled.age_hi) == pattern_data['demographics']['age_range']
+        # STEMI is hard, so its expected mortality and stay are raised
+        assert compiled.diagnosis_mortality[0] == pytest.approx(0.075)
+        assert compiled.diagnosis_stay[0] == pytest.approx(3.6)
+    
+    def test_chief_complaint_prefers_primary_symptoms(self, patterns):
+        """test a primary symptom leads the complaint even when it is not listed first"""
+        assert patterns._generate_chief_complaint({'symptoms': ['fever', 'headache']}) == (
+            "patient complains of headache")
+        assert patterns._generate_chief_complaint({'symptoms': ['fever', 'chills']}) == (
+            "patient complains of fever")
+    
+    def test_diagnosis_catalogs_hand_out_copies(self, patterns):
+        """test scenario lists come from the shared catalogs but never alias them"""
+        codes = patterns._get_icd_codes('STEMI')
+        codes.append('E11.9')
+        
+        assert patterns._get_icd_codes('STEMI') == ['I21.9']
+        assert patterns._get_icd_codes('gout') == ['Z51.9']
+        assert patterns._generate_secondary_diagnoses('gout') == []
+        assert patterns._generate_learning_objectives('STEMI')[0] == 'recognize symptoms of acute coronary syndrome'
+        assert patterns._generate_key_actions('STEMI', [{'treatment': 'aspirin', 'timing': 'immediate'},
+                                                         {'treatment': 'ecg', 'timing': 'urgent'},
+                                                         {'treatment': 'statin'}]) == [
+            'administer aspirin immediately', 'order ecg urgently', 'consider statin']
+    
+    def test_hard_outcomes_leave_shared_templates_alone(self, patterns):
+        """test raising risk for hard diagnoses never changes the shared outcome templates"""
+        stemi = {'diagnosis': 'STEMI', 'difficulty': 'hard'}
+        unknown = {'diagnosis': 'gout', 'difficulty': 'hard'}
+        
+        for _ in range(3):
+            patterns._generate_outcome(stemi, [])
+            patterns._generate_outcome(unknown, [])
+        
+        assert clinical_patterns._base_outcome(stemi) == ('admitted', pytest.approx(3.6), pytest.approx(0.075))
+        assert clinical_patterns._base_outcome(unknown) == ('discharged', pytest.approx(1.2), pytest.approx(0.015))
+        assert clinical_patterns._base_outcome({'diagnosis': 'gout'}) == ('discharged', 1, 0.01)
+        vitals = patterns._generate_vital_signs('STEMI')
+        assert 90 <= vitals['heart_rate'] <= 120
+    
+    @pytest.mark.parametrize("sample_scenarios", [_sample_scenarios_np, clinical_patterns._sample_scenarios])
+    def test_bulk_kernels_agree(self, sample_scenarios):
+        """test the compiled bulk kernel maps uniform draws exactly as the numpy version does"""
+        base_times = np.array([30.0, 15.0, 120.0, 45.0])
+        uniforms = np.random.default_rng(5).random((200, _U_TIMES + len(base_times)))
+        args = (uniforms, 40, 80, np.array([0.6, 1.0]), np.array([0.3, 0.7, 0.9, 1.0]),
+                np.array([3.6, 2.0, 1.0, 1.2]), np.array([0.075, 0.03, 0.01, 0.015]), base_times)
+        
+        expected = _sample_scenarios_np(*args)
+        actual = sample_scenarios(*args)
+        
+        for got, want in zip(actual, expected):
+            assert np.allclose(got, want)
+    
+    def test_bulk_scenarios_follow_the_pattern(self, patterns):
+        """test bulk columns stay within the pattern and repeat for a fixed seed"""
+        pattern = patterns.get_random_pattern(specialty='emergency_medicine', difficulty='hard')
+        pattern_data = pattern['pattern_data']
+        
+        scenarios = patterns.generate_scenarios_bulk(pattern, 500, seed=11)
+        
+        low, high = pattern_data['demographics']['age_range']
+        assert ((scenarios['age'] >= low) & (scenarios['age'] <= high)).all()
+        assert set(scenarios['gender']) <= set(pattern_data['demographics']['gender_distribution'])
+        assert set(scenarios['diagnosis']) <= {d['diagnosis'] for d in pattern_data['diagnoses']}
+        assert len(scenarios['arrival_to_diagnosis']) == 500
+        assert ((scenarios['arrival_to_diagnosis'] >= 21) & (scenarios['arrival_to_diagnosis'] <= 39)).all()
+        assert (patterns.generate_scenarios_bulk(pattern, 500, seed=11)['length_of_stay']
+                == scenarios['length_of_stay']).all()
+        assert scenarios['treatments'].shape == (500, len(pattern_data['treatments']))
+        assert scenarios['treatments'].any(axis=1).all()
+        assert patterns.generate_scenarios_bulk({}, 10) == {}
+    
+    def test_bulk_tables_stay_out_of_the_catalog(self, patterns):
+        """test compiled tables live beside the catalog, and patterns from elsewhere are compiled on the fly"""
+        pattern = patterns.get_random_pattern(specialty='cardiology')
+        custom = {**pattern, 'pattern_data': dict(pattern['pattern_data'])}
+        
+        assert not any(isinstance(value, clinical_patterns.CompiledPattern)
+                       for value in pattern['pattern_data'].values())
+        assert clinical_patterns._pattern_tables(custom) is None
+        assert (patterns.generate_scenarios_bulk(custom, 50, seed=4)['diagnosis']
+                == patterns.generate_scenarios_bulk(pattern, 50, seed=4)['diagnosis']).all()
+    
+    def test_bulk_draws_cover_every_phase_time(self, patterns, monkeypatch):
+        """test the bulk draw takes one uniform column per base time, however many there are"""
+        base_times = {**clinical_patterns._BASE_TIMES, 'discharge_to_follow_up': 60}
+        monkeypatch.setattr(clinical_patterns, "_BASE_TIMES", base_times)
+        monkeypatch.setattr(clinical_patterns, "_BASE_TIME_VALUES",
+                            np.fromiter(base_times.values(), dtype=np.float64))
+        
+        scenarios = patterns.generate_scenarios_bulk(patterns.get_random_pattern(), 200, seed=6)
+        
+        assert ((scenarios['discharge_to_follow_up'] >= 42) & (scenarios['discharge_to_follow_up'] <= 78)).all()
+        assert scenarios['discharge_to_follow_up'].std() > 0
+    
+    def test_bulk_treatments_follow_their_frequencies(self, patterns):
+        """test each treatment is picked at roughly its frequency and no scenario goes untreated"""
+        pattern = patterns.get_random_pattern(specialty='neurology', difficulty='medium')
+        compiled = clinical_patterns._pattern_tables(pattern).compiled
+        
+        selected = patterns._select_treatments_bulk(compiled, 20000, np.random.default_rng(2))
+        
+        assert selected.any(axis=1).all()
+        assert np.allclose(selected.mean(axis=0), compiled.treatment_freq, atol=0.03)
+    
+    def test_parallel_generation_matches_serial(self, monkeypatch):
+        """test scenarios from worker processes match a serial run under the same seed"""
+        monkeypatch.setattr(clinical_patterns, "_SCENARIO_CHUNK", 4)
+        monkeypatch.setattr(clinical_patterns, "_PARALLEL_MIN_SCENARIOS", 8)
+        
+        serial = ClinicalPatterns(seed=5).generate_scenarios(10, specialty='cardiology')
+        parallel = ClinicalPatterns(seed=5).generate_scenarios(10, specialty='cardiology', workers=2)
+        
+        assert len(serial) == 10
+        assert all(scenario['specialty'] == 'cardiology' for scenario in serial)
+        for scenario in serial + parallel:
+            del scenario['presentation']['arrival_time']
+        assert parallel == serial
+    
+    def test_batch_shares_one_arrival_time(self, patterns):
+        """test a batch reads the clock once while single scenarios can be given their arrival time"""
+        scenarios = patterns.generate_scenarios(5)
+        arrival = datetime(2024, 1, 2, 8, 30)
+        
+        assert len({id(scenario['presentation']['arrival_time']) for scenario in scenarios}) == 1
+        assert patterns.generate_scenario_from_pattern(patterns.get_random_pattern(),
+                                                       arrival_time=arrival)['presentation']['arrival_time'] == arrival
@@ -28,4 +28,17 @@ def test_trend_data_updates(sim):
     sim._update_vital_signs()
     trends = sim.get_all_trends()
     # should have at least one vital sign trend
-    assert any(trends.values()) 
\ No newline at end of file
+    assert any(trends.values()) 
+def test_orders_without_a_dose_get_the_prepared_dose(sim):
+    sim.start_simulation()
+    sim.patient_state.age = 70
+    sim.patient_state.gender = 'female'
+    sim.physiological_engine.renal.creatinine = 1.0
+    # cockcroft-gault puts a 70 kg, 70 year old woman near 60 mL/min, so the dose drops to 60%
+    admin = sim.administer_drug('lisinopril', None, 'PO')
+    assert admin.dose == pytest.approx(6.0)
+    # a repeat order reuses the memoized calculation
+    sim.administer_drug('lisinopril', None, 'PO')
+    assert sim.pkpd_engine._cached_dose.cache_info().hits == 1
+    # an explicit dose is given as ordered
+    assert sim.administer_drug('lisinopril', 20.0, 'PO').dose == 20.0
@@ -0,0 +1,79 @@
+"""
+unit tests for intervention manager
+"""
+
+from datetime import datetime, timedelta
+from medsim.core.intervention_manager import InterventionManager, OrganSystem
+
+
+class TestInterventionManager:
+    """test intervention manager functionality"""
+    
+    def _run_orders(self, manager, current_time):
+        """order and execute a fixed batch of interventions"""
+        for name in ["antibiotic", "vasopressor", "cbc", "chest_xray"]:
+            manager.order_intervention(name)
+        executed = manager.execute_due_interventions(current_time)
+        return [(o.name, o.status, o.result, sorted(e.value for e in o.adverse_events)) for o in executed]
+    
+    def test_seeded_execution_is_reproducible(self):
+        """test that the same seed replays the same outcomes"""
+        current_time = datetime.now() + timedelta(minutes=1)
+        first = self._run_orders(InterventionManager(seed=42), current_time)
+        second = self._run_orders(InterventionManager(seed=42), current_time)
+        
+        assert len(first) == 4
+        assert first == second
+    
+    def test_reseed(self):
+        """test reseeding an existing manager"""
+        manager = InterventionManager()
+        manager.seed(7)
+        value = manager._rng.random()
+        manager.seed(7)
+        
+        assert manager._rng.random() == value
+    
+    def test_due_orders_respects_schedule_and_status(self):
+        """test that only waiting orders past their scheduled time are due"""
+        manager = InterventionManager(seed=1)
+        now = manager.order_intervention("cbc").scheduled_time
+        later = manager.order_intervention("chest_xray", delay_minutes=30)
+        cancelled = manager.order_intervention("antibiotic")
+        manager.cancel_order(cancelled.order_id)
+        
+        assert [o.name for o in manager.due_orders(now)] == ["cbc"]
+        
+        executed = manager.execute_due_interventions(later.scheduled_time)
+        
+        assert [o.name for o in executed] == ["cbc", "chest_xray"]
+        assert manager.due_orders(later.scheduled_time) == []
+    
+    def test_due_index_grows_past_initial_capacity(self):
+        """test ordering more interventions than the index preallocates"""
+        manager = InterventionManager(seed=1)
+        for _ in range(40):
+            last = manager.order_intervention("cbc")
+        
+        assert len(manager.due_orders(last.scheduled_time)) == 40
+    
+    def test_order_parameters_copy_on_override(self):
+        """test that orders share default parameters until they override them"""
+        manager = InterventionManager(seed=1)
+        definition = manager.intervention_definitions["antibiotic"]
+        default_order = manager.order_intervention("antibiotic")
+        custom_order = manager.order_intervention("antibiotic", parameters={"dose": "2g"})
+        
+        assert default_order.parameters is definition.parameters
+        assert custom_order.parameters["dose"] == "2g"
+        assert definition.parameters["dose"] == "1g"
+    
+    def test_available_interventions_by_organ(self):
+        """test cached intervention listings match the definitions"""
+        manager = InterventionManager()
+        
+        assert manager.get_available_interventions() == list(manager.intervention_definitions)
+        for organ in OrganSystem:
+            expected = [name for name, defn in manager.intervention_definitions.items()
+                        if organ in defn.target_organs]
+            assert manager.get_available_interventions(organ) == expected
@@ -0,0 +1,87 @@
+"""
+unit tests for pk/pd engine
+"""
+
+import dataclasses
+
+import pytest
+from medsim.core.drug_db import drug_db
+from medsim.core.pharmacology import PKPDEngine
+
+
+class TestPKPDEngine:
+    """test pk/pd engine functionality"""
+    
+    def test_sum_effects_paths_agree(self):
+        """test that the dict and vectorized effect sums match"""
+        targets = ["heart_rate", "blood_pressure_systolic", "heart_rate"]
+        effects = [1.0, -2.0, 3.0]
+        
+        assert PKPDEngine._sum_effects(targets, effects) == {"heart_rate": 4.0, "blood_pressure_systolic": -2.0}
+        # enough pairs to take the numpy path
+        assert PKPDEngine._sum_effects(targets * 10, effects * 10) == pytest.approx(
+            {"heart_rate": 40.0, "blood_pressure_systolic": -20.0})
+    
+    def test_sum_effects_empty(self):
+        """test summing with no active drugs"""
+        assert PKPDEngine._sum_effects([], []) == {}
+    
+    def test_apply_effect_resolves_target_once(self):
+        """test effects land on the owning organ system and the lookup is cached"""
+        class System:
+            pass
+        
+        phys = System()
+        for name in ["cardiovascular", "respiratory", "renal", "endocrine", "neurological",
+                     "gastrointestinal", "hematological", "immune", "hepatic", "musculoskeletal"]:
+            setattr(phys, name, System())
+        phys.renal.creatinine = 1.0
+        engine = PKPDEngine({})
+        
+        engine._apply_effect("creatinine", 0.5, phys)
+        engine._apply_effect("creatinine", 0.5, phys)
+        engine._apply_effect("unknown", 1.0, phys)
+        
+        assert phys.renal.creatinine == 2.0
+        assert engine._effect_systems == {(System, "creatinine"): "renal", (System, "unknown"): None}
+    
+    def test_recommended_dose_scales_by_weight_and_renal_function(self):
+        """test the standard dose is adjusted for weight and creatinine clearance"""
+        engine = PKPDEngine(drug_db)
+        
+        assert engine.recommended_dose("lisinopril", 70.0) == pytest.approx(10.0)
+        assert engine.recommended_dose("lisinopril", 140.0) == pytest.approx(20.0)
+        assert engine.recommended_dose("lisinopril", 70.0, creatinine_clearance=50.0) == pytest.approx(5.0)
+        assert engine.recommended_dose("lisinopril", 70.0, hepatic_factor=0.5) == pytest.approx(5.0)
+        # clearance above normal does not raise the dose
+        assert engine.recommended_dose("lisinopril", 70.0, creatinine_clearance=150.0) == pytest.approx(10.0)
+    
+    def test_recommended_dose_rounds_inputs_onto_cache_entries(self):
+        """test nearby weights and clearances share one cached calculation"""
+        engine = PKPDEngine(drug_db)
+        
+        dose = engine.recommended_dose("lisinopril", 80.0, creatinine_clearance=60.0)
+        
+        assert engine.recommended_dose("lisinopril", 80.4, creatinine_clearance=61.0) == dose
+        assert engine.recommended_dose("Lisinopril", 80.0, creatinine_clearance=59.0) == dose
+        assert dose == pytest.approx(10.0 * 80 / 70 * 0.6)
+        info = engine._cached_dose.cache_info()
+        assert (info.hits, info.misses) == (2, 1)
+    
+    def test_recommended_dose_unknown_drug(self):
+        """test an unknown drug raises rather than caching a dose"""
+        engine = PKPDEngine(drug_db)
+        
+        with pytest.raises(ValueError):
+            engine.recommended_dose("unknown", 70.0)
+        assert engine._cached_dose.cache_info().currsize == 0
+    
+    def test_reload_drug_db_clears_cached_doses(self):
+        """test a reloaded database is reflected instead of a stale cached dose"""
+        engine = PKPDEngine(drug_db)
+        assert engine.recommended_dose("lisinopril", 70.0) == pytest.approx(10.0)
+        
+        engine.reload_drug_db({**drug_db, "lisinopril": dataclasses.replace(drug_db["lisinopril"], dose=20.0)})
+        
+        assert engine.recommended_dose("lisinopril", 70.0) == pytest.approx(20.0)
+        assert engine._cached_dose.cache_info().currsize == 1
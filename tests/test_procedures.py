@@ -0,0 +1,57 @@
+"""
+unit tests for procedure library
+"""
+
+import pytest
+from medsim.core.procedures import ComprehensiveProcedureLibrary, ProcedureCategory, ProcedureComplexity
+
+
+@pytest.fixture
+def library():
+    # create a new procedure library instance
+    return ComprehensiveProcedureLibrary()
+
+
+class TestComprehensiveProcedureLibrary:
+    """test procedure library functionality"""
+    
+    def test_catalog_is_shared_and_read_only(self, library):
+        """test that libraries share one immutable catalog"""
+        other = ComprehensiveProcedureLibrary()
+        
+        assert library.procedures is other.procedures
+        with pytest.raises(TypeError):
+            library.procedures["new_procedure"] = None
+    
+    def test_get_all_procedures_returns_copy(self, library):
+        """test that callers get a mutable copy of the catalog"""
+        procedures = library.get_all_procedures()
+        procedures.pop("lumbar_puncture")
+        
+        assert library.get_procedure("Lumbar Puncture") is not None
+    
+    def test_category_and_complexity_lookups(self, library):
+        """test indexed lookups match a full scan of the catalog"""
+        for category in ProcedureCategory:
+            expected = [p for p in library.procedures.values() if p.category == category]
+            assert library.get_procedures_by_category(category) == expected
+        for complexity in ProcedureComplexity:
+            expected = [p for p in library.procedures.values() if p.complexity == complexity]
+            assert library.get_procedures_by_complexity(complexity) == expected
+    
+    def test_procedures_are_frozen(self, library):
+        """test that catalog entries cannot be modified in place"""
+        procedure = library.get_procedure("lumbar_puncture")
+        
+        assert isinstance(procedure.indications, tuple)
+        with pytest.raises(AttributeError):
+            procedure.cost = 0.0
+    
+    def test_search_is_case_insensitive_and_cached(self, library):
+        """test repeated searches reuse cached results"""
+        first = library.search_procedures("Meningitis")
+        second = library.search_procedures("meningitis")
+        
+        assert [p.name for p in first] == ["Lumbar Puncture"]
+        assert first == second
+        assert library._cached_search.cache_info().hits == 1
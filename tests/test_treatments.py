@@ -0,0 +1,322 @@
+"""
+unit tests for treatment engine
+"""
+
+import pytest
+import numpy as np
+from datetime import datetime, timedelta
+from medsim.core import treatments
+from medsim.core._treatment_kernels import _decay_levels_np, _filter_indices_np
+from medsim.core.treatments import EnhancedTreatmentEngine, DoseRegimen, DrugCategory, InteractionSeverity, Route
+
+
+@pytest.fixture
+def engine():
+    # create a new treatment engine instance
+    return EnhancedTreatmentEngine()
+
+
+class TestDoseRegimen:
+    """test dose regimen functionality"""
+    
+    def test_to_dict_matches_legacy_shape(self):
+        """test converting a regimen back to the legacy dict shape"""
+        regimen = DoseRegimen("0.4 mg", frequency="every 5 minutes", maximum="3 doses")
+        
+        assert regimen.to_dict() == {
+            "dose": "0.4 mg",
+            "frequency": "every 5 minutes",
+            "max": "3 doses"
+        }
+    
+    def test_drug_dosing_uses_regimens(self, engine):
+        """test that drug dosing info is stored as regimens"""
+        regimen = engine.drugs["heparin"].dosing_info["iv"]
+        
+        assert isinstance(regimen, DoseRegimen)
+        assert regimen.dose == "80 units/kg bolus"
+        assert regimen.maintenance == "18 units/kg/hour"
+
+
+class TestEnhancedTreatmentEngine:
+    """test treatment engine functionality"""
+    
+    def test_drug_lookup_ignores_case(self, engine):
+        """test looking up and administering drugs with mixed-case names"""
+        assert engine.get_drug("Aspirin") is engine.drugs["aspirin"]
+        assert engine.get_drug("unknown") is None
+        
+        result = engine.administer_drug("P001", "Aspirin", 325, "oral")
+        
+        assert result.startswith("✓")
+        assert engine.get_active_treatments("P001")[0].drug_name == "aspirin"
+    
+    def test_check_contraindications(self, engine):
+        """test matching patient conditions against drug contraindications"""
+        conditions = ["Peptic Ulcer Disease", "hypertension"]
+        
+        assert engine.check_contraindications("Aspirin", conditions) == ["Peptic Ulcer Disease"]
+        assert engine.check_contraindications("unknown", conditions) == []
+        assert "peptic ulcer disease" in engine.get_drug("aspirin").contraindication_set
+    
+    def test_lookups_do_not_create_patient_entries(self, engine):
+        """test reading an unknown patient leaves treatment state untouched"""
+        assert engine.get_active_treatments("P404") == []
+        assert engine.get_drug_levels("P404") == []
+        
+        assert "P404" not in engine.active_treatments
+        assert "P404" not in engine.drug_levels
+    
+    def test_administration_time_is_formatted_on_demand(self, engine):
+        """test records keep an epoch timestamp that formats back to iso"""
+        given = datetime(2024, 1, 2, 3, 4, 5)
+        engine.administer_drug("P001", "aspirin", 325, "oral", timestamp=given)
+        treatment = engine.get_active_treatments("P001")[0]
+        
+        assert treatment.administered_at_ts == given.timestamp()
+        assert treatment.administered_at == "2024-01-02T03:04:05"
+    
+    def test_administer_drugs_batch(self, engine):
+        """test a batch of orders shares one timestamp and reports each result"""
+        given = datetime(2024, 1, 2, 3, 4, 5)
+        results = engine.administer_drugs_batch(
+            "P001", [("aspirin", 325, "oral"), ("unknown", 1, "iv"), ("heparin", 5000, "iv")],
+            timestamp=given)
+        treatments = engine.get_active_treatments("P001")
+        
+        assert [r.startswith("✓") for r in results] == [True, False, True]
+        assert [t.drug_name for t in treatments] == ["aspirin", "heparin"]
+        assert {t.administered_at_ts for t in treatments} == {given.timestamp()}
+    
+    def test_seeded_levels_are_reproducible(self):
+        """test the same seed replays the same simulated levels, single or batched"""
+        levels = []
+        for _ in range(2):
+            engine = EnhancedTreatmentEngine(seed=42)
+            engine.administer_drug("P001", "heparin", 5000, "iv")
+            engine.administer_drugs_batch("P002", [("metoprolol", 25, "oral"), ("aspirin", 81, "oral")])
+            levels.append([(l.current_level, l.clearance_rate)
+                           for pid in ("P001", "P002") for l in engine.get_drug_levels(pid)])
+        
+        assert len(levels[0]) == 2
+        assert levels[0] == levels[1]
+        assert 0.5 <= levels[0][0][1] <= 2.0
+    
+    def test_catalogs_are_read_only(self, engine):
+        """test that drug and interaction catalogs cannot be mutated in place"""
+        with pytest.raises(TypeError):
+            engine.drugs["new_drug"] = None
+        with pytest.raises(TypeError):
+            engine.drugs["heparin"].dosing_info["po"] = None
+        
+        assert isinstance(engine.interactions, tuple)
+        assert engine.get_available_drugs() is engine.drugs
+        with pytest.raises(TypeError):
+            engine.get_available_protocols()["new_protocol"] = None
+        
+        drugs = engine.get_drugs_copy()
+        drugs["new_drug"] = None
+        assert "new_drug" not in engine.get_available_drugs()
+    
+    def test_catalogs_are_shared(self, engine):
+        """test that engines share the catalogs loaded from package data"""
+        other = EnhancedTreatmentEngine()
+        
+        assert other.drugs is engine.drugs
+        assert other.interactions is engine.interactions
+        assert other.protocols is engine.protocols
+        assert engine.drugs["metoprolol"].routes == (Route.ORAL, Route.INTRAVENOUS)
+        assert engine.drugs["metoprolol"].therapeutic_range == (50, 200)
+    
+    def test_filter_drugs(self, engine):
+        """test filtering drugs by category and route"""
+        iv_anticoagulants = engine.filter_drugs(DrugCategory.ANTICOAGULANT, Route.INTRAVENOUS)
+        
+        assert "heparin" in iv_anticoagulants
+        assert all(drug.category == DrugCategory.ANTICOAGULANT for drug in iv_anticoagulants.values())
+        assert engine.filter_drugs() == dict(engine.drugs)
+    
+    @pytest.mark.parametrize("filter_indices", [_filter_indices_np, treatments._filter_indices])
+    def test_columnar_filter_matches_scan(self, engine, filter_indices):
+        """test the columnar filter used for large formularies against a plain scan"""
+        for category in [None, DrugCategory.ANALGESIC, DrugCategory.CARDIOVASCULAR]:
+            for route in [None, Route.ORAL, Route.INTRAVENOUS]:
+                indices = filter_indices(engine._category_ids, engine._route_masks,
+                                         treatments._CATEGORY_IDS[category] if category else -1,
+                                         treatments._ROUTE_BITS[route] if route else 0)
+                
+                assert [engine._drug_names[i] for i in indices] == list(engine.filter_drugs(category, route))
+    
+    def test_string_doses_are_parsed_once(self, engine):
+        """test string doses are stored as a numeric value and unit"""
+        engine.administer_drug("P001", "aspirin", "325 mg", "oral")
+        engine.administer_drug("P001", "aspirin", 81, "oral")
+        
+        assert [(t.dose, t.dose_unit) for t in engine.get_active_treatments("P001")] == [(325.0, "mg"), (81.0, "")]
+        assert engine.administer_drug("P001", "aspirin", "one tablet", "oral").startswith("Error")
+    
+    def test_contraindicated_drugs(self, engine):
+        """test screening the whole catalog against a patient's conditions"""
+        conditions = ["Active Bleeding", "hypoglycemia", "hypertension"]
+        
+        assert engine.condition_mask(["hypertension"]) == 0
+        assert engine.contraindicated_drugs(["hypertension"]) == []
+        assert engine.contraindicated_drugs(conditions) == [
+            name for name in engine.drugs if engine.check_contraindications(name, conditions)]
+        assert "heparin" in engine.contraindicated_drugs(conditions)
+    
+    def test_interaction_lookup(self, engine):
+        """test interactions are found from either drug in the pair"""
+        engine.administer_drug("P001", "heparin", 5000, "iv")
+        engine.administer_drug("P001", "heparin", 5000, "iv")
+        result = engine.administer_drug("P001", "aspirin", 325, "oral")
+        interactions = engine.get_active_treatments("P001")[-1].interactions
+        
+        assert "interactions detected" in result
+        assert [(i.drug1, i.drug2) for i in interactions] == [("aspirin", "heparin")]
+        assert interactions[0].severity == InteractionSeverity.MODERATE < InteractionSeverity.SEVERE
+        assert {(i.drug1, i.drug2) for i in engine.get_drug_interactions("metoprolol")} == {
+            ("aspirin", "metoprolol"), ("morphine", "metoprolol")}
+        assert engine.get_drug_interactions("Metoprolol") == engine.get_drug_interactions("metoprolol")
+        assert engine.get_drug_interactions("unknown") == []
+    
+    def test_update_drug_levels_decays_by_half_life(self, engine):
+        """test monitored drug levels halve after one half-life"""
+        start = datetime(2024, 1, 1, 12, 0, 0)
+        engine.administer_drug("P001", "heparin", 5000, "iv", timestamp=start)
+        level = engine.get_drug_levels("P001")[0]
+        initial = level.current_level
+        
+        updates = engine.update_drug_levels("P001", start + timedelta(hours=level.half_life))
+        
+        assert len(updates) == 1
+        assert level.current_level == pytest.approx(initial / 2)
+        assert level.is_toxic is False
+        assert level.is_therapeutic == (level.therapeutic_range[0] <= level.current_level <= level.therapeutic_range[1])
+        assert engine.update_drug_levels("P404") == []
+    
+    def test_tick_drives_decay_without_wall_clock(self, engine):
+        """test the simulation clock advances levels in float hours"""
+        start = datetime(2024, 1, 1, 12, 0, 0)
+        engine.administer_drug("P001", "heparin", 5000, "iv", timestamp=start)
+        level = engine.get_drug_levels("P001")[0]
+        initial = level.current_level
+        
+        engine._now_hours = start.timestamp() / 3600
+        engine.tick(level.half_life)
+        engine.update_drug_levels("P001")
+        
+        assert level.current_level == pytest.approx(initial / 2)
+        assert level.timestamp == start + timedelta(hours=level.half_life)
+    
+    def test_repeat_doses_replace_current_level(self, engine):
+        """test only the latest level per drug is kept for monitoring"""
+        for _ in range(3):
+            engine.administer_drug("P001", "heparin", 5000, "iv")
+        engine.administer_drug("P001", "metoprolol", 25, "oral")
+        
+        assert [level.drug_name for level in engine.get_drug_levels("P001")] == ["heparin", "metoprolol"]
+        assert len(engine.get_active_treatments("P001")) == 4
+    
+    def test_decay_kernel_matches_numpy(self):
+        """test the jit decay kernel against the numpy implementation"""
+        levels = np.array([4.0, 10.0, 1.0, 0.5])
+        half_lives = np.array([1.5, 0.0, 4.0, 2.0])
+        elapsed = np.array([1.0, 3.0, 0.5, 0.0])
+        lows = np.full(4, 0.8)
+        highs = np.full(4, 3.0)
+        
+        expected = _decay_levels_np(levels, half_lives, elapsed, lows, highs)
+        actual = treatments._decay_levels(levels, half_lives, elapsed, lows, highs)
+        
+        assert np.allclose(actual[0], expected[0])
+        assert (actual[1] == expected[1]).all()
+        assert (actual[2] == expected[2]).all()
+    
+    def test_small_decay_loop_matches_kernel(self, monkeypatch):
+        """test the per-level python decay agrees with the batched kernel path"""
+        def make_levels():
+            return [treatments.DrugLevel(f"drug{i}", 4.0 + i, (2.0, 6.0), "mg/L", 0.0, half_life=float(i % 3))
+                    for i in range(6)]
+        small, batched = make_levels(), make_levels()
+        
+        expected = EnhancedTreatmentEngine._decay_drug_levels(small, 2.5)
+        monkeypatch.setattr(treatments, "_VECTORIZE_MIN_LEVELS", 0)
+        actual = EnhancedTreatmentEngine._decay_drug_levels(batched, 2.5)
+        
+        assert [i for i, _ in actual] == [i for i, _ in expected] == [1, 2, 4, 5]
+        for a, b in zip(small, batched):
+            assert a.current_level == pytest.approx(b.current_level)
+            assert (a.is_therapeutic, a.is_toxic, a.timestamp_hours) == (b.is_therapeutic, b.is_toxic,
+                                                                         b.timestamp_hours)
+    
+    def test_warm_caches_is_explicit(self, engine):
+        """test kernels are compiled on request rather than by every constructor"""
+        engine.warm_caches()
+        
+        assert engine.update_all_drug_levels() == {}
+    
+    def test_update_all_drug_levels(self, engine):
+        """test batch updates report changes per patient"""
+        start = datetime(2024, 1, 1, 12, 0, 0)
+        engine.administer_drug("P001", "heparin", 5000, "iv", timestamp=start)
+        engine.administer_drug("P002", "heparin", 5000, "iv", timestamp=start)
+        
+        updates = engine.update_all_drug_levels(start + timedelta(hours=2))
+        
+        assert sorted(updates) == ["P001", "P002"]
+        assert all(len(messages) == 1 for messages in updates.values())
+    
+    def test_update_all_drug_levels_matches_per_patient(self):
+        """test the single batched sweep agrees with updating each patient alone"""
+        start = datetime(2024, 1, 1, 12, 0, 0)
+        batched, single = EnhancedTreatmentEngine(seed=3), EnhancedTreatmentEngine(seed=3)
+        for engine in (batched, single):
+            for patient_id in ("P001", "P002", "P003"):
+                engine.administer_drug(patient_id, "heparin", 5000, "iv", timestamp=start)
+                engine.administer_drug(patient_id, "metoprolol", 25, "oral", timestamp=start)
+        later = start + timedelta(hours=3)
+        
+        updates = batched.update_all_drug_levels(later)
+        
+        assert updates == {p: single.update_drug_levels(p, later) for p in ("P001", "P002", "P003")}
+        for patient_id in updates:
+            assert batched.get_drug_levels(patient_id) == single.get_drug_levels(patient_id)
+    
+    def test_treatments_are_stored_by_column(self, engine):
+        """test administrations land in per-field columns with record views"""
+        engine.administer_drug("P001", "aspirin", 325, "oral")
+        engine.administer_drug("P001", "morphine", 4, "iv")
+        columns = engine.active_treatments["P001"]
+        
+        assert len(columns) == 2
+        assert columns.drug_name == ["aspirin", "morphine"]
+        assert columns.row(1) == engine.get_active_treatments("P001")[1]
+    
+    def test_route_validation(self, engine):
+        """test route names are matched case-insensitively and unknown routes are rejected"""
+        assert engine.administer_drug("P001", "aspirin", 325, "ORAL").startswith("✓")
+        assert engine.administer_drug("P001", "aspirin", 325, "iv").startswith("Error: Route")
+        assert engine.administer_drug("P001", "aspirin", 325, "nasal").startswith("Error: Unknown route")
+    
+    def test_critical_alerts_refresh_after_level_changes(self, engine):
+        """test cached alerts are recomputed once drug levels change"""
+        start = datetime(2024, 1, 1, 12, 0, 0)
+        engine.administer_drug("P001", "heparin", 5000, "iv", timestamp=start)
+        
+        assert engine.get_critical_alerts() == []
+        assert engine.get_critical_alerts() == []
+        
+        # after many half-lives the level is far below the therapeutic range
+        engine.update_drug_levels("P001", start + timedelta(days=2))
+        alerts = engine.get_critical_alerts()
+        
+        assert [(a['patient_id'], a['drug_name'], a['status']) for a in alerts] == [
+            ("P001", "heparin", "subtherapeutic")]
+    
+    def test_search_drugs_matches_name_or_category(self, engine):
+        """test searching by partial drug name or partial category"""
+        assert list(engine.search_drugs("ASPIR")) == ["aspirin"]
+        assert set(engine.search_drugs("anticoag")) == {
+            name for name, drug in engine.drugs.items() if drug.category == DrugCategory.ANTICOAGULANT}
+        assert engine.search_drugs("zzz") == {}